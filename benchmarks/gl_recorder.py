@@ -0,0 +1,85 @@
+import sys
+import types
+from collections import Counter
+
+# Nomes de funções cujo retorno é usado pelo código (ids de buffers/texturas e status)
+_RETURN_VALUES = {
+    "glGenBuffers": 1,
+    "glGenTextures": 1,
+    "glGenFramebuffers": 1,
+    "glGenLists": 1,
+}
+
+
+class GLCallRecorder:
+    """
+    Substitui OpenGL.GL / OpenGL.GLU por módulos falsos que só contam as chamadas.
+    Os nomes e constantes são copiados do PyOpenGL real, então `from OpenGL.GL import *`
+    continua funcionando; nenhuma chamada chega ao driver e não é preciso contexto OpenGL.
+
+    Precisa ser instalado ANTES de importar qualquer módulo de src/ que use OpenGL.
+    """
+
+    def __init__(self):
+        self.calls = Counter()
+
+    def reset(self):
+        self.calls.clear()
+
+    @property
+    def total_calls(self):
+        return sum(self.calls.values())
+
+    def _make_function(self, name):
+        calls = self.calls
+        result = _RETURN_VALUES.get(name)
+        if name == "glCheckFramebufferStatus":
+            result = _real_constant("GL_FRAMEBUFFER_COMPLETE")
+
+        def recorded(*args, **kwargs):
+            calls[name] += 1
+            return result
+
+        recorded.__name__ = name
+        return recorded
+
+    def _build_module(self, module_name, real):
+        fake = types.ModuleType(module_name)
+        names = [n for n in dir(real) if not n.startswith("_")] if real else []
+        for name in names:
+            value = getattr(real, name)
+            if name.startswith(("gl", "glu")) and callable(value):
+                value = self._make_function(name)
+            setattr(fake, name, value)
+        fake.__all__ = names
+        return fake
+
+    def install(self):
+        """Registra os módulos falsos em sys.modules."""
+        module_names = ("OpenGL.GL", "OpenGL.GLU")
+        if all(getattr(sys.modules.get(name), "_gl_recorder", None) is self for name in module_names):
+            return
+        # Importa os módulos reais antes de trocar qualquer um (o GLU real importa o GL)
+        real_modules = {name: _import_real(name) for name in module_names}
+        for module_name, real in real_modules.items():
+            fake = self._build_module(module_name, real)
+            fake._gl_recorder = self
+            sys.modules[module_name] = fake
+            # `import OpenGL.GL as gl` busca o atributo no pacote pai
+            package_name, _, attr = module_name.rpartition(".")
+            if package_name in sys.modules:
+                setattr(sys.modules[package_name], attr, fake)
+
+
+def _import_real(module_name):
+    try:
+        __import__(module_name)
+        return sys.modules[module_name]
+    except Exception as e:
+        print(f"Aviso: não foi possível importar {module_name} real ({e})")
+        return None
+
+
+def _real_constant(name):
+    real = sys.modules.get("OpenGL.GL")
+    return getattr(real, name, 0x8CD5)
@@ -0,0 +1,340 @@
+"""
+Benchmarks do loop de jogo (simulação, colisão e envio de desenho), sem janela e sem contexto OpenGL.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --quick --output resultado.json
+    python -m benchmarks.run_benchmarks --compare benchmarks/results/anterior.json
+
+Os resultados são gravados em JSON para que execuções diferentes possam ser comparadas.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from benchmarks.gl_recorder import GLCallRecorder
+
+# O OpenGL precisa ser trocado pelo gravador antes de importar qualquer módulo do jogo
+gl_recorder = GLCallRecorder()
+gl_recorder.install()
+
+from src.game.entities.road import SCREEN_HEIGHT, LANE_COUNT_PER_DIRECTION  # noqa: E402
+from src.game.managers.lane_manager import get_safe_lane_for_powerup, get_safe_lanes_for_obstacles  # noqa: E402
+from src.game.entity_store import ENEMY_KINDS, KIND_ENEMY_UP, KIND_ENEMY_DOWN, KIND_HOLE, KIND_OIL_STAIN, \
+    KIND_BEER, KIND_INVULNERABILITY, KIND_SLOWMOTION  # noqa: E402
+from src.game.simulation import GameSimulation, SAFETY_DISTANCE  # noqa: E402
+from src.graphics.renderer import draw_game_elements  # noqa: E402
+from src.graphics.sprite_batch import TextureRegion  # noqa: E402
+
+ENTITY_COUNTS = (10, 100, 1000)
+QUICK_ENTITY_COUNTS = (10, 100)
+SIM_TICKS_PER_ROUND = 60  # Meio segundo de jogo a 120 Hz
+CRASHED_FRACTION = 0.1  # Fração de inimigos já crashados no cenário de propagação
+SEED = 1234
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def measure(fn, min_time=0.5, min_runs=3, setup=None):
+    """
+    Executa fn() repetidamente por pelo menos min_time segundos (e min_runs vezes).
+    fn retorna quantas operações executou; o resultado é a melhor taxa (ops/s) entre as rodadas,
+    que é a menos afetada por ruído do sistema. Se setup for dado, ele roda fora da medição
+    e o seu retorno é passado para fn.
+    """
+    rates = []
+    total_time = 0.0
+    while len(rates) < min_runs or total_time < min_time:
+        args = (setup(),) if setup else ()
+        start = time.perf_counter()
+        ops = fn(*args)
+        elapsed = time.perf_counter() - start
+        total_time += elapsed
+        if elapsed > 0:
+            rates.append(ops / elapsed)
+    rates.sort()
+    return {"best_per_sec": rates[-1], "median_per_sec": rates[len(rates) // 2], "runs": len(rates)}
+
+
+# --- Cenários ---
+
+def _fake_sprites():
+    """Sprites falsos: as entidades só precisam de um id de textura e um retângulo UV."""
+    names = ["truck", "truck_dead", "truck_armored", "truck_hole", "truck_oil", "truck_hole_and_oil", "hole", "oil",
+             "beer", "invulnerability", "slowmotion", "police_1", "police_2", "police_dead"]
+    for color in ("black", "green", "red", "yellow"):
+        names += [f"up_{color}", f"up_{color}_dead", f"down_{color}", f"down_{color}_dead"]
+    return {name: TextureRegion(1, (0.0, 1.0, 1.0, 0.0), 64, 64) for name in names}
+
+
+def _place(entity, y):
+    entity.y = y
+    entity.save_previous_position()
+    return entity
+
+
+def build_simulation(enemy_count, seed=SEED):
+    """
+    Cria uma simulação com enemy_count inimigos espalhados pela pista e um décimo disso de cada
+    obstáculo / item. O caminhão fica invulnerável para a partida não terminar durante a medição.
+    """
+    rng = random.Random(seed)
+    sprites = _fake_sprites()
+    sim = GameSimulation(sprites, rng=rng)
+    sim.truck.invulnerable = True
+    sim.truck.invulnerable_duration = float("inf")
+
+    lane_count = LANE_COUNT_PER_DIRECTION * 2
+    spread = SCREEN_HEIGHT * 2
+
+    for i in range(enemy_count):
+        y = SCREEN_HEIGHT * 0.3 + rng.uniform(0, spread)
+        if i % 2:
+            _place(sim._spawn(KIND_ENEMY_UP, sprites["up_red"], sprites["up_red_dead"], rng=rng), y)
+        else:
+            _place(sim._spawn(KIND_ENEMY_DOWN, sprites["down_red"], sprites["down_red_dead"], rng=rng), y)
+
+    item_count = max(1, enemy_count // 10)
+    item_kinds = ((KIND_HOLE, "hole"), (KIND_OIL_STAIN, "oil"), (KIND_BEER, "beer"),
+                  (KIND_INVULNERABILITY, "invulnerability"), (KIND_SLOWMOTION, "slowmotion"))
+    for kind, sprite_name in item_kinds:
+        for _ in range(item_count):
+            entity = sim._spawn(kind, sprites[sprite_name], lane_index=rng.randrange(lane_count))
+            _place(entity, SCREEN_HEIGHT * 0.3 + rng.uniform(0, spread))
+
+    for _ in range(item_count):
+        sim._add_score_indicator(rng.uniform(100, 500), rng.uniform(100, 500), 100)
+    return sim
+
+
+# --- Benchmarks ---
+
+def bench_simulation(counts, min_time):
+    results = []
+    for count in counts:
+        last_round = {}
+
+        def run(sim):
+            for _ in range(SIM_TICKS_PER_ROUND):
+                sim.step()
+            last_round["sim"] = sim
+            return SIM_TICKS_PER_ROUND
+
+        # Cada rodada parte de um cenário novo (montado fora da medição) para a contagem de entidades
+        # não se afastar muito do valor pedido
+        stats = measure(run, min_time, min_runs=1, setup=lambda: build_simulation(count))
+        results.append({"name": "simulation_step", "entities": count, "ticks_per_sec": stats["best_per_sec"],
+                        **stats, "pools": last_round["sim"].pool_stats(),
+                        "stages": last_round["sim"].pipeline.stage_timings()})
+    return results
+
+
+def bench_truck_collision(counts, min_time):
+    results = []
+    for count in counts:
+        sim = build_simulation(count)
+        truck = sim.truck
+        store = sim.store
+
+        def run():
+            # Como em GameSimulation.step: a grade espacial é atualizada (os inimigos andaram) e só
+            # os inimigos que encostam no sprite do caminhão passam pelo teste exato
+            store.version += 1
+            for enemy in store.overlapping(ENEMY_KINDS, truck.x, truck.y, truck.width, truck.height):
+                truck.check_collision(enemy)
+            return 1
+
+        stats = measure(run, min_time)
+        results.append({"name": "truck_check_collision", "entities": count, "frames_per_sec": stats["best_per_sec"],
+                        **stats})
+    return results
+
+
+def bench_crash_propagation(counts, min_time):
+    results = []
+    for count in counts:
+        sim = build_simulation(count)
+        all_enemies = sim.all_enemies
+        crashed_count = max(1, int(len(all_enemies) * CRASHED_FRACTION))
+
+        def run():
+            for index, enemy in enumerate(all_enemies):
+                enemy.crashed = index < crashed_count
+            sim._propagate_crashes()
+            return 1
+
+        stats = measure(run, min_time)
+        results.append({"name": "crash_propagation", "entities": count, "crashed": crashed_count,
+                        "frames_per_sec": stats["best_per_sec"], **stats})
+    return results
+
+
+def bench_lane_selection(counts, min_time):
+    results = []
+    rng = random.Random(SEED)
+    for count in counts:
+        sim = build_simulation(count)
+        store = sim.store
+        powerups = sim.invulnerability_powerups + sim.slowmotion_powerups + sim.beer_collectibles
+        obstacles = sim.oil_stains + sim.holes
+
+        # Cada chamada invalida o índice de ocupação, como acontece quando as entidades andam entre dois spawns
+        def run_powerup():
+            store.version += 1
+            get_safe_lane_for_powerup(store.lane_occupancy(), KIND_INVULNERABILITY, LANE_COUNT_PER_DIRECTION,
+                                      SCREEN_HEIGHT, SAFETY_DISTANCE, rng=rng)
+            return 1
+
+        def run_obstacles():
+            store.version += 1
+            get_safe_lanes_for_obstacles(store.lane_occupancy(), KIND_OIL_STAIN, LANE_COUNT_PER_DIRECTION,
+                                         SCREEN_HEIGHT, SAFETY_DISTANCE)
+            return 1
+
+        for name, fn, objects in (("lane_select_powerup", run_powerup, powerups),
+                                  ("lane_select_obstacles", run_obstacles, obstacles)):
+            stats = measure(fn, min_time)
+            results.append({"name": name, "entities": count, "objects": len(objects),
+                            "calls_per_sec": stats["best_per_sec"], **stats})
+    return results
+
+
+def bench_render_submission(counts, min_time):
+    results = []
+    for count in counts:
+        sim = build_simulation(count)
+        for _ in range(3):
+            sim.step()
+
+        def draw():
+            draw_game_elements((0, 0, 800, 600), 600, SCREEN_HEIGHT, sim.scroll_pos, sim.holes, sim.oil_stains,
+                               sim.beer_collectibles, sim.score_indicators, sim.invulnerability_powerups, sim.truck,
+                               sim.enemies_up, sim.enemies_down, sim.police_car, sim.slowmotion_powerups, 0.5)
+
+        # Um frame de aquecimento (criação dos VBOs) e um frame contado
+        draw()
+        gl_recorder.reset()
+        draw()
+        calls = dict(gl_recorder.calls)
+
+        def run():
+            draw()
+            return 1
+
+        stats = measure(run, min_time)
+        drawn = (len(sim.enemies_up) + len(sim.enemies_down) + len(sim.holes) + len(sim.oil_stains) +
+                 len(sim.beer_collectibles) + len(sim.invulnerability_powerups) + len(sim.slowmotion_powerups) + 1)
+        results.append({"name": "draw_game_elements", "entities": count, "sprites": drawn,
+                        "gl_calls_per_frame": sum(calls.values()),
+                        "draw_calls_per_frame": calls.get("glDrawArrays", 0) + calls.get("glBegin", 0),
+                        "gl_calls_by_name": dict(sorted(calls.items(), key=lambda item: -item[1])),
+                        "frames_per_sec": stats["best_per_sec"], **stats})
+    return results
+
+
+BENCHMARKS = {
+    "simulation": bench_simulation,
+    "collision": bench_truck_collision,
+    "crash_propagation": bench_crash_propagation,
+    "lane_selection": bench_lane_selection,
+    "render": bench_render_submission,
+}
+
+
+# --- Relatório ---
+
+def _git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL,
+                                       text=True).strip()
+    except Exception:
+        return None
+
+
+def _headline(result):
+    """Métrica principal de cada resultado (usada no resumo e na comparação)."""
+    for key in ("ticks_per_sec", "frames_per_sec", "checks_per_sec", "calls_per_sec"):
+        if result.get(key):
+            return key, result[key]
+    return "best_per_sec", result["best_per_sec"]
+
+
+def _result_key(result):
+    return result["name"], result["entities"]
+
+
+def print_summary(results, baseline=None):
+    baseline_map = {_result_key(r): r for r in baseline["results"]} if baseline else {}
+    for result in results:
+        metric, value = _headline(result)
+        line = f"{result['name']:<24} n={result['entities']:<5} {metric}={value:,.1f}"
+        if "gl_calls_per_frame" in result:
+            line += f"  gl_calls={result['gl_calls_per_frame']} draw_calls={result['draw_calls_per_frame']}"
+        old = baseline_map.get(_result_key(result))
+        if old:
+            old_metric, old_value = _headline(old)
+            if old_metric == metric and old_value:
+                line += f"  ({value / old_value:.2f}x vs base)"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks do Beer Truck (sem janela / sem OpenGL)")
+    parser.add_argument("--only", choices=sorted(BENCHMARKS), action="append",
+                        help="Roda apenas o benchmark indicado (pode repetir)")
+    parser.add_argument("--counts", type=int, nargs="+", help="Quantidades de inimigos (padrão: 10 100 1000)")
+    parser.add_argument("--quick", action="store_true", help="Execução curta, sem o cenário de 1000 inimigos")
+    parser.add_argument("--min-time", type=float, default=None, help="Tempo mínimo de medição por cenário (s)")
+    parser.add_argument("--output", help="Arquivo JSON de saída (padrão: benchmarks/results/<data>.json)")
+    parser.add_argument("--compare", help="JSON de uma execução anterior para comparar")
+    args = parser.parse_args(argv)
+
+    counts = args.counts or (QUICK_ENTITY_COUNTS if args.quick else ENTITY_COUNTS)
+    min_time = args.min_time if args.min_time is not None else (0.1 if args.quick else 0.5)
+    selected = args.only or list(BENCHMARKS)
+
+    # As entidades imprimem mensagens de spawn; silencia durante as medições
+    results = []
+    real_stdout = sys.stdout
+    with open(os.devnull, "w") as devnull:
+        for name in selected:
+            real_stdout.write(f"Rodando {name}...\n")
+            sys.stdout = devnull
+            try:
+                results += BENCHMARKS[name](counts, min_time)
+            finally:
+                sys.stdout = real_stdout
+
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "entity_counts": list(counts),
+        "min_time": min_time,
+        "results": results,
+    }
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, datetime.now().strftime("%Y%m%d_%H%M%S") + ".json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_summary(results, baseline)
+    print(f"Resultados salvos em {output}")
+
+
+if __name__ == "__main__":
+    main()
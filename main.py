@@ -1,35 +1,27 @@
-import math
-import random
+import os
+import sys
 import time
 
 import glfw
 import pygame
 from OpenGL.GL import *
-from OpenGL.GLUT import *
-from OpenGL.GLUT import GLUT_BITMAP_HELVETICA_18
 
-import src.game.entities.police as police
 import src.game.entities.road as road
 import src.game.managers.audio_manager as audio_manager
-from src.game.entities.beer_collectible import BeerCollectible
-from src.game.entities.enemy import Enemy, EnemyDown
-from src.game.entities.hole import Hole
-from src.game.entities.invulnerability import InvulnerabilityPowerUp
-from src.game.entities.oil_stain import OilStain
-from src.game.entities.road import SCREEN_WIDTH, SCREEN_HEIGHT, GAME_WIDTH, PANEL_WIDTH, COLOR_PANEL, \
-    PLAYER_SPEED, \
-    LANE_COUNT_PER_DIRECTION
-from src.game.entities.slowmotion import SlowMotionEffect, SlowMotionPowerUp
-from src.game.entities.truck import Truck
+from src.game.entities.road import SCREEN_WIDTH, SCREEN_HEIGHT, GAME_WIDTH, PANEL_WIDTH, COLOR_PANEL
+from src.game.game_clock import GameClock
 from src.game.managers.difficulty_manager import DifficultyManager
 from src.game.managers.high_score_manager import HighScoreManager
-from src.game.managers.lane_manager import get_safe_lanes_for_obstacles, get_safe_lane_for_powerup
+from src.game.managers.input_manager import GlfwInput
+from src.game.managers.sound_manifest import MUSIC_BACKGROUND, SOUND_HORN, get_sound
 from src.game.managers.viewport_manager import setup_menu_viewport_and_convert_mouse, setup_panel_viewport
-from src.graphics.renderer import draw_game_elements, draw_panel_stats, draw_text
+from src.graphics.renderer import draw_game_elements
+from src.graphics.texture_atlas import TextureAtlas
 from src.ui.menu import MenuState, draw_start_menu, draw_instructions_screen, draw_game_over_menu, \
     draw_name_input_screen, draw_pause_menu
-from src.ui.score_indicator import ScoreIndicator
-from src.utils.texture_loader import load_texture
+from src.game.simulation import GameSimulation, SIMULATION_HZ
+from src.ui.hud_panel import HudPanel
+from src.utils.fixed_timestep import FixedTimestep
 
 # --- Estados do Jogo ---
 GAME_STATE_MENU = 0
@@ -84,44 +76,31 @@ def toggle_borderless(window):
         is_borderless = True
         print("Switched to borderless fullscreen")
 
-# --- Variáveis Globais ---
-scroll_pos = 0.0
-scroll_speed = -PLAYER_SPEED
-safety_distance = 180
-CRASH_SCROLL_MULTIPLIER = 2.0  # Multiplicador de velocidade durante respawn (2x mais rápido)
-difficulty_manager = DifficultyManager()
+# --- Loop Principal ---
+# A lógica de jogo fica em GameSimulation (src/game/simulation.py), que roda em ticks de tamanho fixo;
+# aqui só ficam a janela, a entrada, o acumulador de tempo e o desenho.
+MAX_TICKS_PER_FRAME = 8
+VSYNC = True  # Sincroniza a troca de buffers com o monitor
+MAX_FPS = 0  # Limite de FPS da renderização (0 = sem limite)
+WAIT_FOR_AUDIO_ON_START = True  # Ao sair do menu, espera o preload dos sons terminar
+AUDIO_READY_TIMEOUT = 5.0  # Espera máxima (s) pelos sons; depois disso eles carregam sob demanda
+AUDIO_VOICES = 16  # Vozes (canais do mixer) disputadas pelos efeitos sonoros
+AUDIO_MAX_INSTANCES_PER_SOUND = 3  # Cópias simultâneas de um mesmo som antes de roubar a mais antiga
+difficulty_manager = DifficultyManager("data/difficulty.json")  # Curvas opcionais; sem o arquivo usa as padrão
 high_score_manager = HighScoreManager("data/highscores.json")  # Especifica o caminho para a pasta data
 current_game_state = GAME_STATE_MENU
 menu_state = MenuState()
-police_car = None  # Variável para controlar o carro da polícia
+sim = None  # GameSimulation criada em main()
+audio_preload = None  # PreloadProgress do manifesto de sons, criado em main()
 
 # Variáveis para cálculo de viewport e coordenadas do mouse, acessadas por callbacks
 current_scale = 1.0
 current_offset = (0.0, 0.0)
 fb_height = SCREEN_HEIGHT
 
-# --- Constantes da Polícia ---
-POLICE_SPAWN_SCORE_THRESHOLD = 0
-POLICE_COOLDOWN_SECONDS = 10  # Tempo mínimo entre dois spawns de polícia (segundos)
-last_police_spawn_time = -9999.0  # Guarda o tempo do último spawn (usamos glfw.get_time())
-
 player_name = ""
 asking_for_name = False
 new_high_score = False
-holes = []  # Lista para armazenar os buracos na pista
-hole_spawn_timer = 0  # Temporizador para spawn de buracos
-oil_stains = []  # Lista para armazenar as manchas de óleo na pista
-oil_stain_spawn_timer = 0  # Temporizador para spawn de manchas de óleo
-beer_collectibles = []  # Lista para armazenar os objetos de cerveja coletáveis
-beer_spawn_timer = 0  # Temporizador para spawn de cervejas
-invulnerability_powerups = []  # Lista para armazenar os power-ups de invulnerabilidade
-invulnerability_spawn_timer = 0  # Temporizador para spawn de power-ups
-slowmotion_powerups = []  # Lista para armazenar os power-ups de slow motion
-slowmotion_spawn_timer = 0  # Temporizador para spawn de power-ups de slow motion
-slowmotion_effect = SlowMotionEffect()  # Instância do efeito de slow motion
-score_indicators = []  # Lista para armazenar os indicadores de pontos
-pending_score_bonus = 0  # Pontos bônus pendentes para aplicação gradual
-beer_bonus_points = 0  # Pontos ganhos com cerveja (separado do scroll_pos)
 
 # --- Callbacks de Input ---
 def key_callback(window, key, scancode, action, mods):
@@ -149,8 +128,7 @@ def key_callback(window, key, scancode, action, mods):
         elif key == glfw.KEY_ENTER:
             # Finaliza a entrada do nome e salva o high score
             if len(player_name) > 0:
-                score = abs(scroll_pos * 0.1) + beer_bonus_points
-                high_score_manager.add_high_score(player_name, int(score))
+                high_score_manager.add_high_score(player_name, int(sim.score))
                 asking_for_name = False
         elif 32 <= key <= 126:  # ASCII imprimível (espaço até ~)
             # Limita o tamanho do nome a 15 caracteres
@@ -160,7 +138,7 @@ def key_callback(window, key, scancode, action, mods):
     # Buzina: tecla Espaço toca o som, salvo quando digitando o nome
     if key == glfw.KEY_SPACE and action == glfw.PRESS and not asking_for_name:
         try:
-            audio_manager.play_one_shot("assets/sound/horn.mp3", volume=0.7)
+            audio_manager.play_sound(SOUND_HORN)
         except Exception as e:
             print(f"Erro ao tocar buzina: {e}")
 
@@ -214,6 +192,10 @@ def key_callback(window, key, scancode, action, mods):
             global DEBUG_SHOW_HITBOXES
             DEBUG_SHOW_HITBOXES = not DEBUG_SHOW_HITBOXES
             print(f"Debug hitboxes: {'ON' if DEBUG_SHOW_HITBOXES else 'OFF'}")
+            if DEBUG_SHOW_HITBOXES:
+                stats = audio_manager.voice_stats()
+                print(f"Vozes de áudio: {stats['in_use']}/{stats['voices']} tocando, "
+                      f"{stats['stolen']} roubadas, {stats['dropped']} descartadas")
 
 
 def mouse_button_callback(window, button, action, mods):
@@ -247,10 +229,11 @@ def mouse_button_callback(window, button, action, mods):
 
                 if clicked_action:
                     if clicked_action == "start":
+                        wait_for_audio()
                         current_game_state = GAME_STATE_PLAYING
                         reset_game()
                         try:
-                            audio_manager.play_background_music("assets/sound/background_music_1.mp3", volume=0.5,
+                            audio_manager.play_background_music(get_sound(MUSIC_BACKGROUND).path, volume=0.5,
                                                                 fade_ms=500, loop=True)
                         except Exception as e:
                             print(f"Erro ao iniciar a música de fundo: {e}")
@@ -267,10 +250,11 @@ def mouse_button_callback(window, button, action, mods):
                         reset_game()
 
                     elif clicked_action == "restart":
+                        wait_for_audio()
                         current_game_state = GAME_STATE_PLAYING
                         reset_game()
                         try:
-                            audio_manager.play_background_music("assets/sound/background_music_1.mp3", volume=0.8,
+                            audio_manager.play_background_music(get_sound(MUSIC_BACKGROUND).path, volume=0.8,
                                                                 fade_ms=500, loop=True)
                         except Exception as e:
                             print(f"Erro ao iniciar a música de fundo: {e}")
@@ -279,11 +263,8 @@ def mouse_button_callback(window, button, action, mods):
                         current_game_state = GAME_STATE_PLAYING
 
 def reset_game():
-    global scroll_pos, player_truck, enemies_up, enemies_down, spawn_timer_up, spawn_timer_down, player_name, asking_for_name, new_high_score, police_car,  holes, hole_spawn_timer, oil_stains, oil_stain_spawn_timer, beer_collectibles, beer_spawn_timer, invulnerability_powerups, invulnerability_spawn_timer, slowmotion_powerups, slowmotion_spawn_timer, slowmotion_effect, score_indicators, pending_score_bonus, beer_bonus_points, last_police_spawn_time
-    scroll_pos = 0.0
-    player_truck.reset()
-    enemies_up.clear()
-    enemies_down.clear()
+    global player_name, asking_for_name, new_high_score
+    sim.reset()
 
     # Garantir que todos os players globais de áudio sejam interrompidos
     # Isso para a sirene, músicas de fundo e outros players.
@@ -296,77 +277,21 @@ def reset_game():
     except Exception as e:
         print(f"Erro ao parar todos os áudios: {e}")
 
-    police_car = None
-    # Reset do timer de spawn da polícia
-    last_police_spawn_time = -9999.0
-    holes.clear()
-    oil_stains.clear()
-    beer_collectibles.clear()
-    invulnerability_powerups.clear()
-    slowmotion_powerups.clear()
-    slowmotion_effect.deactivate()
-    score_indicators.clear()
-    spawn_timer_up = 0
-    spawn_timer_down = 0
-    hole_spawn_timer = 0
-    oil_stain_spawn_timer = 0
-    beer_spawn_timer = 0
-    invulnerability_spawn_timer = 0
-    slowmotion_spawn_timer = 0
-    pending_score_bonus = 0
-    beer_bonus_points = 0
-    difficulty_manager.reset()
     player_name = ""
     asking_for_name = False
     new_high_score = False
-    glfw.set_time(0) # Reseta o tempo
-
-
 
 
-def draw_heart(x, y, size=8, color=(1.0, 0.3, 0.3), filled=True):
-    """Desenha um coração usando primitivas geométricas do OpenGL"""
-    glDisable(GL_TEXTURE_2D)
-    glColor3f(color[0], color[1], color[2])
+def wait_for_audio():
+    """Barreira antes de sair do menu: espera o preload dos sons (no máximo AUDIO_READY_TIMEOUT)."""
+    if not WAIT_FOR_AUDIO_ON_START or audio_preload is None or audio_preload.ready:
+        return
+    if not audio_preload.wait(AUDIO_READY_TIMEOUT):
+        print(f"Aviso: sons ainda carregando ({audio_preload.done}/{audio_preload.total}); seguem sob demanda")
 
-    import math
-
-    if filled:
-        # Coração preenchido usando uma abordagem mais precisa
-        glBegin(GL_TRIANGLE_FAN)
-        glVertex2f(x, y)  # Centro
-
-        # Criar pontos do coração usando a equação paramétrica
-        for i in range(37):  # 36 pontos + volta ao início
-            t = i * 2 * math.pi / 36
-            # Equação paramétrica do coração
-            heart_x, heart_y = calculate_heart_point(t, x, y, size)
-            glVertex2f(heart_x, heart_y)
-
-        glEnd()
-    else:
-        # Coração vazado (apenas contorno)
-        glLineWidth(2.0)
-        glBegin(GL_LINE_LOOP)
-
-        # Criar pontos do contorno do coração
-        for i in range(36):
-            t = i * 2 * math.pi / 36
-            # Equação paramétrica do coração
-            heart_x, heart_y = calculate_heart_point(t, x, y, size)
-            glVertex2f(heart_x, heart_y)
-
-        glEnd()
-        glLineWidth(1.0)
-
-
-def calculate_heart_point(t, x, y, size):
-    heart_x = x + size * (16 * math.sin(t) ** 3) / 16
-    heart_y = y + size * (13 * math.cos(t) - 5 * math.cos(2 * t) - 2 * math.cos(3 * t) - math.cos(4 * t)) / 13
-    return heart_x, heart_y
 
 def main():
-    global current_game_state, scroll_pos, player_truck, enemies_up, enemies_down, spawn_timer_up, spawn_timer_down, police_car, holes, hole_spawn_timer, oil_stains, oil_stain_spawn_timer, beer_collectibles, beer_spawn_timer, invulnerability_powerups, invulnerability_spawn_timer, score_indicators, pending_score_bonus, beer_bonus_points, sys, last_police_spawn_time, current_scale, current_offset, fb_height, asking_for_name, new_high_score
+    global current_game_state, sim, audio_preload, current_scale, current_offset, fb_height, asking_for_name, new_high_score
 
     if not glfw.init():
         sys.exit("Could not initialize GLFW.")
@@ -377,8 +302,6 @@ def main():
     except Exception as e:
         print(f"Aviso: Falha ao inicializar o pygame mixer via audio_manager: {e}")
 
-    glutInit(sys.argv)
-
     joystick = None
     try:
         pygame.init()
@@ -398,74 +321,71 @@ def main():
         sys.exit("Could not create GLFW window.")
 
     glfw.make_context_current(window)
+    glfw.swap_interval(1 if VSYNC else 0)
     glfw.set_key_callback(window, key_callback)
     glfw.set_mouse_button_callback(window, mouse_button_callback)
 
-    # --- Load Textures ---
+    # --- Load Textures (atlas) ---
+    # Todos os sprites são empacotados em uma ou duas texturas grandes; cada entidade recebe
+    # apenas a sua região (retângulo UV), então o frame inteiro é desenhado quase sem trocar de textura.
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    truck_texture = load_texture(os.path.join(script_dir, "assets/veiculos/protagonista/truck.png"))
-    truck_dead_texture = load_texture(os.path.join(script_dir, "assets/veiculos/protagonista/truck_dead.png"))
-    truck_armored_texture = load_texture(os.path.join(script_dir, "assets/veiculos/protagonista/armored_truck.png"))
-    truck_hole_texture = load_texture(os.path.join(script_dir, "assets/veiculos/protagonista/hole.png"))
-    truck_oil_texture = load_texture(os.path.join(script_dir, "assets/veiculos/protagonista/oil.png"))
-    truck_hole_and_oil_texture = load_texture(os.path.join(script_dir, "assets/veiculos/protagonista/hole and oil.png"))
-    enemy_textures_up = [load_texture(os.path.join(script_dir, f"assets/veiculos/up_{color}.png")) for color in ["black", "green", "red", "yellow"]]
-    enemy_textures_down = [load_texture(os.path.join(script_dir, f"assets/veiculos/down_{color}.png")) for color in ["black", "green", "red", "yellow"]]
-    enemy_dead_textures_up = [load_texture(os.path.join(script_dir, f"assets/veiculos/up_{color}_dead.png")) for color in ["black", "green", "red", "yellow"]]
-    enemy_dead_textures_down = [load_texture(os.path.join(script_dir, f"assets/veiculos/down_{color}_dead.png")) for color in ["black", "green", "red", "yellow"]]
-    hole_texture = load_texture(os.path.join(script_dir, "assets/elementos_de_cenario/buraco.png"))
-    oil_texture = load_texture(os.path.join(script_dir, "assets/elementos_de_cenario/mancha_oleo.png"))
-    beer_texture = load_texture(os.path.join(script_dir, "assets/elementos_de_cenario/cerveja.png"))
-    invulnerability_texture = load_texture(os.path.join(script_dir, "assets/elementos_de_cenario/invecibilidade asset.png"))
-    slowmotion_texture = load_texture(os.path.join(script_dir, "assets/elementos_de_cenario/relogio.png"))
-    print(f"Slow motion texture loaded: {slowmotion_texture}")
-
-    police_textures = {
-        'normal_1': load_texture(os.path.join(script_dir, "assets/veiculos/police_1.png")),
-        'normal_2': load_texture(os.path.join(script_dir, "assets/veiculos/police_2.png")),
-        'dead': load_texture(os.path.join(script_dir, "assets/veiculos/police_dead.png"))
+    colors = ["black", "green", "red", "yellow"]
+    sprite_files = {
+        "truck": "assets/veiculos/protagonista/truck.png",
+        "truck_dead": "assets/veiculos/protagonista/truck_dead.png",
+        "truck_armored": "assets/veiculos/protagonista/armored_truck.png",
+        "truck_hole": "assets/veiculos/protagonista/hole.png",
+        "truck_oil": "assets/veiculos/protagonista/oil.png",
+        "truck_hole_and_oil": "assets/veiculos/protagonista/hole and oil.png",
+        "hole": "assets/elementos_de_cenario/buraco.png",
+        "oil": "assets/elementos_de_cenario/mancha_oleo.png",
+        "beer": "assets/elementos_de_cenario/cerveja.png",
+        "invulnerability": "assets/elementos_de_cenario/invecibilidade asset.png",
+        "slowmotion": "assets/elementos_de_cenario/relogio.png",
+        "police_1": "assets/veiculos/police_1.png",
+        "police_2": "assets/veiculos/police_2.png",
+        "police_dead": "assets/veiculos/police_dead.png",
     }
-    
-    # --- Pré-carrega os sons ---
+    for color in colors:
+        sprite_files[f"up_{color}"] = f"assets/veiculos/up_{color}.png"
+        sprite_files[f"up_{color}_dead"] = f"assets/veiculos/up_{color}_dead.png"
+        sprite_files[f"down_{color}"] = f"assets/veiculos/down_{color}.png"
+        sprite_files[f"down_{color}_dead"] = f"assets/veiculos/down_{color}_dead.png"
+
+    atlas = TextureAtlas()
+    all_sprites_loaded = all([atlas.add(name, os.path.join(script_dir, path)) for name, path in sprite_files.items()])
+    sprites = atlas.build()
+
+    # --- Pré-carrega os sons do manifesto (em segundo plano, enquanto o menu aparece) ---
     try:
-        audio_manager.preload_sound("assets/sound/police_sound.wav", create_loop=True)
-        audio_manager.preload_sound("assets/sound/background_music_1.mp3", create_loop=True)
-        audio_manager.preload_sound("assets/sound/crash.wav", create_loop=False)
-        audio_manager.preload_sound("assets/sound/game_over.wav", create_loop=False)
-        audio_manager.preload_sound("assets/sound/beer.wav", create_loop=False)
-        audio_manager.preload_sound("assets/sound/invulnerability.wav", create_loop=False)
+        audio_manager.configure_voices(AUDIO_VOICES, AUDIO_MAX_INSTANCES_PER_SOUND)
+        audio_preload = audio_manager.preload_manifest()
     except Exception as e:
         print(f"Erro ao pré-carregar áudios: {e}")
     
-    if not all([truck_texture, truck_dead_texture, truck_armored_texture, truck_hole_texture, truck_oil_texture, truck_hole_and_oil_texture, 
-                hole_texture, oil_texture, beer_texture, invulnerability_texture, slowmotion_texture] +
-               enemy_textures_up + enemy_textures_down + enemy_dead_textures_up + enemy_dead_textures_down + 
-               list(police_textures.values())):
+    if not all_sprites_loaded:
         glfw.terminate()
         sys.exit("Failed to load one or more textures.")
 
-    player_truck = Truck(truck_texture, truck_dead_texture, truck_armored_texture,
-                    truck_hole_texture, truck_oil_texture, truck_hole_and_oil_texture)
-    enemies_up, enemies_down = [], []
-    holes = []
-    oil_stains = []
-    beer_collectibles = []
-    invulnerability_powerups = []
-    slowmotion_powerups = []
-    score_indicators = []
-    spawn_timer_up, spawn_timer_down = 0, 0
-    hole_spawn_timer = 0
-    oil_stain_spawn_timer = 0
-    beer_spawn_timer = 0
-    invulnerability_spawn_timer = 0
-    slowmotion_spawn_timer = 0
-    pending_score_bonus = 0
-    beer_bonus_points = 0
-
-    enemy_up_texture_pairs = list(zip(enemy_textures_up, enemy_dead_textures_up))
-    enemy_down_texture_pairs = list(zip(enemy_textures_down, enemy_dead_textures_down))
+    hud_panel = HudPanel()
+
+    # Toda a lógica de jogo roda na simulação; a janela só fornece entrada, áudio e desenho
+    # Relógio único do jogo: lido uma vez por frame; o tempo de jogo só anda com os ticks da simulação
+    game_clock = GameClock()
+    sim = GameSimulation(sprites, clock=game_clock, input_source=GlfwInput(window, joystick), audio=audio_manager,
+                         difficulty_manager=difficulty_manager)
+
+    timestep = FixedTimestep(SIMULATION_HZ, MAX_TICKS_PER_FRAME)
 
     while not glfw.window_should_close(window):
+        # No menu / pausa o relógio fica pausado e o frame não tem tempo de jogo
+        if current_game_state == GAME_STATE_PLAYING:
+            game_clock.resume()
+        else:
+            game_clock.pause()
+        frame_time = game_clock.sample()
+        frame_start = game_clock.wall_time
+
         glfw.poll_events()
 
         # --- Resolution & uniform scaling (logical base coordinates) ---
@@ -505,591 +425,24 @@ def main():
         current_offset = (offset_x, offset_y)
 
         # --- Game State Logic ---
+        # A simulação só avança enquanto o jogo está rodando; no menu/pausa o tempo acumulado é descartado
         if current_game_state == GAME_STATE_PLAYING:
-            # Atualizar dificuldade baseada no tempo e pontuação
-            time_elapsed = glfw.get_time()
-            score = abs(scroll_pos * 0.1) + beer_bonus_points
-            difficulty_manager.update(time_elapsed, score)
-
-            # Obter valores dinâmicos de dificuldade
-            current_scroll_speed = difficulty_manager.get_current_scroll_speed()
-            current_spawn_rate = difficulty_manager.get_current_spawn_rate()
-            enemy_speed_multiplier = difficulty_manager.get_current_enemy_speed_multiplier()
-
-            # Atualizar o efeito de slow motion
-            slowmotion_effect.update(time_elapsed)
-            
-            if not player_truck.crashed:
-                # Atualiza o estado do caminhão (verifica invulnerabilidade)
-                player_truck.update()
-            
-            # Calcula o multiplicador ANTES de processar as colisões
-            slowmotion_multiplier = slowmotion_effect.get_speed_multiplier()
-
-            # Aplica o multiplicador de slow motion aos valores de dificuldade
-            # Mas mantém velocidades separadas para player e mundo
-            world_scroll_speed = current_scroll_speed * slowmotion_multiplier
-            current_spawn_rate /= slowmotion_multiplier  # Spawns mais lentos durante slow motion
-            enemy_speed_multiplier *= slowmotion_multiplier
-
-            # Aplica ao scroll_speed global (sinal negativo) - usado para o mundo
-            global scroll_speed
-            scroll_speed = -world_scroll_speed
-
-            # Velocidade da estrada afetada pelo slow motion (para sincronizar com os inimigos)
-            road_scroll_speed = -world_scroll_speed
-            # Velocidade normal do player (não afetada pelo slow motion)
-            player_scroll_speed = -current_scroll_speed
-
-            if not player_truck.crashed:
-                
-                dx, dy = 0.0, 0.0
-                deadzone = 0.3  # Zona morta para o analógico
-
-                # --- Controle do Joystick ---
-                if joystick:
-                    pygame.event.pump()  # Processa eventos internos do pygame
-
-                    # Eixo X (esquerda/direita) do analógico esquerdo
-                    axis_x = joystick.get_axis(0)
-                    if abs(axis_x) > deadzone:
-                        dx = axis_x * 0.1
-
-                    # Eixo Y (cima/baixo) do analógico esquerdo
-                    axis_y = joystick.get_axis(1)
-                    if abs(axis_y) > deadzone:
-                        # Pygame considera -1 para cima, então invertemos
-                        if axis_y < 0:  # Para cima
-                            dy = 0.1
-                        else:  # Para baixo (freio)
-                            dy = scroll_speed / player_truck.speed_y
-
-                    # D-Pad (Hat)
-                    if joystick.get_numhats() > 0:
-                        hat_x, hat_y = joystick.get_hat(0)
-                        if hat_x != 0:
-                            dx = hat_x * 0.1
-                        if hat_y != 0:
-                            if hat_y > 0:  # Para cima
-                                dy = 0.1
-                            else:  # Para baixo (freio)
-                                dy = scroll_speed / player_truck.speed_y
-
-                    # Botão para buzina (geralmente o botão 2 é o 'X' no PS2)
-                    if joystick.get_button(2):
-                        try:
-                            audio_manager.play_one_shot("assets/sound/horn.mp3", volume=0.7)
-                        except Exception as e:
-                            print(f"Erro ao tocar buzina: {e}")
-
-                # --- Controle do Teclado (Fallback) ---
-                # Se o joystick não moveu o caminhão, verifica o teclado
-                if dx == 0.0:
-                    if glfw.get_key(window, glfw.KEY_LEFT) == glfw.PRESS: dx -= 0.1
-                    if glfw.get_key(window, glfw.KEY_RIGHT) == glfw.PRESS: dx += 0.1
-
-                if dy == 0.0:
-                    if glfw.get_key(window, glfw.KEY_UP) == glfw.PRESS:
-                        dy = 0.1
-                    elif glfw.get_key(window, glfw.KEY_DOWN) == glfw.PRESS:
-                        dy = scroll_speed / player_truck.speed_y
-
-                player_truck.move(dx, dy)
-            else:
-                # --- LÓGICA DE CRASH / RESPAWN / GAME OVER ---
-                # Empurra o caminhão com o scroll quando está crashado
-                # MODIFICAÇÃO: Usa a velocidade normal do player, não afetada pelo slow motion
-                player_truck.y += player_scroll_speed * CRASH_SCROLL_MULTIPLIER
-
-                # Só continua para a próxima etapa (respawn ou game over) quando o caminhão saiu da tela E
-                # todos os inimigos marcados como crashados também já tiverem saído.
-                if player_truck.y + player_truck.height < 0:
-                    crashed_enemies = [e for e in enemies_up + enemies_down if e.crashed]
-                    # considera apenas inimigos que ainda estão visíveis na tela
-                    remaining_crashed_visible = [e for e in crashed_enemies if e.y + e.height >= 0]
-
-                    if not remaining_crashed_visible:
-                        # Se ainda tem vidas, faz o respawn
-                        if player_truck.lives > 0:
-                            # Desativa slow motion antes do respawn
-                            if slowmotion_effect.is_active():
-                                slowmotion_effect.deactivate()
-                            player_truck.respawn()
-                        else:
-                            # Desativa slow motion antes do game over
-                            if slowmotion_effect.is_active():
-                                slowmotion_effect.deactivate()
-                            # Se não tem mais vidas, é Game Over
-                            current_game_state = GAME_STATE_GAME_OVER
-                            # Para a música de fundo ao entrar na tela de game over
-                            try:
-                                audio_manager.stop_background_music()
-                            except Exception:
-                                pass
-                            # Toca som de game over (não bloqueante)
-                            try:
-                                audio_manager.play_one_shot("assets/sound/game_over.wav")
-                            except Exception as e:
-                                print(f"Erro ao tocar som de game over: {e}")
-                            # Verifica se a pontuação atual é um novo high score
-                            final_score = int(abs(scroll_pos * 0.1) + beer_bonus_points)
-                            global new_high_score, asking_for_name
-                            new_high_score = high_score_manager.is_high_score(final_score)
-                            if new_high_score:
-                                asking_for_name = True
-            
-            # Acelera a rolagem do cenário quando o caminhão está crashado
-            if player_truck.crashed:
-                scroll_pos += road_scroll_speed * CRASH_SCROLL_MULTIPLIER
-            else:
-                scroll_pos += road_scroll_speed
-
-            # --- Police Spawning ---
-            if police_car is None and score > POLICE_SPAWN_SCORE_THRESHOLD:
-                # Respeita cooldown entre spawns de polícia
-                current_time = glfw.get_time()
-                time_since_last = current_time - last_police_spawn_time
-                if time_since_last < POLICE_COOLDOWN_SECONDS:
-                    # Ainda em cooldown — não tenta spawnar
-                    pass
-                else:
-                    # A chance aumenta com a pontuação
-                    spawn_chance = random.uniform(0, 1) * (score / 500000.0)
-                    if random.random() < spawn_chance:
-                        print(f"Police spawn chance: {spawn_chance:.4f}")
-                        print(f"Police car spawned at score {score:.0f}!")
-                        # Medir tempo de inicialização para diagnosticar travamentos ao spawn
-                        try:
-                            police_car = police.PoliceCar(police_textures, os.path.join(script_dir, "assets/sound/police_sound.wav"))
-                            # Registra o tempo do spawn para aplicar cooldown
-                            last_police_spawn_time = glfw.get_time()
-                        except Exception as e:
-                            print(f"Failed to spawn PoliceCar: {e}")
-
-            # --- Police Update ---
-            if police_car:
-                # Só acelera o carro da polícia se o jogador estiver crashado, mesmo que a polícia esteja crashada
-                if player_truck.crashed:
-                    police_result = police_car.update(player_truck, enemies_up + enemies_down, scroll_speed * CRASH_SCROLL_MULTIPLIER)
-                else:
-                    police_result = police_car.update(player_truck, enemies_up + enemies_down, scroll_speed)
-                
-                # Se a polícia retornou informações de pontuação (jogador blindado destruiu a polícia)
-                if police_result and police_result.get("points_awarded"):
-                    points_gained = police_result["points"]
-                    beer_bonus_points += points_gained
-                    
-                    # Cria indicador visual de pontos
-                    indicator_x = police_result["x"] + 25  # Centro da polícia (width/2)
-                    indicator_y = police_result["y"]
-                    score_indicators.append(ScoreIndicator(indicator_x, indicator_y, points_gained))
-                
-                # Se a polícia sair da tela por cima ou por baixo, remove-a
-                if police_car.y > SCREEN_HEIGHT or police_car.y + police_car.height < 0:
-                    try:
-                        police_car.stop_audio()
-                    except Exception:
-                        pass
-                    # Guarda momento de remoção para iniciar cooldown
-                    last_police_spawn_time = glfw.get_time()
-                    police_car = None
-
-            # --- Enemy Spawning ---
-            # Aplica o multiplicador de crash ao timer de spawn quando o player está crashado
-            if player_truck.crashed:
-                spawn_timer_up += 0.1 * CRASH_SCROLL_MULTIPLIER
-            else:
-                spawn_timer_up += 0.1
-                
-            if spawn_timer_up >= current_spawn_rate:
-                spawn_timer_up = 0
-                up_lanes = range(LANE_COUNT_PER_DIRECTION, LANE_COUNT_PER_DIRECTION * 2)
-                possible_lanes = [lane for lane in up_lanes if max((e.y for e in enemies_up if e.lane_index == lane), default=0) < SCREEN_HEIGHT - safety_distance]
-                if possible_lanes:
-                    chosen_lane = random.choice(possible_lanes)
-                    normal_texture, dead_texture = random.choice(enemy_up_texture_pairs)
-                    enemies_up.append(Enemy(normal_texture, dead_texture, lane_index=chosen_lane, speed_multiplier=enemy_speed_multiplier))
-
-            # Aplica o multiplicador de crash ao timer de spawn quando o player está crashado
-            if player_truck.crashed:
-                spawn_timer_down += 0.15 * CRASH_SCROLL_MULTIPLIER
-            else:
-                spawn_timer_down += 0.15
-                
-            if spawn_timer_down >= current_spawn_rate:
-                spawn_timer_down = 0
-                down_lanes = range(0, LANE_COUNT_PER_DIRECTION)
-                possible_lanes = [lane for lane in down_lanes if max((e.y for e in enemies_down if e.lane_index == lane), default=0) < SCREEN_HEIGHT - safety_distance]
-                if possible_lanes:
-                    chosen_lane = random.choice(possible_lanes)
-                    normal_texture, dead_texture = random.choice(enemy_down_texture_pairs)
-                    enemies_down.append(EnemyDown(normal_texture, dead_texture, lane_index=chosen_lane, speed_multiplier=enemy_speed_multiplier))
-
-            # --- Enemy Update & Collision ---
-            all_enemies = enemies_up + enemies_down
-            for enemy in all_enemies:
-                # Passa o multiplicador de velocidade quando o player está crashado
-                if player_truck.crashed:
-                    enemy.update(all_enemies, CRASH_SCROLL_MULTIPLIER)
-                else:
-                    enemy.update(all_enemies, slowmotion_multiplier)
-                    
-                # Marca inimigos que colidem com o caminhão
-                if not enemy.crashed and player_truck.check_collision(enemy):
-                    # Só processa colisão se o jogador não estiver invulnerável (exceto quando blindado)
-                    if not player_truck.invulnerable or player_truck.armored:
-                        # O inimigo fica crashed quando há colisão válida
-                        enemy.crashed = True
-                        # Reproduz som de colisão (reutiliza helper para evitar duplicação)
-                        try:
-                            audio_manager.play_one_shot("assets/sound/crash.wav", volume=0.7)
-                        except Exception as e:
-                            print(f"Erro ao tocar som de colisão: {e}")
-                        
-                        # Se o jogador está blindado (invulnerável com power-up), ganha pontos por destruir inimigos
-                        if player_truck.armored:
-                            points_gained = 100  # Mesmo valor que a cerveja
-                            beer_bonus_points += points_gained
-                            
-                            # Cria indicador visual de pontos (mesmo sistema da cerveja)
-                            indicator_x = enemy.x + enemy.width // 2
-                            indicator_y = enemy.y
-                            score_indicators.append(ScoreIndicator(indicator_x, indicator_y, points_gained))
-                        else:
-                            # O caminhão só toma dano se não estiver blindado
-                            player_truck.take_damage()
-                
-                # inimigos crashados continuam sendo empurrados pelo scroll
-                if enemy.crashed:
-                    # Só acelera se o player estiver crashado
-                    if player_truck.crashed:
-                        enemy.y += scroll_speed * CRASH_SCROLL_MULTIPLIER
-                    else:
-                        enemy.y += scroll_speed
-            
-            # --- Verifica se o player crashou durante o slow motion e desativa o efeito ---
-            if player_truck.crashed and slowmotion_effect.is_active():
-                slowmotion_effect.deactivate()
-                print("Slow motion desativado devido ao crash do player")
-                
-                # Recalcula as velocidades com o slow motion desativado
-                new_slowmotion_multiplier = slowmotion_effect.get_speed_multiplier()  # Será 1.0 agora
-                world_scroll_speed = current_scroll_speed * new_slowmotion_multiplier
-                current_spawn_rate = difficulty_manager.get_current_spawn_rate() / new_slowmotion_multiplier
-                enemy_speed_multiplier = difficulty_manager.get_current_enemy_speed_multiplier() * new_slowmotion_multiplier
-                
-                # Atualiza o scroll_speed global
-                scroll_speed = -world_scroll_speed
-                road_scroll_speed = -world_scroll_speed
-                    
-            # --- Hole Spawning ---
-            # Acelera o timer de spawn quando o player está crashado
-            if player_truck.crashed:
-                hole_spawn_timer += 0.3 * CRASH_SCROLL_MULTIPLIER  # Acelerado durante crash
-            else:
-                hole_spawn_timer += 0.3  # Timer normal
-                
-            hole_spawn_rate = current_spawn_rate
-            current_hole_probability = difficulty_manager.get_current_hole_spawn_probability()
-            
-            if hole_spawn_timer >= hole_spawn_rate:
-                hole_spawn_timer = 0
-                # Agora usamos apenas a probabilidade para determinar o spawn
-                if random.random() < current_hole_probability:
-                    safe_lanes, all_lanes = get_safe_lanes_for_obstacles(oil_stains, LANE_COUNT_PER_DIRECTION,
-                                                                         SCREEN_HEIGHT, safety_distance)
-                    collision_free_lanes = []
-                    for lane in safe_lanes:
-                        # Cria um buraco temporário para verificar colisões
-                        temp_hole = Hole(hole_texture, lane_index=lane, speed_multiplier=enemy_speed_multiplier)
-                        
-                        # Verifica se o buraco colide com alguma mancha de óleo
-                        collision = False
-                        for oil in oil_stains:
-                            if oil.active and temp_hole.check_collision_with_object(oil):
-                                collision = True
-                                break
-                                
-                        if not collision:
-                            collision_free_lanes.append(lane)
-                    
-                    # Se encontrou lanes sem colisão, usa-as, senão usa as lanes seguras originais
-                    if collision_free_lanes:
-                        chosen_lane = random.choice(collision_free_lanes)
-                    else:
-                        chosen_lane = random.choice(safe_lanes)
-                        
-                    holes.append(Hole(hole_texture, lane_index=chosen_lane, speed_multiplier=enemy_speed_multiplier))
-            
-            # --- Hole Update & Collision ---
-            for hole in holes:
-                # Usa velocidade acelerada durante crash para manter todos objetos em sincronia
-                if player_truck.crashed:
-                    hole.update(scroll_speed * CRASH_SCROLL_MULTIPLIER)
-                else:
-                    hole.update(scroll_speed)
-                    
-                if hole.active and player_truck.check_hole_collision(hole):
-                    # Buraco desaparece após uso
-                    hole.active = False
-                    # Aplica efeito de diminuição de velocidade somente se não estiver invulnerável
-                    if not player_truck.invulnerable:
-                        player_truck.slow_down()
-            
-            # Remove buracos que saíram da tela ou foram usados
-            holes = [h for h in holes if h.active and h.y > -h.height]
-            
-            # --- Oil Stain Spawning ---
-            # Acelera o timer durante crash
-            if player_truck.crashed:
-                oil_stain_spawn_timer += 0.3 * CRASH_SCROLL_MULTIPLIER
-            else:
-                oil_stain_spawn_timer += 0.3  # Incrementa o timer para spawn
-                
-            oil_stain_spawn_rate = current_spawn_rate
-            current_oil_stain_probability = difficulty_manager.get_current_oil_stain_spawn_probability()
-            
-            if oil_stain_spawn_timer >= oil_stain_spawn_rate:
-                oil_stain_spawn_timer = 0
-                # Agora usamos apenas a probabilidade para determinar o spawn
-                if random.random() < current_oil_stain_probability:
-                    # Pode aparecer em qualquer faixa
-                    safe_lanes, all_lanes = get_safe_lanes_for_obstacles(oil_stains, LANE_COUNT_PER_DIRECTION,
-                                                                         SCREEN_HEIGHT, safety_distance)
-                    collision_free_lanes = []
-                    for lane in safe_lanes:
-                        # Cria uma mancha temporária para verificar colisões
-                        temp_oil = OilStain(oil_texture, lane_index=lane, speed_multiplier=enemy_speed_multiplier)
-                        
-                        # Verifica se a mancha colide com algum buraco
-                        collision = False
-                        for hole in holes:
-                            if hole.active and temp_oil.check_collision_with_object(hole):
-                                collision = True
-                                break
-                                
-                        if not collision:
-                            collision_free_lanes.append(lane)
-                    
-                    # Se encontrou lanes sem colisão, usa-as, senão usa as lanes seguras originais
-                    if collision_free_lanes:
-                        chosen_lane = random.choice(collision_free_lanes)
-                    else:
-                        chosen_lane = random.choice(safe_lanes)
-                        
-                    oil_stains.append(OilStain(oil_texture, lane_index=chosen_lane, speed_multiplier=enemy_speed_multiplier))
-            
-            # --- Oil Stain Update & Collision ---
-            for oil_stain in oil_stains:
-                # Usa velocidade acelerada durante crash para manter todos objetos em sincronia
-                if player_truck.crashed:
-                    oil_stain.update(scroll_speed * CRASH_SCROLL_MULTIPLIER)
-                else:
-                    oil_stain.update(scroll_speed)
-                    
-                if oil_stain.active and player_truck.check_oil_stain_collision(oil_stain):
-                    # Mancha desaparece após uso
-                    oil_stain.active = False
-                    # Aplica efeito de inversão de controles somente se não estiver invulnerável
-                    if not player_truck.invulnerable:
-                        player_truck.invert_controls()
-            
-            # Remove manchas que saíram da tela ou foram usadas
-            oil_stains = [o for o in oil_stains if o.active and o.y > -o.height]
-            
-            # --- Beer Collectible Spawning ---
-            # Acelera o timer durante crash
-            if player_truck.crashed:
-                beer_spawn_timer += 0.4 * CRASH_SCROLL_MULTIPLIER
-            else:
-                beer_spawn_timer += 0.4  # Incrementa o timer para spawn (um pouco mais lento)
-                
-            beer_spawn_rate = current_spawn_rate * 1.5  # Taxa de spawn mais lenta que buracos e óleo
-            
-            if beer_spawn_timer >= beer_spawn_rate:
-                beer_spawn_timer = 0
-                # Usa a probabilidade do difficulty manager
-                current_beer_probability = difficulty_manager.get_current_beer_spawn_probability()
-                
-                if random.random() < current_beer_probability:
-                    # Pode aparecer em qualquer faixa
-                    chosen_lane = get_safe_lane_for_powerup(invulnerability_powerups, LANE_COUNT_PER_DIRECTION, SCREEN_HEIGHT, safety_distance)
-                    beer_collectibles.append(BeerCollectible(beer_texture, lane_index=chosen_lane, speed_multiplier=enemy_speed_multiplier))
-            
-            # --- Beer Collectible Update & Collision ---
-            for beer in beer_collectibles:
-                # Usa velocidade acelerada durante crash para manter todos objetos em sincronia
-                if player_truck.crashed:
-                    beer.update(scroll_speed * CRASH_SCROLL_MULTIPLIER)
-                else:
-                    beer.update(scroll_speed)  # Passa a velocidade atual de rolagem
-                if beer.active and beer.check_collision(player_truck):
-                    # Cerveja é coletada e jogador ganha pontos
-                    points_gained = beer.collect()
-                    if points_gained > 0:
-                        try:
-                            audio_manager.play_one_shot("assets/sound/beer.wav")
-                        except Exception as e:
-                            print(f"Erro ao tocar som de coleta: {e}")
-                        # Cria indicador visual de pontos
-                        indicator_x = beer.x + beer.width // 2
-                        indicator_y = beer.y
-                        score_indicators.append(ScoreIndicator(indicator_x, indicator_y, points_gained))
-                        
-                        # Adiciona pontos ao score de forma mais suave
-                        # Em vez de alterar scroll_pos drasticamente, vamos fazer pequenos incrementos
-                        # que serão aplicados ao longo do tempo
-                        beer_bonus_points += points_gained  # Adiciona diretamente aos pontos de cerveja
-            
-            # Remove cervejas que saíram da tela ou foram coletadas
-            beer_collectibles = [b for b in beer_collectibles if b.active and b.y > -b.height]
-            
-            # --- Score Indicators Update ---
-            for indicator in score_indicators:
-                # Acelera a animação dos indicadores de pontuação durante o crash
-                if player_truck.crashed:
-                    # Acessa e modifica a velocidade diretamente para este frame
-                    original_velocity = indicator.velocity_y
-                    indicator.velocity_y *= CRASH_SCROLL_MULTIPLIER
-                    indicator.update()
-                    # Restaura a velocidade original para o próximo frame
-                    indicator.velocity_y = original_velocity
-                else:
-                    indicator.update()
-            # Remove indicadores inativos
-            score_indicators = [i for i in score_indicators if i.active]
-            
-            # --- Invulnerability Power-Up Spawning ---
-            # Acelera o timer durante crash
-            if player_truck.crashed:
-                invulnerability_spawn_timer += 0.2 * CRASH_SCROLL_MULTIPLIER  # Acelerado
-            else:
-                invulnerability_spawn_timer += 0.2  # Incrementa o timer para spawn (mais lento)
-                
-            invulnerability_spawn_rate = current_spawn_rate * 2.0  # Taxa de spawn muito mais lenta que outros elementos
-            current_invulnerability_probability = difficulty_manager.get_current_invulnerability_spawn_probability()
-            
-            if invulnerability_spawn_timer >= invulnerability_spawn_rate:
-                invulnerability_spawn_timer = 0
-                # Verificação de probabilidade (com probabilidade garantida a cada X tentativas)
-                static_spawn_counter = getattr(difficulty_manager, 'invulnerability_spawn_counter', 0) + 1
-                difficulty_manager.invulnerability_spawn_counter = static_spawn_counter
-                
-                # Força o spawn a cada 5 tentativas, independente da probabilidade (mais frequente para testes)
-                force_spawn = (static_spawn_counter >= 5)
-                if force_spawn:
-                    difficulty_manager.invulnerability_spawn_counter = 0
-                
-                if force_spawn or random.random() < current_invulnerability_probability:
-                    # Pode aparecer em qualquer faixa
-                    chosen_lane = get_safe_lane_for_powerup(invulnerability_powerups, LANE_COUNT_PER_DIRECTION,
-                                                            SCREEN_HEIGHT, safety_distance)
-                    invulnerability_powerups.append(InvulnerabilityPowerUp(invulnerability_texture, lane_index=chosen_lane, speed_multiplier=enemy_speed_multiplier))
-            
-            # --- Invulnerability Power-Up Update & Collision ---
-            for powerup in invulnerability_powerups:
-                # Usa velocidade acelerada durante crash para manter todos objetos em sincronia
-                if player_truck.crashed:
-                    powerup.update(scroll_speed * CRASH_SCROLL_MULTIPLIER)
-                else:
-                    powerup.update(scroll_speed)  # Passa a velocidade atual de rolagem
-                if powerup.active and player_truck.check_invulnerability_powerup_collision(powerup):
-                    # Power-up desaparece após uso
-                    powerup.active = False
-                    try:
-                        audio_manager.play_one_shot("assets/sound/invulnerability.wav")
-                    except Exception as e:
-                        print(f"Erro ao tocar som de invulnerabilidade: {e}")
-                    # Ativa o efeito de invulnerabilidade e transforma em carro blindado
-                    player_truck.activate_invulnerability_powerup()
-            
-            # Remove power-ups que saíram da tela ou foram usados
-            invulnerability_powerups = [p for p in invulnerability_powerups if p.active and p.y > -p.height]
-
-            # --- Slow Motion Power-Up Spawning ---
-            # Acelera o timer durante crash
-            if player_truck.crashed:
-                slowmotion_spawn_timer += 0.2 * CRASH_SCROLL_MULTIPLIER  # Acelerado
-            else:
-                slowmotion_spawn_timer += 0.2  # Incrementa o timer para spawn (mais lento)
-
-            slowmotion_spawn_rate = current_spawn_rate * 2.5  # Taxa de spawn ainda mais lenta que invulnerabilidade
-            current_slowmotion_probability = difficulty_manager.get_current_slowmotion_spawn_probability()
-
-            if slowmotion_spawn_timer >= slowmotion_spawn_rate:
-                slowmotion_spawn_timer = 0
-                # Verificação de probabilidade (com probabilidade garantida a cada X tentativas)
-                static_spawn_counter = getattr(difficulty_manager, 'slowmotion_spawn_counter', 0) + 1
-                difficulty_manager.slowmotion_spawn_counter = static_spawn_counter
-
-                # Força o spawn a cada 3 tentativas, independente da probabilidade (mais frequente para testes)
-                force_spawn = (static_spawn_counter >= 3)
-                if force_spawn:
-                    difficulty_manager.slowmotion_spawn_counter = 0
-                    print(f"Force spawning slow motion power-up (attempt {static_spawn_counter})")
-
-                if force_spawn or random.random() < current_slowmotion_probability:
-                    # Pode aparecer em qualquer faixa
-                    all_lanes = range(0, LANE_COUNT_PER_DIRECTION * 2)
-                    # Verifica se há faixas seguras (sem outros power-ups muito próximos)
-                    safe_lanes = [lane for lane in all_lanes if
-                                  max((p.y for p in slowmotion_powerups if p.lane_index == lane), default=0) < SCREEN_HEIGHT - safety_distance]
-
-                    # Se não houver faixas seguras, usa todas as faixas
-                    if not safe_lanes:
-                        safe_lanes = all_lanes
-
-                    chosen_lane = random.choice(safe_lanes)
-                    slowmotion_powerups.append(SlowMotionPowerUp(slowmotion_texture, lane_index=chosen_lane, speed_multiplier=enemy_speed_multiplier))
-                    print(f"Slow motion power-up spawned at lane {chosen_lane}!")
-
-            # --- Slow Motion Power-Up Update & Collision ---
-            for powerup in slowmotion_powerups:
-                # Usa velocidade acelerada durante crash para manter todos objetos em sincronia
-                if player_truck.crashed:
-                    powerup.update(scroll_speed * CRASH_SCROLL_MULTIPLIER)
-                else:
-                    powerup.update(scroll_speed)  # Passa a velocidade atual de rolagem
-
-                if powerup.active and not slowmotion_effect.is_active():  # Só pode coletar se não há slow motion ativo
-                    if player_truck.check_slowmotion_powerup_collision(powerup):
-                        # Power-up desaparece após uso
-                        powerup.active = False
-
-                        # Ativa o efeito de slow motion
-                        slowmotion_effect.activate(time_elapsed)
-
-                        # Toca som (pode usar o mesmo da invulnerabilidade ou criar um novo)
-                        try:
-                            audio_manager.play_one_shot("assets/sound/invulnerability.wav", volume=0.8)
-                        except Exception as e:
-                            print(f"Erro ao tocar som de slow motion: {e}")
-
-            # Remove power-ups que saíram da tela ou foram usados
-            slowmotion_powerups = [p for p in slowmotion_powerups if p.active and p.y > -p.height]
-
-            # Propagação de colisão: inimigos crashados podem colidir com outros
-            def _rects_overlap(a, b):
-                return (a.x < b.x + b.width and
-                        a.x + a.width > b.x and
-                        a.y < b.y + b.height and
-                        a.y + a.height > b.y)
-
-            all_cars_on_road = all_enemies
-            if police_car:
-                all_cars_on_road.append(police_car)
-
-            for a in all_cars_on_road:
-                if not a.crashed:
-                    continue
-                for b in all_enemies:
-                    if a is b or b.crashed:
-                        continue
-                    if _rects_overlap(a, b):
-                        b.crashed = True
-
-            enemies_up = [e for e in enemies_up if e.y > -e.height]
-            enemies_down = [e for e in enemies_down if e.y > -e.height]
+            ticks = timestep.advance(frame_time)
+        else:
+            timestep.reset()
+            ticks = 0
+
+        for _ in range(ticks):
+            sim.step()
+            # O estado muda no meio do frame quando a simulação termina a partida
+            if sim.game_over:
+                current_game_state = GAME_STATE_GAME_OVER
+                # Verifica se a pontuação atual é um novo high score
+                final_score = int(sim.score)
+                new_high_score = high_score_manager.is_high_score(final_score)
+                if new_high_score:
+                    asking_for_name = True
+                break
 
         # --- Drawing ---
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
@@ -1105,11 +458,12 @@ def main():
                     # Obtém todos os recordes para exibir o top 3
                     top_scores = high_score_manager.get_top_scores()
                     draw_start_menu(menu_state, mouse_x, mouse_y,
-                                    {"scores": top_scores, "highest": high_score_manager.get_highest_score()})
+                                    {"scores": top_scores, "highest": high_score_manager.get_highest_score()},
+                                    audio_progress=audio_preload)
                 elif menu_state.active_menu == "instructions":
                     draw_instructions_screen(menu_state, mouse_x, mouse_y)
             else:  # GAME_STATE_GAME_OVER
-                final_score = abs(scroll_pos * 0.1) + beer_bonus_points
+                final_score = sim.score
                 top_scores = high_score_manager.get_top_scores()
 
                 if asking_for_name:
@@ -1122,61 +476,65 @@ def main():
 
         elif current_game_state == GAME_STATE_PLAYING:
             # --- Game Viewport (scaled) ---
+            # Desenha o estado interpolado entre os dois últimos ticks da simulação
+            alpha = timestep.alpha
+            render_scroll_pos = sim.prev_scroll_pos + (sim.scroll_pos - sim.prev_scroll_pos) * alpha
             # Usar a mesma função para desenhar os elementos do jogo na tela de pausa
-            draw_game_elements(game_vp, base_game_width, base_height, scroll_pos, holes, oil_stains, beer_collectibles,
-                               score_indicators, invulnerability_powerups, player_truck, enemies_up, enemies_down,
-                               police_car, slowmotion_powerups)
+            draw_game_elements(game_vp, base_game_width, base_height, render_scroll_pos, sim.holes, sim.oil_stains,
+                               sim.beer_collectibles, sim.score_indicators, sim.invulnerability_powerups, sim.truck,
+                               sim.enemies_up, sim.enemies_down, sim.police_car, sim.slowmotion_powerups, alpha)
 
             # --- Debug: Desenha hitboxes se ativado ---
             if DEBUG_SHOW_HITBOXES:
                 # Hitbox do player truck (vermelho com área de colisão verde)
-                player_truck.draw_debug_hitbox()
+                sim.truck.draw_debug_hitbox()
 
                 # Hitboxes dos inimigos (azul com área de colisão amarela)
-                for enemy in enemies_up:
+                for enemy in sim.enemies_up:
                     enemy.draw_debug_hitbox()
-                for enemy in enemies_down:
+                for enemy in sim.enemies_down:
                     enemy.draw_debug_hitbox()
                 
                 # Hitboxes das cervejas (laranja com área de colisão ciano)
-                for beer in beer_collectibles:
+                for beer in sim.beer_collectibles:
                     beer.draw_debug_hitbox()
                 
                 # Hitboxes da polícia (azul com área de colisão azul brilhante)
-                if police_car:
-                    police_car.draw_debug_hitbox()
+                if sim.police_car:
+                    sim.police_car.draw_debug_hitbox()
                 
                 # Hitboxes dos buracos (marrom com área de colisão laranja)
-                for hole in holes:
+                for hole in sim.holes:
                     hole.draw_debug_hitbox()
                 
                 # Hitboxes das manchas de óleo (roxo com área de colisão magenta)
-                for oil in oil_stains:
+                for oil in sim.oil_stains:
                     oil.draw_debug_hitbox()
                 
                 # Hitboxes dos power-ups de invulnerabilidade (verde com área de colisão verde brilhante)
-                for powerup in invulnerability_powerups:
+                for powerup in sim.invulnerability_powerups:
                     powerup.draw_debug_hitbox()
 
                 # Hitboxes dos power-ups de slow motion (roxo com área de colisão roxa brilhante)
-                for powerup in slowmotion_powerups:
+                for powerup in sim.slowmotion_powerups:
                     powerup.draw_debug_hitbox()
 
             # --- Panel Viewport (scaled) ---
-            time_elapsed, base_speed = setup_panel_viewport(panel_vp, base_panel_width, base_height, PANEL_WIDTH,
-                                                            SCREEN_HEIGHT, COLOR_PANEL, scroll_speed)
-            if player_truck.slowed_down:
+            base_speed = setup_panel_viewport(panel_vp, base_panel_width, base_height, sim.scroll_speed)
+            time_elapsed = sim.clock()
+            hud_panel.add_rect(0, 0, PANEL_WIDTH, SCREEN_HEIGHT, COLOR_PANEL)
+            if sim.truck.slowed_down:
                 # Usa o fator de velocidade atual que muda gradualmente
-                displayed_speed = base_speed * player_truck.current_speed_factor
+                displayed_speed = base_speed * sim.truck.current_speed_factor
             else:
                 displayed_speed = base_speed
 
-            score, lives_x = draw_panel_stats(scroll_pos, beer_bonus_points, time_elapsed, displayed_speed, SCREEN_HEIGHT)
+            score, lives_x = hud_panel.add_stats(sim.scroll_pos, sim.beer_bonus_points, time_elapsed, displayed_speed, SCREEN_HEIGHT)
 
-            for i in range(player_truck.lives):
-                if player_truck.invulnerable:
+            for i in range(sim.truck.lives):
+                if sim.truck.invulnerable:
                     # Pisca durante invulnerabilidade
-                    blink = int(time.time() * 6) % 2
+                    blink = int(time_elapsed * 6) % 2
                     if blink:
                         color = (1.0, 1.0, 0.3)  # Amarelo
                     else:
@@ -1184,14 +542,11 @@ def main():
                 else:
                     color = (1.0, 0.3, 0.3)  # Vermelho normal
 
-                draw_heart(lives_x + i * 25, SCREEN_HEIGHT - 95, size=10, color=color, filled=True)
+                hud_panel.add_heart(lives_x + i * 25, SCREEN_HEIGHT - 95, size=10, color=color, filled=True)
 
             # Desenha corações vazios para vidas perdidas
-            for i in range(player_truck.lives, 3):
-                draw_heart(lives_x + i * 25, SCREEN_HEIGHT - 95, size=10, color=(0.5, 0.5, 0.5), filled=False)
-
-            # Reseta a cor para branco
-            glColor3f(1.0, 1.0, 1.0)
+            for i in range(sim.truck.lives, 3):
+                hud_panel.add_heart(lives_x + i * 25, SCREEN_HEIGHT - 95, size=10, color=(0.5, 0.5, 0.5), filled=False)
 
             title_y = SCREEN_HEIGHT - 130
 
@@ -1224,91 +579,95 @@ def main():
             group_spacing = 44
 
             # Scroll Speed
-            draw_text("Scroll (F1 / F2)", label_x, y0)
-            draw_text(f"x{ss:.2f}", label_x, y0 - line_height)
+            hud_panel.add_text("Scroll (F1 / F2)", label_x, y0)
+            hud_panel.add_text(f"x{ss:.2f}", label_x, y0 - line_height)
             y0 -= group_spacing
 
             # Spawn Rate
-            draw_text("Spawn (F3 / F4)", label_x, y0)
-            draw_text(f"x{sr:.2f}", label_x, y0 - line_height)
-            draw_text("menor = mais freq.", label_x, y0 - line_height * 2)
+            hud_panel.add_text("Spawn (F3 / F4)", label_x, y0)
+            hud_panel.add_text(f"x{sr:.2f}", label_x, y0 - line_height)
+            hud_panel.add_text("menor = mais freq.", label_x, y0 - line_height * 2)
             y0 -= group_spacing + 20
 
             # Enemy Speed
-            draw_text("Enemy (F5 / F6)", label_x, y0)
-            draw_text(f"x{es:.2f}", label_x, y0 - line_height)
+            hud_panel.add_text("Enemy (F5 / F6)", label_x, y0)
+            hud_panel.add_text(f"x{es:.2f}", label_x, y0 - line_height)
             y0 -= group_spacing
             
             # Hole Spawn Probability
-            draw_text("Buracos (F8 / F9)", label_x, y0)
-            draw_text(f"{hs:.2f} prob.", label_x, y0 - line_height)
+            hud_panel.add_text("Buracos (F8 / F9)", label_x, y0)
+            hud_panel.add_text(f"{hs:.2f} prob.", label_x, y0 - line_height)
             y0 -= group_spacing
             
             # Oil Stain Spawn Probability
             oil_prob = difficulty_info.get("oil_stain_spawn_probability", 0.0)
             max_os = difficulty_manager.max_oil_stain_spawn_probability
             clamp01(oil_prob / max_os)
-            draw_text("Óleo (F10 / F11)", label_x, y0)
-            draw_text(f"{oil_prob:.2f} prob.", label_x, y0 - line_height)
+            hud_panel.add_text("Óleo (F10 / F11)", label_x, y0)
+            hud_panel.add_text(f"{oil_prob:.2f} prob.", label_x, y0 - line_height)
             y0 -= group_spacing
             
             # Invulnerability Power-Up Spawn Probability
             inv_prob = difficulty_info.get("invulnerability_spawn_probability", 0.0)
             max_inv = difficulty_manager.max_invulnerability_spawn_probability
             clamp01(inv_prob / max_inv)
-            draw_text("Invuln (F12 / Ins)", label_x, y0)
-            draw_text(f"{inv_prob:.2f} prob.", label_x, y0 - line_height)
+            hud_panel.add_text("Invuln (F12 / Ins)", label_x, y0)
+            hud_panel.add_text(f"{inv_prob:.2f} prob.", label_x, y0 - line_height)
             y0 -= group_spacing
 
             # Beer Spawn Probability
             beer_prob = difficulty_info.get("beer_spawn_probability", 0.0)
             max_beer = difficulty_manager.max_beer_spawn_probability
             clamp01(beer_prob / max_beer)
-            draw_text("Cerveja (B / V)", label_x, y0)
-            draw_text(f"{beer_prob:.2f} prob.", label_x, y0 - line_height)
+            hud_panel.add_text("Cerveja (B / V)", label_x, y0)
+            hud_panel.add_text(f"{beer_prob:.2f} prob.", label_x, y0 - line_height)
             y0 -= group_spacing
 
             # Slow Motion Power-Up Spawn Probability
             slow_prob = difficulty_info.get("slowmotion_spawn_probability", 0.0)
             max_slow = difficulty_manager.max_slowmotion_spawn_probability
             slow_norm = clamp01(slow_prob / max_slow)
-            draw_text("SlowMo (N / M)", label_x, y0)
-            draw_text(f"{slow_prob:.2f} prob.", label_x, y0 - line_height)
+            hud_panel.add_text("SlowMo (N / M)", label_x, y0)
+            hud_panel.add_text(f"{slow_prob:.2f} prob.", label_x, y0 - line_height)
             y0 -= group_spacing
 
             # Slow Motion Status
-            if slowmotion_effect.is_active():
-                remaining_time = slowmotion_effect.get_remaining_time()
-                draw_text("SLOW MOTION", label_x, y0)
-                draw_text(f"{remaining_time:.1f}s", label_x, y0 - line_height)
+            if sim.slowmotion_effect.is_active():
+                remaining_time = sim.slowmotion_effect.get_remaining_time(time_elapsed)
+                hud_panel.add_text("SLOW MOTION", label_x, y0)
+                hud_panel.add_text(f"{remaining_time:.1f}s", label_x, y0 - line_height)
                 y0 -= group_spacing
 
             # Mode / ajuda de teclas
             mode_text = "MODE: MANUAL (F7)" if difficulty_info['manual_control'] else "MODE: AUTO (F7)"
-            draw_text(mode_text, 12, y0)
+            hud_panel.add_text(mode_text, 12, y0)
+
+            # O painel só é redesenhado na textura quando algum valor exibido muda
+            hud_panel.draw(panel_vp, base_panel_width, base_height)
 
         elif current_game_state == GAME_STATE_PAUSED:
             # --- 1. DESENHA O JOGO PAUSADO NO FUNDO ---
             # A lógica de desenho é a mesma do estado 'PLAYING', mas sem a lógica de update.
 
             # --- Game Viewport (scaled) ---
-            draw_game_elements(game_vp, base_game_width, base_height, scroll_pos, holes, oil_stains, beer_collectibles,
-                               score_indicators, invulnerability_powerups, player_truck, enemies_up, enemies_down,
-                               police_car, slowmotion_powerups)
+            draw_game_elements(game_vp, base_game_width, base_height, sim.scroll_pos, sim.holes, sim.oil_stains, sim.beer_collectibles,
+                               sim.score_indicators, sim.invulnerability_powerups, sim.truck, sim.enemies_up, sim.enemies_down,
+                               sim.police_car, sim.slowmotion_powerups)
 
 
 
             # --- Panel Viewport (scaled) ---
-            time_elapsed, base_speed = setup_panel_viewport(panel_vp, base_panel_width, base_height, PANEL_WIDTH,
-                                                            SCREEN_HEIGHT, COLOR_PANEL, scroll_speed)
-
-            displayed_speed = base_speed * player_truck.current_speed_factor if player_truck.slowed_down else base_speed
-            score, lives_x = draw_panel_stats(scroll_pos, beer_bonus_points, time_elapsed, displayed_speed, SCREEN_HEIGHT)
-            for i in range(player_truck.lives):
-                draw_heart(lives_x + i * 25, SCREEN_HEIGHT - 95, size=10, color=(1.0, 0.3, 0.3), filled=True)
-            for i in range(player_truck.lives, 3):
-                draw_heart(lives_x + i * 25, SCREEN_HEIGHT - 95, size=10, color=(0.5, 0.5, 0.5), filled=False)
-            glColor3f(1.0, 1.0, 1.0)
+            base_speed = setup_panel_viewport(panel_vp, base_panel_width, base_height, sim.scroll_speed)
+            time_elapsed = sim.clock()
+            hud_panel.add_rect(0, 0, PANEL_WIDTH, SCREEN_HEIGHT, COLOR_PANEL)
+
+            displayed_speed = base_speed * sim.truck.current_speed_factor if sim.truck.slowed_down else base_speed
+            score, lives_x = hud_panel.add_stats(sim.scroll_pos, sim.beer_bonus_points, time_elapsed, displayed_speed, SCREEN_HEIGHT)
+            for i in range(sim.truck.lives):
+                hud_panel.add_heart(lives_x + i * 25, SCREEN_HEIGHT - 95, size=10, color=(1.0, 0.3, 0.3), filled=True)
+            for i in range(sim.truck.lives, 3):
+                hud_panel.add_heart(lives_x + i * 25, SCREEN_HEIGHT - 95, size=10, color=(0.5, 0.5, 0.5), filled=False)
+            hud_panel.draw(panel_vp, base_panel_width, base_height)
 
             # --- 2. DESENHA O MENU DE PAUSA POR CIMA ---
             # Configura a viewport para cobrir toda a área de conteúdo
@@ -1319,6 +678,12 @@ def main():
 
         glfw.swap_buffers(window)
 
+        # Limite opcional de FPS (além do vsync)
+        if MAX_FPS > 0:
+            remaining = frame_start + 1.0 / MAX_FPS - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+
     glfw.terminate()
 
 
@@ -1,40 +1,74 @@
-from OpenGL.GL import *
+from src.game.entities.hitbox import HitboxMixin
+from src.game.entity_store import StoreField
+from src.graphics.sprite_batch import draw_sprite
 
-class DrawableGameObject:
+
+class InterpolatedPosition:
+    """
+    Guarda a posição do tick anterior da simulação para que o desenho possa interpolar
+    entre os dois últimos ticks (alpha = fração do próximo tick já decorrida).
+    """
+
+    def save_previous_position(self):
+        """Chamado no início de cada tick, antes de mover o objeto."""
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def get_render_position(self, alpha=1.0):
+        """Posição interpolada entre o tick anterior e o atual."""
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+
+
+class DrawableGameObject(InterpolatedPosition, HitboxMixin):
     """
     Classe base para objetos do jogo que podem ser desenhados na tela.
     Fornece funcionalidade comum de renderização para reduzir duplicação de código.
+
+    Os campos abaixo passam a morar nos arrays do EntityStore quando o objeto é adicionado a um
+    (ver src/game/entity_store.py); fora dele se comportam como atributos comuns.
     """
-    def __init__(self, texture_id, x, y, width, height):
-        self.texture_id = texture_id
+    _store = None
+    _slot = -1
+
+    x = StoreField()
+    y = StoreField()
+    prev_x = StoreField()
+    prev_y = StoreField()
+    width = StoreField()
+    height = StoreField()
+    speed_y = StoreField()
+    lane_index = StoreField()
+    active = StoreField()
+    crashed = StoreField()
+
+    def __init__(self, sprite, x, y, width, height):
+        self.sprite = sprite
         self.x = x
         self.y = y
         self.width = width
         self.height = height
         self.active = True
+        self.save_previous_position()
 
-    def draw(self):
-        """Desenha o objeto na tela usando sua textura."""
-        if not self.active:
-            return
-
-        glEnable(GL_TEXTURE_2D)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+    def reinit(self, *args, **kwargs):
+        """Reaproveita um objeto devolvido ao pool (ver ObjectPool) com os argumentos do construtor."""
+        self.__init__(*args, **kwargs)
 
-        glBindTexture(GL_TEXTURE_2D, self.texture_id)
-
-        # Garante que a cor está resetada
-        glColor4f(1.0, 1.0, 1.0, 1.0)
+    def draw(self, alpha=1.0):
+        """Desenha o objeto na tela usando sua textura, na posição interpolada."""
+        store = self._store
+        if store is not None:
+            # No store, as posições interpoladas de todas as entidades são calculadas de uma vez
+            xs, ys, widths, heights, active = store.render_rects(alpha)
+            slot = self._slot
+            if active[slot]:
+                draw_sprite(self.sprite, xs[slot], ys[slot], widths[slot], heights[slot])
+            return
 
-        glBegin(GL_QUADS)
-        glTexCoord2f(0, 1); glVertex2f(self.x, self.y)
-        glTexCoord2f(1, 1); glVertex2f(self.x + self.width, self.y)
-        glTexCoord2f(1, 0); glVertex2f(self.x + self.width, self.y + self.height)
-        glTexCoord2f(0, 0); glVertex2f(self.x, self.y + self.height)
-        glEnd()
+        if not self.active:
+            return
 
-        # Reseta a cor para não afetar outros elementos
-        glColor4f(1.0, 1.0, 1.0, 1.0)
-        glDisable(GL_BLEND)
-        glDisable(GL_TEXTURE_2D)
+        # Enfileira no SpriteBatch ativo (ou desenha imediatamente se não houver um)
+        x, y = self.get_render_position(alpha)
+        draw_sprite(self.sprite, x, y, self.width, self.height)
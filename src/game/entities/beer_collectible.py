@@ -1,13 +1,16 @@
 import random
 
 from src.game.entities.base_drawable import DrawableGameObject
+from src.game.entities.hitbox import hitboxes_overlap, BEER_HITBOX_SHRINK
 from src.game.entities.road import ROAD_WIDTH, GAME_WIDTH, SCREEN_HEIGHT, LANE_WIDTH, LANE_COUNT_PER_DIRECTION, \
     PLAYER_SPEED
-from src.utils.debug_utils import draw_hitbox, draw_real_hitbox
+from src.utils.debug_utils import draw_hitbox, draw_collision_hitbox
 
 
 class BeerCollectible(DrawableGameObject):
-    def __init__(self, texture_id, lane_index=None, speed_multiplier=1.0):
+    HITBOX_SHRINK = BEER_HITBOX_SHRINK
+
+    def __init__(self, sprite, lane_index=None, speed_multiplier=1.0):
         """Inicializa as propriedades do objeto de cerveja coletável."""
         # Tamanho do objeto de cerveja - aumentado horizontalmente
         width = LANE_WIDTH * 0.8  # 80% da largura da faixa (era 50%)
@@ -32,7 +35,7 @@ class BeerCollectible(DrawableGameObject):
         y = SCREEN_HEIGHT
 
         # Chama o construtor da classe base
-        super().__init__(texture_id, x, y, width, height)
+        super().__init__(sprite, x, y, width, height)
 
     def update(self, scroll_speed=None):
         """Move o objeto de cerveja para baixo usando a velocidade atual do scrolling."""
@@ -49,26 +52,7 @@ class BeerCollectible(DrawableGameObject):
         """Verifica se o caminhão colidiu com o objeto de cerveja usando hitboxes mais precisas."""
         if not self.active:
             return False
-        
-        # Calcula a hitbox efetiva da cerveja (usando os mesmos valores do debug)
-        beer_hitbox_width = self.width / 1.4  # Aumentado de 2.5 para 1.4
-        beer_hitbox_height = self.height / 1.3  # Aumentado de 2.7 para 1.3
-        
-        beer_hitbox_x = self.x + (self.width - beer_hitbox_width) / 2
-        beer_hitbox_y = self.y + (self.height - beer_hitbox_height) / 2
-        
-        # Calcula a hitbox efetiva do caminhão (usando os mesmos valores do debug)
-        truck_hitbox_width = truck.width / 1.3  # Atualizado para coincidir com o truck.py
-        truck_hitbox_height = truck.height / 1.2  # Atualizado para coincidir com o truck.py
-        
-        truck_hitbox_x = truck.x + (truck.width - truck_hitbox_width) / 2
-        truck_hitbox_y = truck.y + (truck.height - truck_hitbox_height) / 2
-        
-        # Verifica sobreposição dos retângulos das hitboxes
-        return (beer_hitbox_x < truck_hitbox_x + truck_hitbox_width and
-                beer_hitbox_x + beer_hitbox_width > truck_hitbox_x and
-                beer_hitbox_y < truck_hitbox_y + truck_hitbox_height and
-                beer_hitbox_y + beer_hitbox_height > truck_hitbox_y)
+        return hitboxes_overlap(self.get_hitbox(), truck.get_pickup_hitbox())
 
     def draw_debug_hitbox(self, show_collision_area=True):
         """Desenha a hitbox de debug para visualização."""
@@ -80,15 +64,8 @@ class BeerCollectible(DrawableGameObject):
                    color=(1.0, 0.0, 0.0, 0.8), line_width=2)
         
         if show_collision_area:
-            # Calcula a hitbox REAL que é usada para colisão
-            beer_hitbox_width = self.width / 1.4
-            beer_hitbox_height = self.height / 1.3
-            beer_hitbox_x = self.x + (self.width - beer_hitbox_width) / 2
-            beer_hitbox_y = self.y + (self.height - beer_hitbox_height) / 2
-            
             # Desenha a hitbox REAL de colisão (amarelo brilhante para cerveja)
-            draw_real_hitbox(beer_hitbox_x, beer_hitbox_y, beer_hitbox_width, beer_hitbox_height,
-                           color=(1.0, 1.0, 0.0, 1.0))
+            draw_collision_hitbox(self.get_hitbox(), color=(1.0, 1.0, 0.0, 1.0))
 
     def collect(self):
         """Marca o objeto como coletado e retorna os pontos."""
@@ -1,14 +1,17 @@
 from OpenGL.GL import *
 import random
 from src.game.entities.road import ROAD_WIDTH, GAME_WIDTH, SCREEN_HEIGHT, LANE_WIDTH, LANE_COUNT_PER_DIRECTION, PLAYER_SPEED
-from src.utils.debug_utils import draw_hitbox, draw_collision_area, draw_real_hitbox
+from src.utils.debug_utils import draw_hitbox, draw_collision_area, draw_collision_hitbox
 from src.game.entities.base_drawable import DrawableGameObject
+from src.game.entities.hitbox import ENEMY_HITBOX_SHRINK
 
 
 class Enemy(DrawableGameObject):
-    def __init__(self, texture_id, dead_texture_id=None, is_up_lane=True, lane_index=None, speed_multiplier=1.0):
-        """Inicializa as propriedades do inimigo com uma textura específica."""
-        self.dead_texture_id = dead_texture_id
+    HITBOX_SHRINK = ENEMY_HITBOX_SHRINK
+
+    def __init__(self, sprite, dead_sprite=None, is_up_lane=True, lane_index=None, speed_multiplier=1.0, rng=random):
+        """Inicializa as propriedades do inimigo com uma textura específica (rng: gerador aleatório)."""
+        self.dead_sprite = dead_sprite
         self.width = 50
         self.height = 100
         self.speed_multiplier = speed_multiplier
@@ -18,66 +21,63 @@ class Enemy(DrawableGameObject):
         if lane_index is None:
             if is_up_lane:
                 # Faixas da direita (contramão)
-                self.lane_index = random.randint(LANE_COUNT_PER_DIRECTION, LANE_COUNT_PER_DIRECTION * 2 - 1)
+                self.lane_index = rng.randint(LANE_COUNT_PER_DIRECTION, LANE_COUNT_PER_DIRECTION * 2 - 1)
             else:
                 # Faixas da esquerda (mesma direção)
-                self.lane_index = random.randint(0, LANE_COUNT_PER_DIRECTION - 1)
+                self.lane_index = rng.randint(0, LANE_COUNT_PER_DIRECTION - 1)
         else:
             self.lane_index = lane_index
 
         if is_up_lane:
             # Velocidade ajustada para inimigos na contramão (menos rápida)
-            self.speed_y = random.uniform(0.02, 0.07) + (speed_multiplier * 0.03)
+            self.speed_y = rng.uniform(0.02, 0.07) + (speed_multiplier * 0.03)
         else:
             # Velocidade ajustada para inimigos na mesma direção (mais rápida)
-            self.speed_y = (PLAYER_SPEED + random.uniform(0.02, 0.1)) * speed_multiplier
+            self.speed_y = (PLAYER_SPEED + rng.uniform(0.02, 0.1)) * speed_multiplier
 
         lane_x_start = road_x_start_total + self.lane_index * LANE_WIDTH
         x = lane_x_start + (LANE_WIDTH - self.width) / 2
         y = SCREEN_HEIGHT
 
         # Chama o construtor da classe base
-        super().__init__(texture_id, x, y, self.width, self.height)
+        super().__init__(sprite, x, y, self.width, self.height)
 
-    def update(self, all_enemies, speed_multiplier=1.0):
-        """Move o inimigo e evita colisões com outros inimigos."""
+    def update(self, leader=None, speed_multiplier=1.0):
+        """
+        Move o inimigo sem passar por cima do carro da frente. leader é o carro logo à frente na
+        mesma faixa (ou None); dentro da simulação o EntityStore faz isso para todos de uma vez.
+        """
         if self.crashed:
             return
 
-        # Lógica para evitar passar por cima de outros inimigos
-        for other in all_enemies:
-            if self == other or self.lane_index != other.lane_index or other.crashed:
-                continue
-
-            # Verifica se 'other' está na frente e muito perto
-            if self.y > other.y:
-                distance = self.y - (other.y + other.height)
-                if distance < 10:  # Pequena distância de segurança
-                    # Reduz a velocidade para a do carro da frente
-                    if self.speed_y > other.speed_y:
-                        self.speed_y = other.speed_y
+        # Se está muito perto do carro da frente, reduz a velocidade para a dele
+        if leader is not None and not leader.crashed:
+            distance = self.y - (leader.y + leader.height)
+            if distance < 10:  # Pequena distância de segurança
+                if self.speed_y > leader.speed_y:
+                    self.speed_y = leader.speed_y
 
         # Aplica o multiplicador de velocidade adicional (usado quando o player está crashado)
         self.y -= self.speed_y * speed_multiplier
 
-    def draw(self):
+    def draw(self, alpha=1.0):
         """Desenha o inimigo na tela usando sua textura."""
         # Altera a textura a ser usada se o inimigo estiver crashado e tiver uma textura 'dead'
-        if self.crashed and self.dead_texture_id:
-            current_texture = self.dead_texture_id
+        if self.crashed and self.dead_sprite:
+            current_sprite = self.dead_sprite
             # Salva a textura original
-            original_texture = self.texture_id
+            original_sprite = self.sprite
             # Atualiza temporariamente a textura para desenhar
-            self.texture_id = current_texture
+            self.sprite = current_sprite
 
             # Chama o metodo draw da classe base
-            super().draw()
+            super().draw(alpha)
 
             # Restaura a textura original
-            self.texture_id = original_texture
+            self.sprite = original_sprite
         else:
             # Se não está crashado ou não tem textura de dead, usa o draw normal da classe base
-            super().draw()
+            super().draw(alpha)
 
 
     def draw_debug_hitbox(self, show_collision_area=True):
@@ -87,18 +87,12 @@ class Enemy(DrawableGameObject):
                    color=(0.0, 0.0, 1.0, 0.8), line_width=2)
         
         if show_collision_area:
-            # Calcula a hitbox REAL que é usada para colisão (igual ao truck)
-            enemy_hitbox_width = self.width / 1.3
-            enemy_hitbox_height = self.height / 1.05
-            enemy_hitbox_x = self.x + (self.width - enemy_hitbox_width) / 2
-            enemy_hitbox_y = self.y + (self.height - enemy_hitbox_height) / 2
-            
             # Desenha a hitbox REAL de colisão (magenta para inimigos)
-            draw_real_hitbox(enemy_hitbox_x, enemy_hitbox_y, enemy_hitbox_width, enemy_hitbox_height,
-                           color=(1.0, 0.0, 1.0, 1.0))
+            draw_collision_hitbox(self.get_hitbox(), color=(1.0, 0.0, 1.0, 1.0))
 
 
 class EnemyDown(Enemy):
-    def __init__(self, texture_id, dead_texture_id=None, lane_index=None, speed_multiplier=1.0):
+    def __init__(self, sprite, dead_sprite=None, lane_index=None, speed_multiplier=1.0, rng=random):
         """Inicializa um inimigo que aparece nas faixas da esquerda."""
-        super().__init__(texture_id, dead_texture_id, is_up_lane=False, lane_index=lane_index, speed_multiplier=speed_multiplier)
\ No newline at end of file
+        super().__init__(sprite, dead_sprite, is_up_lane=False, lane_index=lane_index, speed_multiplier=speed_multiplier,
+                         rng=rng)
\ No newline at end of file
@@ -0,0 +1,60 @@
+# --- Fatores de redução das hitboxes (largura, altura) ---
+# A hitbox é o sprite dividido por esses fatores, centralizada no sprite.
+TRUCK_HITBOX_SHRINK = (1.3, 1.1)
+TRUCK_PICKUP_HITBOX_SHRINK = (1.3, 1.2)  # Hitbox do caminhão usada pela cerveja e pelo slow motion
+ENEMY_HITBOX_SHRINK = (1.3, 1.05)
+POLICE_HITBOX_SHRINK = (1.3, 1.1)
+HOLE_HITBOX_SHRINK = (1.6, 1.5)
+OIL_STAIN_HITBOX_SHRINK = (1.2, 1.2)
+BEER_HITBOX_SHRINK = (1.4, 1.3)
+INVULNERABILITY_HITBOX_SHRINK = (1.1, 1.1)
+SLOWMOTION_HITBOX_SHRINK = (1.6, 1.6)
+
+
+class Hitbox:
+    """
+    Retângulo de colisão de uma entidade, guardado em floats (x, y, width, height).
+    Só é recalculado quando a posição ou o tamanho do dono mudam desde a última consulta.
+    """
+    __slots__ = ("shrink_x", "shrink_y", "x", "y", "width", "height", "_source")
+
+    def __init__(self, shrink_x, shrink_y):
+        self.shrink_x = shrink_x
+        self.shrink_y = shrink_y
+        self.x = self.y = self.width = self.height = 0.0
+        self._source = None
+
+    def update(self, x, y, width, height):
+        source = (x, y, width, height)
+        if source != self._source:
+            self._source = source
+            hitbox_width = width / self.shrink_x
+            hitbox_height = height / self.shrink_y
+            self.x = x + (width - hitbox_width) / 2
+            self.y = y + (height - hitbox_height) / 2
+            self.width = hitbox_width
+            self.height = hitbox_height
+        return self
+
+    def overlaps(self, other):
+        return hitboxes_overlap(self, other)
+
+
+def hitboxes_overlap(a, b):
+    """Teste de sobreposição usado por todas as colisões entre hitboxes."""
+    return (a.x < b.x + b.width and
+            a.x + a.width > b.x and
+            a.y < b.y + b.height and
+            a.y + a.height > b.y)
+
+
+class HitboxMixin:
+    """Dá a uma entidade a hitbox cacheada get_hitbox(), com os fatores de HITBOX_SHRINK da classe."""
+    HITBOX_SHRINK = (1.0, 1.0)
+
+    def get_hitbox(self):
+        try:
+            hitbox = self._hitbox
+        except AttributeError:
+            hitbox = self._hitbox = Hitbox(*self.HITBOX_SHRINK)
+        return hitbox.update(self.x, self.y, self.width, self.height)
@@ -1,14 +1,17 @@
 import random
 
 from src.game.entities.base_drawable import DrawableGameObject
+from src.game.entities.hitbox import HOLE_HITBOX_SHRINK
 from src.game.entities.road import ROAD_WIDTH, GAME_WIDTH, SCREEN_HEIGHT, LANE_WIDTH, LANE_COUNT_PER_DIRECTION, \
     PLAYER_SPEED
 from src.utils.collision_utils import check_rect_collision
-from src.utils.debug_utils import draw_hitbox, draw_real_hitbox
+from src.utils.debug_utils import draw_hitbox, draw_collision_hitbox
 
 
 class Hole(DrawableGameObject):
-    def __init__(self, texture_id, lane_index=None, speed_multiplier=1.0):
+    HITBOX_SHRINK = HOLE_HITBOX_SHRINK
+
+    def __init__(self, sprite, lane_index=None, speed_multiplier=1.0):
         """Inicializa as propriedades do buraco na pista."""
         # Tamanho aumentado para ocupar mais da faixa, mas sem exagero
         width = LANE_WIDTH * 0.75  # 75% da largura da faixa
@@ -32,7 +35,7 @@ class Hole(DrawableGameObject):
         y = SCREEN_HEIGHT
 
         # Chama o construtor da classe base
-        super().__init__(texture_id, x, y, width, height)
+        super().__init__(sprite, x, y, width, height)
 
     def update(self, scroll_speed=None):
         """Move o buraco para baixo usando a velocidade atual do scrolling."""
@@ -73,12 +76,5 @@ class Hole(DrawableGameObject):
                     color=(0.6, 0.3, 0.0, 0.8), line_width=2)
 
         if show_collision_area:
-            # Para buracos, usa a área completa como hitbox (pode ser ajustado)
-            hole_hitbox_width = self.width / 1.6  # ← VOCÊ PODE ALTERAR AQUI
-            hole_hitbox_height = self.height / 1.5  # ← VOCÊ PODE ALTERAR AQUI
-            hole_hitbox_x = self.x + (self.width - hole_hitbox_width) / 2
-            hole_hitbox_y = self.y + (self.height - hole_hitbox_height) / 2
-
             # Desenha a hitbox REAL de colisão (marrom brilhante para buraco)
-            draw_real_hitbox(hole_hitbox_x, hole_hitbox_y, hole_hitbox_width, hole_hitbox_height,
-                             color=(1.0, 0.5, 0.0, 1.0))
+            draw_collision_hitbox(self.get_hitbox(), color=(1.0, 0.5, 0.0, 1.0))
@@ -1,13 +1,16 @@
 import random
 
 from src.game.entities.base_drawable import DrawableGameObject
+from src.game.entities.hitbox import INVULNERABILITY_HITBOX_SHRINK
 from src.game.entities.road import ROAD_WIDTH, GAME_WIDTH, SCREEN_HEIGHT, LANE_WIDTH, LANE_COUNT_PER_DIRECTION, \
     PLAYER_SPEED
-from src.utils.debug_utils import draw_hitbox, draw_real_hitbox
+from src.utils.debug_utils import draw_hitbox, draw_collision_hitbox
 
 
 class InvulnerabilityPowerUp(DrawableGameObject):
-    def __init__(self, texture_id, lane_index=None, speed_multiplier=1.0):
+    HITBOX_SHRINK = INVULNERABILITY_HITBOX_SHRINK
+
+    def __init__(self, sprite, lane_index=None, speed_multiplier=1.0):
         """Inicializa as propriedades do power-up de invulnerabilidade na pista."""
         # Tamanho do power-up, similar aos outros elementos
         width = LANE_WIDTH * 0.6  # 60% da largura da faixa
@@ -31,7 +34,7 @@ class InvulnerabilityPowerUp(DrawableGameObject):
         y = SCREEN_HEIGHT
 
         # Chama o construtor da classe base
-        super().__init__(texture_id, x, y, width, height)
+        super().__init__(sprite, x, y, width, height)
 
     def update(self, scroll_speed=None):
         """Move o power-up para baixo usando a velocidade atual do scrolling."""
@@ -54,12 +57,5 @@ class InvulnerabilityPowerUp(DrawableGameObject):
                     color=(0.0, 1.0, 0.0, 0.8), line_width=2)
 
         if show_collision_area:
-            # Calcula a hitbox REAL que é usada para colisão
-            powerup_hitbox_width = self.width / 1.1  # ← VOCÊ PODE ALTERAR AQUI
-            powerup_hitbox_height = self.height / 1.1  # ← VOCÊ PODE ALTERAR AQUI
-            powerup_hitbox_x = self.x + (self.width - powerup_hitbox_width) / 2
-            powerup_hitbox_y = self.y + (self.height - powerup_hitbox_height) / 2
-
             # Desenha a hitbox REAL de colisão (verde brilhante para power-up)
-            draw_real_hitbox(powerup_hitbox_x, powerup_hitbox_y, powerup_hitbox_width, powerup_hitbox_height,
-                             color=(0.0, 1.0, 0.0, 1.0))
+            draw_collision_hitbox(self.get_hitbox(), color=(0.0, 1.0, 0.0, 1.0))
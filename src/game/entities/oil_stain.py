@@ -1,14 +1,17 @@
 import random
 
 from src.game.entities.base_drawable import DrawableGameObject
+from src.game.entities.hitbox import OIL_STAIN_HITBOX_SHRINK
 from src.game.entities.road import ROAD_WIDTH, GAME_WIDTH, SCREEN_HEIGHT, LANE_WIDTH, LANE_COUNT_PER_DIRECTION, \
     PLAYER_SPEED
 from src.utils.collision_utils import check_rect_collision
-from src.utils.debug_utils import draw_hitbox, draw_real_hitbox
+from src.utils.debug_utils import draw_hitbox, draw_collision_hitbox
 
 
 class OilStain(DrawableGameObject):
-    def __init__(self, texture_id, lane_index=None, speed_multiplier=1.0):
+    HITBOX_SHRINK = OIL_STAIN_HITBOX_SHRINK
+
+    def __init__(self, sprite, lane_index=None, speed_multiplier=1.0):
         """Inicializa as propriedades da mancha de óleo na pista."""
         # Tamanho da mancha de óleo, um pouco menor que o buraco
         width = LANE_WIDTH * 0.7  # 70% da largura da faixa
@@ -32,7 +35,7 @@ class OilStain(DrawableGameObject):
         y = SCREEN_HEIGHT
 
         # Chama o construtor da classe base
-        super().__init__(texture_id, x, y, width, height)
+        super().__init__(sprite, x, y, width, height)
 
     def update(self, scroll_speed=None):
         """Move a mancha de óleo para baixo usando a velocidade atual do scrolling."""
@@ -73,12 +76,5 @@ class OilStain(DrawableGameObject):
                     color=(0.5, 0.0, 0.5, 0.8), line_width=2)
 
         if show_collision_area:
-            # Para óleo, usa uma hitbox ligeiramente menor
-            oil_hitbox_width = self.width / 1.2  # ← VOCÊ PODE ALTERAR AQUI
-            oil_hitbox_height = self.height / 1.2  # ← VOCÊ PODE ALTERAR AQUI
-            oil_hitbox_x = self.x + (self.width - oil_hitbox_width) / 2
-            oil_hitbox_y = self.y + (self.height - oil_hitbox_height) / 2
-
             # Desenha a hitbox REAL de colisão (roxo brilhante para óleo)
-            draw_real_hitbox(oil_hitbox_x, oil_hitbox_y, oil_hitbox_width, oil_hitbox_height,
-                             color=(1.0, 0.0, 1.0, 1.0))
+            draw_collision_hitbox(self.get_hitbox(), color=(1.0, 0.0, 1.0, 1.0))
@@ -1,29 +1,29 @@
 import random
 import threading
 
-from OpenGL.GL import *
-
-import src.game.managers.audio_manager as audio_manager
+from src.game.entities.base_drawable import InterpolatedPosition
+from src.game.entities.hitbox import HitboxMixin, hitboxes_overlap, POLICE_HITBOX_SHRINK
 from src.game.entities.road import ROAD_WIDTH, GAME_WIDTH, PLAYER_SPEED
-from src.utils.debug_utils import draw_hitbox, draw_real_hitbox
-
+from src.game.managers.sound_manifest import SOUND_CRASH
+from src.graphics.sprite_batch import draw_sprite
+from src.utils.debug_utils import draw_hitbox, draw_collision_hitbox
 
-def preload_police_sound(path, create_loop=True):
-    return audio_manager.preload_sound(path, create_loop=create_loop)
 
-def get_preloaded_police_sounds(path):
-    return audio_manager.get_preloaded_sounds(path)
+class PoliceCar(InterpolatedPosition, HitboxMixin):
+    HITBOX_SHRINK = POLICE_HITBOX_SHRINK
 
-class PoliceCar:
-    def __init__(self, textures, sound_path=None, sound_loop=True):
+    def __init__(self, sprites, sound_id=None, sound_loop=True, audio=None, rng=random):
         """
         Inicializa o carro da polícia.
-        textures: Dicionário com 'normal_1', 'normal_2', 'dead'.
-        sound_path: caminho para o arquivo WAV.
+        sprites: Dicionário de regiões do atlas com 'normal_1', 'normal_2', 'dead'.
+        sound_id: id da sirene no manifesto de sons (sound_manifest).
         sound_loop: se True, reproduz a versão de loop após o segmento inicial.
+        audio: backend de áudio (o módulo audio_manager ou um NullAudio); None desativa o som.
+        rng: gerador de números aleatórios (módulo random ou random.Random).
         """
-        self.textures = textures
-        self.current_texture_id = self.textures['normal_1']
+        self.audio = audio
+        self.sprites = sprites
+        self.current_sprite = self.sprites['normal_1']
 
         self.width = 50
         self.height = 100
@@ -31,8 +31,9 @@ class PoliceCar:
         # Inicia fora da tela
         road_x_start = (GAME_WIDTH - ROAD_WIDTH) / 2
         road_x_end = road_x_start + ROAD_WIDTH - self.width
-        self.x = random.uniform(road_x_start, road_x_end)
+        self.x = rng.uniform(road_x_start, road_x_end)
         self.y = -self.height
+        self.save_previous_position()
 
         self.speed_y = 0.12
         self.chase_speed_x = 0.08
@@ -43,48 +44,30 @@ class PoliceCar:
         self.animation_speed = 100
 
         # Áudio
-        self.sound_path = sound_path
+        self.sound_id = sound_id
         self._player = None
         self._player_lock = threading.Lock()
 
-        if self.sound_path:
+        if self.sound_id and self.audio:
             try:
-                self._player = audio_manager.SoundPlayer(self.sound_path, use_loop=sound_loop, volume=0.7)
-                self._player.start()
+                self._player = self.audio.play_sound(self.sound_id, loop=sound_loop)
             except Exception as e:
                 print(f"Failed to start police sound: {e}")
 
-    def draw(self):
-        """Desenha o carro da polícia na tela."""
-        glEnable(GL_TEXTURE_2D)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-
-        current_texture = self.textures['dead'] if self.crashed else self.current_texture_id
-        glBindTexture(GL_TEXTURE_2D, current_texture)
-
-        glBegin(GL_QUADS)
-        glTexCoord2f(0, 1)
-        glVertex2f(self.x, self.y)
-        glTexCoord2f(1, 1)
-        glVertex2f(self.x + self.width, self.y)
-        glTexCoord2f(1, 0)
-        glVertex2f(self.x + self.width, self.y + self.height)
-        glTexCoord2f(0, 0)
-        glVertex2f(self.x, self.y + self.height)
-        glEnd()
-
-        glDisable(GL_TEXTURE_2D)
-        glDisable(GL_BLEND)
-
-    def _animate(self):
-        self.animation_timer += 1
+    def draw(self, alpha=1.0):
+        """Desenha o carro da polícia na tela, na posição interpolada."""
+        current_sprite = self.sprites['dead'] if self.crashed else self.current_sprite
+        x, y = self.get_render_position(alpha)
+        draw_sprite(current_sprite, x, y, self.width, self.height)
+
+    def _animate(self, time_scale=1.0):
+        self.animation_timer += time_scale
         if self.animation_timer > self.animation_speed:
             self.animation_timer = 0
-            if self.current_texture_id == self.textures['normal_1']:
-                self.current_texture_id = self.textures['normal_2']
+            if self.current_sprite == self.sprites['normal_1']:
+                self.current_sprite = self.sprites['normal_2']
             else:
-                self.current_texture_id = self.textures['normal_1']
+                self.current_sprite = self.sprites['normal_1']
 
     def _is_playing(self):
         try:
@@ -111,24 +94,17 @@ class PoliceCar:
         finally:
             self._player = None
 
+    def _play_crash_sound(self):
+        if not self.audio:
+            return
+        try:
+            self.audio.play_sound(SOUND_CRASH)
+        except Exception as e:
+            print(f"Failed to play crash sound for police: {e}")
+
     def _check_rear_end_collision(self, target):
-        # Calcula as hitboxes efetivas da polícia
-        police_hitbox_width = self.width / 1.3  # Ajustável
-        police_hitbox_height = self.height / 1.1  # ← SINCRONIZADO COM O CAMINHÃO
-        police_hitbox_x = self.x + (self.width - police_hitbox_width) / 2
-        police_hitbox_y = self.y + (self.height - police_hitbox_height) / 2
-        
-        # Calcula as hitboxes efetivas do alvo
-        target_hitbox_width = target.width / 1.3
-        target_hitbox_height = target.height / 1.1  # ← SINCRONIZADO COM O CAMINHÃO
-        target_hitbox_x = target.x + (target.width - target_hitbox_width) / 2
-        target_hitbox_y = target.y + (target.height - target_hitbox_height) / 2
-        
-        # Verifica sobreposição das hitboxes
-        return (police_hitbox_x < target_hitbox_x + target_hitbox_width and
-                police_hitbox_x + police_hitbox_width > target_hitbox_x and
-                police_hitbox_y < target_hitbox_y + target_hitbox_height and
-                police_hitbox_y + police_hitbox_height > target_hitbox_y)
+        # Compara com a hitbox do próprio alvo (caminhão ou inimigo)
+        return hitboxes_overlap(self.get_hitbox(), target.get_hitbox())
 
     def draw_debug_hitbox(self, show_collision_area=True):
         """Desenha a hitbox de debug para visualização."""
@@ -137,26 +113,25 @@ class PoliceCar:
                    color=(0.0, 0.0, 1.0, 0.8), line_width=2)
         
         if show_collision_area:
-            # Calcula a hitbox REAL que é usada para colisão
-            police_hitbox_width = self.width / 1.3  # ← VOCÊ PODE ALTERAR AQUI
-            police_hitbox_height = self.height / 1.1  # ← SINCRONIZADO COM A COLISÃO REAL
-            police_hitbox_x = self.x + (self.width - police_hitbox_width) / 2
-            police_hitbox_y = self.y + (self.height - police_hitbox_height) / 2
-            
             # Desenha a hitbox REAL de colisão (azul brilhante para polícia)
-            draw_real_hitbox(police_hitbox_x, police_hitbox_y, police_hitbox_width, police_hitbox_height,
-                           color=(0.0, 0.5, 1.0, 1.0))
+            draw_collision_hitbox(self.get_hitbox(), color=(0.0, 0.5, 1.0, 1.0))
 
-    def update(self, player_truck, all_enemies, scroll_speed):
+    def update(self, player_truck, find_enemies_near, scroll_speed, time_scale=1.0):
+        """
+        Avança a polícia. time_scale é quantos frames de referência este passo representa
+        (as velocidades são por frame; ver SIMULATION_HZ em src/game/simulation.py).
+        find_enemies_near(x, y, largura, altura) devolve os inimigos cujo sprite encosta no retângulo
+        dado (em ordem de slot); só eles podem ser atingidos por trás pela polícia.
+        """
         if self.crashed:
             try:
                 self.stop_audio()
             except Exception:
                 pass
-            self.y += scroll_speed
+            self.y += scroll_speed * time_scale
             return None
 
-        self._animate()
+        self._animate(time_scale)
 
         # Extrai o multiplicador de velocidade do scroll_speed se for diferente do valor padrão
         speed_multiplier = 1.0
@@ -165,9 +140,12 @@ class PoliceCar:
             speed_multiplier = abs(scroll_speed / default_scroll)
 
         # Movimento vertical e perseguição horizontal com velocidade ajustada
-        self.y += self.speed_y * speed_multiplier
+        self.y += self.speed_y * speed_multiplier * time_scale
         target_x = player_truck.x
-        self.x += (target_x - self.x) * self.chase_speed_x * speed_multiplier
+        # A perseguição aproxima uma fração da distância por frame; em um passo de
+        # time_scale frames a fração acumulada é 1 - (1 - fração) ** time_scale
+        chase_fraction = min(1.0, self.chase_speed_x * speed_multiplier)
+        self.x += (target_x - self.x) * (1.0 - (1.0 - chase_fraction) ** time_scale)
 
         road_x_start = (GAME_WIDTH - ROAD_WIDTH) / 2
         min_x = road_x_start
@@ -175,7 +153,7 @@ class PoliceCar:
         if self.x < min_x: self.x = min_x
         if self.x > max_x: self.x = max_x
 
-        potential_targets = all_enemies + [player_truck]
+        potential_targets = find_enemies_near(self.x, self.y, self.width, self.height) + [player_truck]
         for target in potential_targets:
             if self._check_rear_end_collision(target):
                 if target is player_truck:
@@ -187,10 +165,7 @@ class PoliceCar:
                             self.stop_audio()
                         except Exception:
                             pass
-                        try:
-                            audio_manager.play_one_shot("assets/sound/crash.wav")
-                        except Exception as e:
-                            print(f"Failed to play crash sound for police: {e}")
+                        self._play_crash_sound()
                         
                         # Retorna informação de pontuação se o jogador está blindado
                         if target.armored:
@@ -204,10 +179,7 @@ class PoliceCar:
                         self.stop_audio()
                     except Exception:
                         pass
-                    try:
-                        audio_manager.play_one_shot("assets/sound/crash.wav")
-                    except Exception as e:
-                        print(f"Failed to play crash sound for police: {e}")
+                    self._play_crash_sound()
                 break
         
         return None
\ No newline at end of file
@@ -30,38 +30,63 @@ def draw_rect(x, y, width, height, color):
     glEnd()
 
 
-def draw_road(scroll_offset):
-    """Desenha todos os elementos da estrada."""
-
-    # --- Fundo e Asfalto ---
-    draw_rect(0, 0, GAME_WIDTH, SCREEN_HEIGHT, COLOR_GRASS)
-    road_x_start = (GAME_WIDTH - ROAD_WIDTH) / 2
-    draw_rect(road_x_start, 0, ROAD_WIDTH, SCREEN_HEIGHT, COLOR_ASPHALT)
+# --- Linhas Tracejadas ---
+LINE_WIDTH = 5
+CENTER_LINE_GAP = 10
+DASH_HEIGHT = 50
+DASH_GAP_HEIGHT = 30
+DASH_SEGMENT_HEIGHT = DASH_HEIGHT + DASH_GAP_HEIGHT
 
-    # --- Linhas Contínuas ---
-    line_width = 5
-    draw_rect(road_x_start, 0, line_width, SCREEN_HEIGHT, COLOR_WHITE)
-    draw_rect(road_x_start + ROAD_WIDTH - line_width, 0, line_width, SCREEN_HEIGHT, COLOR_WHITE)
 
-    center_line_gap = 10
+def get_road_layout():
+    """
+    Retorna a geometria da estrada como listas de retângulos (x, y, largura, altura, cor):
+    a parte estática (grama, asfalto, linhas contínuas) e um bloco de tracejados com a
+    rolagem zerada, que deve ser deslocado verticalmente por get_dash_offset.
+    """
+    road_x_start = (GAME_WIDTH - ROAD_WIDTH) / 2
     center_x = GAME_WIDTH / 2
-    draw_rect(center_x - center_line_gap / 2 - line_width, 0, line_width, SCREEN_HEIGHT, COLOR_YELLOW)
-    draw_rect(center_x + center_line_gap / 2, 0, line_width, SCREEN_HEIGHT, COLOR_YELLOW)
 
-    # --- Linhas Tracejadas das Faixas ---
-    dash_height = 50
-    gap_height = 30
-    total_segment_height = dash_height + gap_height
-
-    start_y = (scroll_offset % total_segment_height) - total_segment_height
-    num_dashes = SCREEN_HEIGHT // total_segment_height + 2
+    static_rects = [
+        # --- Fundo e Asfalto ---
+        (0, 0, GAME_WIDTH, SCREEN_HEIGHT, COLOR_GRASS),
+        (road_x_start, 0, ROAD_WIDTH, SCREEN_HEIGHT, COLOR_ASPHALT),
+        # --- Linhas Contínuas ---
+        (road_x_start, 0, LINE_WIDTH, SCREEN_HEIGHT, COLOR_WHITE),
+        (road_x_start + ROAD_WIDTH - LINE_WIDTH, 0, LINE_WIDTH, SCREEN_HEIGHT, COLOR_WHITE),
+        (center_x - CENTER_LINE_GAP / 2 - LINE_WIDTH, 0, LINE_WIDTH, SCREEN_HEIGHT, COLOR_YELLOW),
+        (center_x + CENTER_LINE_GAP / 2, 0, LINE_WIDTH, SCREEN_HEIGHT, COLOR_YELLOW),
+    ]
 
+    # --- Linhas Tracejadas das Faixas ---
+    num_dashes = SCREEN_HEIGHT // DASH_SEGMENT_HEIGHT + 2
+    dash_rects = []
     for i in range(1, TOTAL_LANES):
         if i == LANE_COUNT_PER_DIRECTION:
             continue
 
-        lane_line_x = road_x_start + (i * LANE_WIDTH) - (line_width / 2)
+        lane_line_x = road_x_start + (i * LANE_WIDTH) - (LINE_WIDTH / 2)
 
         for j in range(num_dashes):
-            y_pos = start_y + j * total_segment_height
-            draw_rect(lane_line_x, y_pos, line_width, dash_height, COLOR_WHITE)
+            dash_rects.append((lane_line_x, j * DASH_SEGMENT_HEIGHT, LINE_WIDTH, DASH_HEIGHT, COLOR_WHITE))
+
+    return static_rects, dash_rects
+
+
+def get_dash_offset(scroll_offset):
+    """Deslocamento vertical dos tracejados para a rolagem atual (sempre dentro de um segmento)."""
+    return (scroll_offset % DASH_SEGMENT_HEIGHT) - DASH_SEGMENT_HEIGHT
+
+
+def draw_road(scroll_offset):
+    """
+    Desenha todos os elementos da estrada em modo imediato.
+    No loop do jogo a estrada é desenhada pelo RoadMesh (src/graphics/road_mesh.py), que usa a mesma geometria.
+    """
+    static_rects, dash_rects = get_road_layout()
+    for x, y, width, height, color in static_rects:
+        draw_rect(x, y, width, height, color)
+
+    start_y = get_dash_offset(scroll_offset)
+    for x, y, width, height, color in dash_rects:
+        draw_rect(x, start_y + y, width, height, color)
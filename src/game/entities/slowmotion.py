@@ -3,12 +3,19 @@ import random
 import math
 import time
 from src.game.entities.road import ROAD_WIDTH, GAME_WIDTH, SCREEN_HEIGHT, LANE_WIDTH, LANE_COUNT_PER_DIRECTION, PLAYER_SPEED
-from src.utils.debug_utils import draw_hitbox, draw_real_hitbox
+from src.utils.debug_utils import draw_hitbox, draw_collision_hitbox
 from src.game.entities.base_drawable import DrawableGameObject
+from src.game.entities.hitbox import hitboxes_overlap, SLOWMOTION_HITBOX_SHRINK
+from src.game.status_effects import EFFECT_STARTED, REFRESH
+
+# Nome do efeito nos efeitos globais da simulação
+SLOWMOTION = "slowmotion"
 
 
 class SlowMotionPowerUp(DrawableGameObject):
-    def __init__(self, texture_id, lane_index=None, speed_multiplier=1.0):
+    HITBOX_SHRINK = SLOWMOTION_HITBOX_SHRINK
+
+    def __init__(self, sprite, lane_index=None, speed_multiplier=1.0):
         """Inicializa as propriedades do power-up de slow motion na pista."""
         # Tamanho do power-up, similar aos outros elementos
         width = LANE_WIDTH * 0.9  # 90% da largura da faixa
@@ -33,7 +40,7 @@ class SlowMotionPowerUp(DrawableGameObject):
         y = SCREEN_HEIGHT
 
         # Chama o construtor da classe base
-        super().__init__(texture_id, x, y, width, height)
+        super().__init__(sprite, x, y, width, height)
 
     def update(self, scroll_speed=None):
         """Move o power-up para baixo usando a velocidade atual do scrolling."""
@@ -50,42 +57,11 @@ class SlowMotionPowerUp(DrawableGameObject):
         """Verifica se o caminhão colidiu com o power-up usando hitboxes mais precisas."""
         if not self.active:
             return False
-
-        # Calcula a hitbox efetiva do power-up
-        powerup_hitbox_width = self.width / 1.6  # ← AJUSTÁVEL (mais generoso)
-        powerup_hitbox_height = self.height / 1.6  # ← AJUSTÁVEL (mais generoso)
-
-        powerup_hitbox_x = self.x + (self.width - powerup_hitbox_width) / 2
-        powerup_hitbox_y = self.y + (self.height - powerup_hitbox_height) / 2
-
-        # Calcula a hitbox efetiva do caminhão (usando os mesmos valores do truck.py)
-        truck_hitbox_width = truck.width / 1.3  # Atualizado para coincidir com o truck.py
-        truck_hitbox_height = truck.height / 1.2  # Atualizado para coincidir com o truck.py
-
-        truck_hitbox_x = truck.x + (truck.width - truck_hitbox_width) / 2
-        truck_hitbox_y = truck.y + (truck.height - truck_hitbox_height) / 2
-
-        # Verifica sobreposição dos retângulos das hitboxes
-        return (powerup_hitbox_x < truck_hitbox_x + truck_hitbox_width and
-                powerup_hitbox_x + powerup_hitbox_width > truck_hitbox_x and
-                powerup_hitbox_y < truck_hitbox_y + truck_hitbox_height and
-                powerup_hitbox_y + powerup_hitbox_height > truck_hitbox_y)
+        return hitboxes_overlap(self.get_hitbox(), truck.get_pickup_hitbox())
 
     def get_collision_rect(self):
-        """Retorna um retângulo (x, y, width, height) para detecção de colisão."""
-        # Segue o mesmo padrão dos outros elementos do jogo
-        powerup_hitbox_width = self.width / 1.6  # ← AJUSTÁVEL (mais generoso)
-        powerup_hitbox_height = self.height / 1.6  # ← AJUSTÁVEL (mais generoso)
-
-        powerup_hitbox_x = self.x + (self.width - powerup_hitbox_width) / 2
-        powerup_hitbox_y = self.y + (self.height - powerup_hitbox_height) / 2
-        
-        return {
-            'x': powerup_hitbox_x,
-            'y': powerup_hitbox_y,
-            'width': powerup_hitbox_width,
-            'height': powerup_hitbox_height
-        }
+        """Retorna a Hitbox cacheada (atributos x, y, width, height) usada para detecção de colisão."""
+        return self.get_hitbox()
 
     def draw_debug_hitbox(self, show_collision_area=True):
         """Desenha a hitbox de debug para visualização."""
@@ -97,16 +73,8 @@ class SlowMotionPowerUp(DrawableGameObject):
                    color=(0.8, 0.0, 0.8, 0.8), line_width=2)
         
         if show_collision_area:
-            # Segue o mesmo padrão dos outros elementos do jogo
-            powerup_hitbox_width = self.width / 1.6  # ← AJUSTÁVEL (mais generoso)
-            powerup_hitbox_height = self.height / 1.6  # ← AJUSTÁVEL (mais generoso)
-            
-            powerup_hitbox_x = self.x + (self.width - powerup_hitbox_width) / 2
-            powerup_hitbox_y = self.y + (self.height - powerup_hitbox_height) / 2
-            
             # Desenha a hitbox REAL de colisão (roxo brilhante para slow motion power-up)
-            draw_real_hitbox(powerup_hitbox_x, powerup_hitbox_y, powerup_hitbox_width, powerup_hitbox_height,
-                           color=(1.0, 0.0, 1.0, 1.0))
+            draw_collision_hitbox(self.get_hitbox(), color=(1.0, 0.0, 1.0, 1.0))
 
     def collect(self):
         """Marca o power-up como coletado e inativo."""
@@ -117,53 +85,49 @@ class SlowMotionPowerUp(DrawableGameObject):
 
 
 class SlowMotionEffect:
-    def __init__(self, duration=3.0, slowdown_factor=0.3):
+    def __init__(self, effects, clock, duration=3.0, slowdown_factor=0.3):
         """
         Inicializa o efeito de slow motion.
         
         Args:
+            effects: StatusEffects dos efeitos globais, onde o fim do slow motion fica agendado
+                     (quem é dono dele chama effects.expire a cada tick)
+            clock: GameClock do jogo; enquanto o efeito dura, time_scale do relógio fica em
+                   slowdown_factor (o mundo desacelera, o caminhão não)
             duration: Duração do efeito em segundos (padrão: 2.0)
             slowdown_factor: Fator de desaceleração (0.3 = 30% da velocidade normal)
         """
+        self.effects = effects
+        self.clock = clock
         self.duration = duration
         self.slowdown_factor = slowdown_factor
         self.active = False
-        self.start_time = 0.0
-        self.remaining_time = 0.0
+        effects.subscribe(self._on_effect)
+
+    def _on_effect(self, event, name):
+        if name == SLOWMOTION:
+            self.active = event == EFFECT_STARTED
+            self.clock.time_scale = self.slowdown_factor if self.active else 1.0
 
     def activate(self, current_time):
         """Ativa o efeito de slow motion."""
-        self.active = True
-        self.start_time = current_time
-        self.remaining_time = self.duration
-
-    def update(self, current_time):
-        """Atualiza o estado do efeito de slow motion."""
-        if self.active:
-            elapsed_time = current_time - self.start_time
-            self.remaining_time = max(0.0, self.duration - elapsed_time)
-            
-            if self.remaining_time <= 0.0:
-                self.active = False
-                return False
-        return self.active
+        self.effects.start(SLOWMOTION, self.duration, current_time, REFRESH)
 
     def deactivate(self):
         """Desativa o efeito de slow motion."""
-        self.active = False
-        self.remaining_time = 0.0
+        self.effects.stop(SLOWMOTION)
 
     def is_active(self):
         """Retorna se o efeito está ativo."""
         return self.active
 
     def get_speed_multiplier(self):
-        """Retorna o multiplicador de velocidade atual."""
-        return self.slowdown_factor if self.active else 1.0
+        """Retorna o multiplicador de velocidade atual (a escala do mundo no relógio)."""
+        return self.clock.time_scale
 
-    def get_remaining_time(self):
+    def get_remaining_time(self, current_time):
         """Retorna o tempo restante do efeito."""
-        return self.remaining_time
+        return self.effects.remaining(SLOWMOTION, current_time)
 
     def draw_overlay(self, screen_width, screen_height):
         """Desenha o filtro azulado na tela quando o efeito está ativo."""
@@ -0,0 +1,131 @@
+import time
+from contextlib import contextmanager
+
+from src.game.spawn_scheduler import SpawnScheduler
+
+STAGES = ("spawn", "update", "collide", "despawn")
+
+
+class EntityKind:
+    """
+    Declaração de um tipo de entidade do EntityPipeline (kind é o tipo no EntityStore).
+
+    spawn_interval / spawn(*args): intervalo no relógio de spawn e função que tenta criar uma entidade.
+    update(kinds): move as entidades; tipos com a mesma função de update são atualizados em uma só chamada.
+    collide(entity): testa a colisão de uma entidade que encosta no caminhão e aplica a resposta.
+    despawn(entity): regra extra de remoção (retorna True para remover); sem ela vale a regra do
+    store, que remove as entidades inativas e as que saíram da tela por baixo.
+    """
+    __slots__ = ("kind", "name", "spawn_interval", "spawn", "update", "collide", "despawn")
+
+    def __init__(self, kind, name, spawn_interval=None, spawn=None, update=None, collide=None, despawn=None):
+        self.kind = kind
+        self.name = name
+        self.spawn_interval = spawn_interval
+        self.spawn = spawn
+        self.update = update
+        self.collide = collide
+        self.despawn = despawn
+
+
+class EntityPipeline:
+    """
+    Roda as etapas spawn -> update -> collide -> despawn sobre todos os tipos registrados, em vez de
+    repetir essa sequência para cada tipo no loop do jogo. Cada etapa tem o tempo acumulado medido
+    (ver stage_timings), para saber qual delas domina o tick.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.kinds = []
+        self.spawner = SpawnScheduler()
+        self._update_groups = []
+        self._collide_groups = []
+        self._despawn_kinds = []
+        self.timings = {stage: [0.0, 0] for stage in STAGES}
+
+    def register(self, entity_kind):
+        self.kinds.append(entity_kind)
+        if entity_kind.spawn:
+            self.spawner.register(entity_kind.name, entity_kind.spawn_interval, entity_kind.spawn)
+        if entity_kind.update:
+            for group in self._update_groups:
+                if group[0] == entity_kind.update:
+                    group[1] += (entity_kind.kind,)
+                    break
+            else:
+                self._update_groups.append([entity_kind.update, (entity_kind.kind,)])
+        if entity_kind.collide:
+            # Os candidatos saem da grade espacial de cada grupo de update (tipos que andam juntos);
+            # a grade dos inimigos é a mesma que a propagação de batidas usa no tick
+            for group in self._collide_groups:
+                if group[0] == entity_kind.update:
+                    group[1] += (entity_kind.kind,)
+                    break
+            else:
+                self._collide_groups.append([entity_kind.update, (entity_kind.kind,)])
+        if entity_kind.despawn:
+            self._despawn_kinds.append(entity_kind)
+        return entity_kind
+
+    def reset(self):
+        self.spawner.reset()
+
+    def reset_timings(self):
+        for timing in self.timings.values():
+            timing[0] = 0.0
+            timing[1] = 0
+
+    @contextmanager
+    def timed(self, stage):
+        """Soma o tempo do bloco ao da etapa (também para trabalho da etapa feito fora do pipeline)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[stage][0] += time.perf_counter() - start
+
+    @contextmanager
+    def _run(self, stage):
+        self.timings[stage][1] += 1
+        with self.timed(stage):
+            yield
+
+    def spawn(self, clock_step, *args):
+        """Avança o relógio de spawn e roda os spawners vencidos (args vão para cada spawn)."""
+        with self._run("spawn"):
+            self.spawner.advance(clock_step)
+            self.spawner.run_due(*args)
+
+    def update(self):
+        with self._run("update"):
+            for update, kinds in self._update_groups:
+                update(kinds)
+
+    def collide(self, x, y, width, height):
+        """Testa as entidades que encostam no retângulo dado (o sprite do caminhão), tipo a tipo."""
+        with self._run("collide"):
+            candidates = {}
+            for _, kinds in self._collide_groups:
+                candidates.update(self.store.overlapping_by_kind(kinds, x, y, width, height))
+            for entity_kind in self.kinds:
+                if entity_kind.collide:
+                    collide = entity_kind.collide
+                    for entity in candidates[entity_kind.kind]:
+                        collide(entity)
+
+    def despawn(self):
+        """Aplica as regras de remoção de cada tipo e tira do store o que saiu de jogo."""
+        with self._run("despawn"):
+            for entity_kind in self._despawn_kinds:
+                despawn = entity_kind.despawn
+                for entity in self.store.view(entity_kind.kind):
+                    if despawn(entity):
+                        entity.active = False
+            self.store.compact()
+
+    def stage_timings(self):
+        """Tempo total (ms), número de execuções e média (µs) de cada etapa."""
+        return {stage: {"calls": calls, "total_ms": total * 1000.0,
+                        "mean_us": total * 1e6 / calls if calls else 0.0}
+                for stage, (total, calls) in self.timings.items()}
@@ -0,0 +1,412 @@
+import heapq
+
+import numpy as np
+
+from src.game.entities.road import LANE_COUNT_PER_DIRECTION
+from src.game.managers.lane_manager import LaneOccupancy
+from src.utils.spatial_hash import SpatialHash
+
+# --- Tipos de entidade guardados no store ---
+KIND_ENEMY_UP = 0
+KIND_ENEMY_DOWN = 1
+KIND_HOLE = 2
+KIND_OIL_STAIN = 3
+KIND_BEER = 4
+KIND_INVULNERABILITY = 5
+KIND_SLOWMOTION = 6
+KIND_COUNT = 7
+
+ENEMY_KINDS = (KIND_ENEMY_UP, KIND_ENEMY_DOWN)
+ITEM_KINDS = (KIND_HOLE, KIND_OIL_STAIN, KIND_BEER, KIND_INVULNERABILITY, KIND_SLOWMOTION)
+
+# Distância mínima (px) até o carro da frente antes de igualar a velocidade dele
+FOLLOW_DISTANCE = 10
+
+# Lado das células da grade espacial dos inimigos (px); cobre um carro de altura
+GRID_CELL_SIZE = 100
+
+# Campos que entram no índice de ocupação das faixas
+LANE_FIELDS = frozenset(("y", "height", "lane_index", "active"))
+
+# Campo -> (dtype, valor padrão quando o objeto não tem o atributo)
+FIELDS = {
+    "x": (np.float64, 0.0),
+    "y": (np.float64, 0.0),
+    "prev_x": (np.float64, 0.0),
+    "prev_y": (np.float64, 0.0),
+    "width": (np.float64, 0.0),
+    "height": (np.float64, 0.0),
+    "speed_y": (np.float64, 0.0),
+    "lane_index": (np.int32, -1),
+    "active": (np.bool_, True),
+    "crashed": (np.bool_, False),
+}
+
+
+class StoreField:
+    """
+    Atributo de uma entidade que, enquanto ela está em um EntityStore, mora nos arrays do store.
+    Fora do store (ex: objetos temporários para testar colisão) o valor fica no __dict__ do objeto,
+    então o resto do código continua usando entity.x, entity.y... normalmente.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        store = obj._store
+        if store is None:
+            try:
+                return obj.__dict__[self.name]
+            except KeyError:
+                raise AttributeError(self.name) from None
+        return store.columns[self.name].item(obj._slot)
+
+    def __set__(self, obj, value):
+        store = obj._store
+        if store is None:
+            obj.__dict__[self.name] = value
+        else:
+            store.columns[self.name][obj._slot] = value
+            store.version += 1
+            if self.name in LANE_FIELDS:
+                store._lane_occupancy.invalidate(store.kind.item(obj._slot))
+
+
+class EntityStore:
+    """
+    Guarda as entidades que rolam pela pista (inimigos, buracos, manchas, cervejas e power-ups)
+    em arrays NumPy pré-alocados (structure of arrays): x, y, largura, altura, velocidade, faixa,
+    tipo e as flags active / crashed.
+
+    Os objetos Python continuam existindo como "proxies" leves (os campos acima leem e escrevem
+    direto nos arrays), mas o movimento de todos eles é feito com uma operação vetorizada por tick
+    e as entradas mortas são removidas compactando os arrays, sem refazer listas a cada frame.
+
+    on_remove(entidade, tipo), se dado, é chamado para cada entidade que sai do store (ex: para
+    devolvê-la a um ObjectPool).
+    """
+
+    def __init__(self, capacity=256, on_remove=None):
+        self.capacity = capacity
+        self.on_remove = on_remove
+        self.count = 0
+        self.columns = {name: np.full(capacity, default, dtype=dtype) for name, (dtype, default) in FIELDS.items()}
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.objects = np.empty(capacity, dtype=object)
+        self._views = {}
+        self._kind_masks = {}
+        # Incrementado a cada escrita nos arrays; os caches abaixo guardam a versão em que foram montados
+        self.version = 0
+        self._render_cache = None
+        self._grids = {}
+        self._lane_occupancy = LaneOccupancy(KIND_COUNT, LANE_COUNT_PER_DIRECTION * 2, source=self._lane_rows)
+
+        # Atalhos para os arrays mais usados
+        self._bind_columns()
+
+    def _bind_columns(self):
+        columns = self.columns
+        self.x = columns["x"]
+        self.y = columns["y"]
+        self.prev_x = columns["prev_x"]
+        self.prev_y = columns["prev_y"]
+        self.width = columns["width"]
+        self.height = columns["height"]
+        self.speed = columns["speed_y"]
+        self.lane = columns["lane_index"]
+        self.active = columns["active"]
+        self.crashed = columns["crashed"]
+
+    def _grow(self):
+        new_capacity = self.capacity * 2
+        for name, (dtype, default) in FIELDS.items():
+            column = np.full(new_capacity, default, dtype=dtype)
+            column[:self.count] = self.columns[name][:self.count]
+            self.columns[name] = column
+        kind = np.zeros(new_capacity, dtype=np.int8)
+        kind[:self.count] = self.kind[:self.count]
+        self.kind = kind
+        objects = np.empty(new_capacity, dtype=object)
+        objects[:self.count] = self.objects[:self.count]
+        self.objects = objects
+        self.capacity = new_capacity
+        self._bind_columns()
+
+    # --- Entrada e saída de entidades ---
+
+    def add(self, entity, kind):
+        """Coloca a entidade no store; a partir daqui os campos dela vivem nos arrays."""
+        if self.count == self.capacity:
+            self._grow()
+        slot = self.count
+        values = entity.__dict__
+        for name, (dtype, default) in FIELDS.items():
+            self.columns[name][slot] = values.pop(name, default)
+        self.kind[slot] = kind
+        self.objects[slot] = entity
+        entity._store = self
+        entity._slot = slot
+        self.count += 1
+        self._views.clear()
+        self._kind_masks.clear()
+        self.version += 1
+        if self.active[slot]:
+            self._lane_occupancy.add(kind, self.lane.item(slot), self.y.item(slot), self.height.item(slot))
+        return entity
+
+    def _detach(self, slot):
+        """Devolve os valores ao objeto (ele continua utilizável fora do store)."""
+        entity = self.objects[slot]
+        values = {name: self.columns[name].item(slot) for name in FIELDS}
+        entity._store = None
+        entity._slot = -1
+        entity.__dict__.update(values)
+        if self.on_remove is not None:
+            self.on_remove(entity, self.kind.item(slot))
+
+    def clear(self):
+        for slot in range(self.count):
+            self._detach(slot)
+        self.objects[:self.count] = None
+        self.count = 0
+        self._views.clear()
+        self._kind_masks.clear()
+        self._lane_occupancy.clear()
+        self.version += 1
+
+    def compact(self):
+        """
+        Remove as entidades inativas ou que saíram da tela por baixo, movendo as restantes
+        para o começo dos arrays (a ordem relativa é mantida). Retorna quantas foram removidas.
+        """
+        n = self.count
+        keep = self.active[:n] & (self.y[:n] > -self.height[:n])
+        kept = int(np.count_nonzero(keep))
+        if kept == n:
+            return 0
+
+        occupancy = self._lane_occupancy
+        for slot in np.flatnonzero(~keep):
+            if self.active[slot]:
+                occupancy.remove(self.kind.item(slot), self.lane.item(slot), self.y.item(slot),
+                                 self.height.item(slot))
+            self._detach(slot)
+
+        for name in FIELDS:
+            column = self.columns[name]
+            column[:kept] = column[:n][keep]
+        self.kind[:kept] = self.kind[:n][keep]
+        survivors = self.objects[:n][keep]
+        self.objects[:kept] = survivors
+        self.objects[kept:n] = None
+
+        # Só os objetos que mudaram de posição precisam saber o novo slot
+        first_moved = int(np.argmin(keep)) if kept < n else kept
+        for slot in range(first_moved, kept):
+            survivors[slot]._slot = slot
+
+        self.count = kept
+        self._views.clear()
+        self._kind_masks.clear()
+        self.version += 1
+        return n - kept
+
+    # --- Consultas ---
+
+    def view(self, *kinds):
+        """
+        Lista (em ordem de inserção) dos objetos dos tipos pedidos. A lista é reaproveitada
+        enquanto nenhuma entidade entrar ou sair do store; não deve ser modificada.
+        """
+        cached = self._views.get(kinds)
+        if cached is None:
+            cached = self.objects[:self.count][self.kind_mask(kinds)].tolist()
+            self._views[kinds] = cached
+        return cached
+
+    def kind_mask(self, kinds):
+        """Máscara booleana das entidades dos tipos pedidos (reaproveitada enquanto o store não mudar)."""
+        mask = self._kind_masks.get(kinds)
+        if mask is None:
+            mask = np.isin(self.kind[:self.count], kinds)
+            self._kind_masks[kinds] = mask
+        return mask
+
+    def grid(self, kinds):
+        """
+        Grade espacial (SpatialHash) das entidades ativas dos tipos pedidos, indexada pelo slot.
+        É atualizada sob demanda quando algo mudou no store desde a última consulta.
+        """
+        entry = self._grids.get(kinds)
+        if entry is None:
+            entry = self._grids[kinds] = [SpatialHash(GRID_CELL_SIZE), -1]
+        grid = entry[0]
+        if entry[1] != self.version:
+            n = self.count
+            slots = np.flatnonzero(self.kind_mask(kinds) & self.active[:n])
+            grid.rebuild(slots, self.x[slots], self.y[slots], self.width[slots], self.height[slots])
+            entry[1] = self.version
+        return grid
+
+    def lane_occupancy(self):
+        """Índice de ocupação das faixas (LaneOccupancy) com as entidades ativas, por tipo."""
+        return self._lane_occupancy
+
+    def _lane_rows(self, kind):
+        """(faixa, y, altura) das entidades ativas do tipo, para o LaneOccupancy recalcular um tipo."""
+        n = self.count
+        mask = (self.kind[:n] == kind) & self.active[:n]
+        return self.lane[:n][mask], self.y[:n][mask], self.height[:n][mask]
+
+    def overlapping(self, kinds, x, y, width, height):
+        """
+        Entidades ativas dos tipos pedidos cujo retângulo do sprite se sobrepõe ao retângulo dado
+        (em ordem de slot), consultando a grade espacial. Como as hitboxes ficam dentro do sprite,
+        serve de filtro antes do teste de colisão exato.
+        """
+        return self.objects[self.grid(kinds).query(x, y, width, height)].tolist()
+
+    def overlapping_by_kind(self, kinds, x, y, width, height):
+        """Como overlapping (também pela grade espacial), mas separado por tipo: {tipo: [entidades]}."""
+        result = {kind: [] for kind in kinds}
+        slots = self.grid(kinds).query(x, y, width, height)
+        for slot, kind in zip(slots.tolist(), self.kind[slots].tolist()):
+            result[kind].append(self.objects[slot])
+        return result
+
+    # --- Atualizações vetorizadas ---
+
+    def save_previous_positions(self):
+        """Guarda as posições do tick anterior (para o desenho interpolado) de todas as entidades."""
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        self.version += 1
+
+    def scroll(self, dy, kinds):
+        """Move verticalmente as entidades ativas dos tipos pedidos (ex: obstáculos com a pista)."""
+        mask = self.kind_mask(kinds) & self.active[:self.count]
+        self.y[:self.count][mask] += dy
+        self.version += 1
+        for kind in kinds:
+            self._lane_occupancy.shift(kind, dy)
+
+    def scroll_crashed(self, dy, kinds):
+        """Empurra com a pista as entidades crashadas (inimigos batidos param e descem com o scroll)."""
+        mask = self.kind_mask(kinds) & self.crashed[:self.count]
+        if mask.any():
+            self.y[:self.count][mask] += dy
+            for kind in kinds:
+                self._lane_occupancy.invalidate(kind)
+        self.version += 1
+
+    def lane_leaders(self, slots):
+        """
+        Para os slots dados, ordena por (faixa, y) e devolve (ordem, líder): ordem são as posições
+        em slots de cada fila de faixa, do carro mais baixo para o mais alto, e líder[k] é a posição
+        em slots do carro logo à frente de ordem[k] na mesma faixa (-1 se ele lidera a faixa).
+        """
+        y = self.y[slots]
+        lane = self.lane[slots]
+        order = np.lexsort((y, lane))
+        leader = np.full(len(order), -1, dtype=np.intp)
+        if len(order) > 1:
+            sorted_lane = lane[order]
+            sorted_y = y[order]
+            same_lane = (sorted_lane[1:] == sorted_lane[:-1]) & (sorted_y[:-1] < sorted_y[1:])
+            leader[1:][same_lane] = order[:-1][same_lane]
+        return order, leader
+
+    def update_enemies(self, speed_multiplier, kinds=ENEMY_KINDS):
+        """
+        Equivalente vetorizado de Enemy.update para todos os inimigos: quem está logo atrás do
+        carro da frente na mesma faixa reduz a velocidade para a dele, e depois todos os inimigos
+        não crashados andam speed_y * speed_multiplier. Os carros ficam em filas por faixa
+        ordenadas por y, então cada um encontra seu líder em O(1) em vez de olhar todos os outros.
+        Todos comparam com as posições e velocidades do início do tick.
+        """
+        n = self.count
+        moving = self.kind_mask(kinds) & ~self.crashed[:n]
+        slots = np.flatnonzero(moving)
+        if len(slots) == 0:
+            return
+
+        y = self.y[slots]
+        speed = self.speed[slots]
+        order, leader = self.lane_leaders(slots)
+
+        followers = order[leader >= 0]
+        leaders = leader[leader >= 0]
+        close = y[followers] - (y[leaders] + self.height[slots[leaders]]) < FOLLOW_DISTANCE
+        followers = followers[close]
+        if len(followers):
+            speed[followers] = np.minimum(speed[followers], speed[leaders[close]])
+
+        self.speed[slots] = speed
+        self.y[slots] = y - speed * speed_multiplier
+        self.version += 1
+        for kind in kinds:
+            self._lane_occupancy.invalidate(kind)
+
+    def render_rects(self, alpha):
+        """
+        Retângulos de desenho de todas as entidades, interpolados entre o tick anterior e o atual:
+        (x, y, largura, altura, ativo), cada um uma lista indexada pelo slot. É calculado uma vez
+        por frame para todas as entidades em vez de cada proxy ler os seus campos um a um.
+        """
+        cache = self._render_cache
+        if cache is None or cache[0] != alpha or cache[1] != self.version:
+            n = self.count
+            prev_x = self.prev_x[:n]
+            prev_y = self.prev_y[:n]
+            cache = (alpha, self.version,
+                     (prev_x + (self.x[:n] - prev_x) * alpha).tolist(),
+                     (prev_y + (self.y[:n] - prev_y) * alpha).tolist(),
+                     self.width[:n].tolist(),
+                     self.height[:n].tolist(),
+                     self.active[:n].tolist())
+            self._render_cache = cache
+        return cache[2:]
+
+    def propagate_crashes(self, kinds=ENEMY_KINDS, extra_car=None):
+        """
+        Carros crashados derrubam os carros com que se sobrepõem (em ordem de slot, então uma batida
+        pode se propagar em cadeia). Os pares de carros sobrepostos vêm da grade espacial, então
+        cada carro só é comparado com os vizinhos.
+        extra_car é um carro fora do store (a polícia) que participa também.
+        """
+        grid = self.grid(kinds)
+        crashed = self.crashed
+
+        # grid.ids está em ordem crescente de slot, então a lista inicial já é um heap
+        pending = grid.ids[crashed[grid.ids]].tolist()
+        if pending:
+            # Vizinhança de cada carro: todos os pares sobrepostos, nos dois sentidos, ordenados pelo primeiro
+            first, second = grid.overlapping_pairs()
+            source = np.concatenate((first, second))
+            target = np.concatenate((second, first))
+            order = np.argsort(source, kind="stable")
+            target = target[order].tolist()
+            # Os vizinhos do slot s são target[bounds[s]:bounds[s + 1]]
+            bounds = np.searchsorted(source[order], np.arange(self.count + 1)).tolist()
+            is_crashed = crashed[:self.count].tolist()
+            while pending:
+                slot = heapq.heappop(pending)
+                for hit in target[bounds[slot]:bounds[slot + 1]]:
+                    if not is_crashed[hit]:
+                        is_crashed[hit] = True
+                        # Carros com slot menor que o atual só propagam a batida no próximo tick
+                        if hit > slot:
+                            heapq.heappush(pending, hit)
+            crashed[:self.count] = is_crashed
+
+        if extra_car is not None:
+            extra_hits = grid.query(extra_car.x, extra_car.y, extra_car.width, extra_car.height)
+            if not extra_car.crashed and crashed[extra_hits].any():
+                extra_car.crashed = True
+            if extra_car.crashed:
+                crashed[extra_hits] = True
+        self.version += 1
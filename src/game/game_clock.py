@@ -0,0 +1,54 @@
+import time
+
+
+class GameClock:
+    """
+    Relógio único do jogo. Guarda três coisas:
+
+    - now: o tempo de jogo em segundos, que só anda quando a simulação chama tick(dt). Por isso
+      não anda na pausa nem no menu, e numa simulação headless é tempo virtual. Chamar o relógio
+      (clock()) devolve now sem consultar o sistema operacional; é isso que os timers dos efeitos
+      leem.
+    - sample(): lê a fonte de tempo real (uma vez por frame) e devolve quanto tempo de jogo passou
+      desde a leitura anterior, já zerado na pausa. É o que alimenta o FixedTimestep.
+    - time_scale: escala do tempo do mundo (pista, inimigos, spawns), ligada pelo slow motion. Ela
+      não muda o ritmo dos ticks nem now: o caminhão continua na velocidade normal e a duração
+      dos efeitos é contada em segundos de jogo.
+
+    source é a função de tempo real (perf_counter por padrão).
+    """
+
+    def __init__(self, source=time.perf_counter):
+        self.source = source
+        self.now = 0.0
+        self.time_scale = 1.0
+        self.paused = False
+        self.wall_time = source()
+
+    def __call__(self):
+        return self.now
+
+    def tick(self, dt):
+        """Avança o tempo de jogo em um passo da simulação."""
+        self.now += dt
+
+    def sample(self):
+        """Lê o tempo real e retorna o tempo de jogo do frame (0 se pausado)."""
+        wall_time = self.source()
+        delta = wall_time - self.wall_time
+        self.wall_time = wall_time
+        if self.paused:
+            return 0.0
+        return delta
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def reset(self):
+        """Volta o tempo de jogo a zero e a escala do mundo ao normal (nova partida)."""
+        self.now = 0.0
+        self.time_scale = 1.0
+
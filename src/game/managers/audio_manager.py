@@ -1,10 +1,16 @@
+import hashlib
+import mmap
+import queue
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import wave
-import tempfile
 import os
-import time
 import pygame
 
+from src.game.managers.sound_categories import CATEGORY_PRIORITIES, CATEGORY_SIREN, CATEGORY_UI
+from src.game.managers.sound_manifest import SOUND_MANIFEST, get_sound
+
 def _resolve_path(path):
     """Resolve caminhos relativos (ex: 'assets/sound/crash.wav') para base do projeto.
     Se já for absoluto, retorna inalterado.
@@ -22,11 +28,118 @@ def _resolve_path(path):
     except Exception:
         return path
 
-_audio_cache = {}  # path -> {"full": Sound|None, "loop": Sound|None, "tmp": path|None, "ready_event": Event, "lock": Lock}
+_audio_cache = {}  # path -> {"full": Sound|None, "loop": Sound|None, "ready_event": Event, "lock": Lock}
 _audio_cache_lock = threading.Lock()
 
-_players_lock = threading.Lock()
-_active_players = set()
+
+# Trecho usado como loop (ms): por padrão tudo depois dos primeiros 4 segundos
+DEFAULT_LOOP_START_MS = 4000
+_loop_points = {}  # path -> (início_ms, fim_ms|None)
+
+
+def set_loop_points(path, start_ms, end_ms=None):
+    """Define o trecho [start_ms, end_ms) do som tocado em loop (end_ms=None vai até o fim)."""
+    _loop_points[_resolve_path(path)] = (start_ms, end_ms)
+
+
+def _slice_loop(path, full):
+    """
+    Recorta o trecho de loop do som já decodificado (amostras no formato do mixer), sem passar
+    pelo disco. Retorna o próprio som se o trecho for vazio ou o som inteiro.
+    """
+    start_ms, end_ms = _loop_points.get(path, (DEFAULT_LOOP_START_MS, None))
+    frequency, size, channels = pygame.mixer.get_init()
+    frame_bytes = abs(size) // 8 * channels
+    raw = full.get_raw()
+    start = int(start_ms * frequency / 1000) * frame_bytes
+    end = len(raw) if end_ms is None else min(len(raw), int(end_ms * frequency / 1000) * frame_bytes)
+    if start <= 0 and end >= len(raw) or start >= end:
+        return full
+    return pygame.mixer.Sound(buffer=memoryview(raw)[start:end])
+
+
+# Cache em disco do PCM já decodificado no formato do mixer (None desativa)
+PCM_CACHE_DIR = "data/audio_cache"
+_pcm_cache_dir = _resolve_path(PCM_CACHE_DIR)
+
+
+def set_pcm_cache_dir(path):
+    """Troca o diretório do cache de PCM (None desativa o cache)."""
+    global _pcm_cache_dir
+    _pcm_cache_dir = _resolve_path(path) if path else None
+
+
+def _pcm_cache_file(path):
+    """
+    Arquivo do cache para o som: nome do arquivo + hash do caminho, sha1 do conteúdo e formato do
+    mixer. Se o asset mudar (ou o mixer abrir com outro formato) o nome muda e o cache antigo
+    deixa de ser usado. Retorna (arquivo, prefixo comum a todas as versões do som).
+    """
+    sha1 = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha1.update(chunk)
+    frequency, size, channels = pygame.mixer.get_init()
+    path_hash = hashlib.sha1(path.encode("utf-8")).hexdigest()[:8]
+    prefix = f"{os.path.basename(path)}-{path_hash}-"
+    name = f"{prefix}{sha1.hexdigest()}-{frequency}-{size}-{channels}.pcm"
+    return os.path.join(_pcm_cache_dir, name), prefix
+
+
+def _read_pcm(cache_file):
+    """Lê o PCM do cache (via mmap quando possível). Retorna None se não existir ou estiver vazio."""
+    try:
+        with open(cache_file, 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return pygame.mixer.Sound(buffer=data)
+            except (ValueError, OSError):
+                # Arquivo vazio ou sistema sem mmap: lê normalmente
+                data = f.read()
+                return pygame.mixer.Sound(buffer=data) if data else None
+    except FileNotFoundError:
+        return None
+
+
+def _write_pcm(cache_file, prefix, sound):
+    """Grava o PCM no cache (escrita atômica) e apaga as versões antigas do mesmo som."""
+    os.makedirs(_pcm_cache_dir, exist_ok=True)
+    tmp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(sound.get_raw())
+    os.replace(tmp_file, cache_file)
+    for name in os.listdir(_pcm_cache_dir):
+        old_file = os.path.join(_pcm_cache_dir, name)
+        if name.startswith(prefix) and name.endswith(".pcm") and old_file != cache_file:
+            try:
+                os.unlink(old_file)
+            except OSError:
+                pass
+
+
+def _load_decoded(path):
+    """
+    Carrega o som decodificado: do cache de PCM se houver, senão decodifica o arquivo e grava no
+    cache para as próximas execuções. Retorna (Sound, veio_do_cache).
+    """
+    if _pcm_cache_dir is None or not pygame.mixer.get_init():
+        return pygame.mixer.Sound(path), False
+    cache_file = prefix = None
+    try:
+        cache_file, prefix = _pcm_cache_file(path)
+        sound = _read_pcm(cache_file)
+        if sound is not None:
+            return sound, True
+    except Exception as e:
+        print(f"Audio cache read error for {path}: {e}")
+
+    sound = pygame.mixer.Sound(path)
+    if cache_file:
+        try:
+            _write_pcm(cache_file, prefix, sound)
+        except Exception as e:
+            print(f"Audio cache write error for {path}: {e}")
+    return sound, False
 
 
 def _ensure_mixer_initialized(framerate=None, sampwidth=None, nchannels=None):
@@ -43,15 +156,91 @@ def _ensure_mixer_initialized(framerate=None, sampwidth=None, nchannels=None):
         print(f"Warning: pygame.mixer.init failed: {e}")
 
 
-def preload_sound(path, create_loop=True):
+# Número máximo de threads decodificando sons ao mesmo tempo no preload
+PRELOAD_WORKERS = 4
+_preload_executor = None
+_preload_executor_lock = threading.Lock()
+
+
+def _get_preload_executor():
+    global _preload_executor
+    with _preload_executor_lock:
+        if _preload_executor is None:
+            _preload_executor = ThreadPoolExecutor(max_workers=PRELOAD_WORKERS, thread_name_prefix="audio-preload")
+        return _preload_executor
+
+
+def _cache_entry(path, create_loop):
+    """Retorna (entrada do cache, criada agora?) para o caminho já resolvido."""
+    with _audio_cache_lock:
+        entry = _audio_cache.get(path)
+        if entry:
+            return entry, False
+        entry = {
+            "full": None, "loop": None,
+            "ready_event": threading.Event(), "lock": threading.Lock(),
+            "create_loop": create_loop, "from_disk_cache": False
+        }
+        _audio_cache[path] = entry
+        return entry, True
+
+
+def _load_cached(path):
+    """
+    Decodifica o som para o cache (roda numa thread do preload). Se outra thread já está
+    carregando o mesmo arquivo, só espera ela terminar.
+    """
+    entry = _audio_cache[path]
+    try:
+        with entry["lock"]:
+            if entry["ready_event"].is_set():
+                return
+            # Lê header para inicializar mixer com parâmetros adequados
+            if path.lower().endswith(".wav"):
+                try:
+                    with wave.open(path, 'rb') as wf:
+                        nch = wf.getnchannels()
+                        sw = wf.getsampwidth()
+                        fr = wf.getframerate()
+                        _ensure_mixer_initialized(framerate=fr, sampwidth=sw, nchannels=nch)
+                except Exception as e:
+                    print(f"Failed to read wave during preload: {e}")
+            else:
+                _ensure_mixer_initialized()
+
+            # Carrega full sound (do cache de PCM se possível)
+            try:
+                entry["full"], entry["from_disk_cache"] = _load_decoded(path)
+            except Exception as e:
+                print(f"Failed to preload full sound: {e}")
+                entry["full"] = None
+
+            # Se a chamada solicitou criar loop, recorta o trecho do som já carregado
+            try:
+                full = entry["full"]
+                if entry["create_loop"] and full:
+                    entry["loop"] = _slice_loop(path, full)
+                else:
+                    entry["loop"] = full
+            except Exception as e:
+                print(f"Failed to create preload loop sound: {e}")
+                entry["loop"] = entry["full"]
+    finally:
+        entry["ready_event"].set()
+
+
+def preload_sound(path, create_loop=True, loop_start_ms=None, loop_end_ms=None):
     """
     Inicia (assíncrono) o pré-carregamento do áudio para evitar I/O bloqueante no spawn.
-    Se create_loop=False, apenas carrega a versão "full" e não cria o tmp/loop.
+    Se create_loop=False, apenas carrega a versão "full" e não recorta o loop.
+    loop_start_ms / loop_end_ms definem o trecho do loop (ver set_loop_points).
     Retorna um threading.Event que será setado quando o som estiver pronto no cache.
     Aceita caminhos relativos ao diretório deste módulo.
     """
     path = _resolve_path(path)
-    
+    if loop_start_ms is not None:
+        set_loop_points(path, loop_start_ms, loop_end_ms)
+
     # Verifica se o arquivo existe antes de tentar carregar
     if not os.path.exists(path):
         print(f"Warning: Audio file not found: {path}")
@@ -59,310 +248,421 @@ def preload_sound(path, create_loop=True):
         ready_ev = threading.Event()
         ready_ev.set()
         return ready_ev
-    
-    with _audio_cache_lock:
-        entry = _audio_cache.get(path)
-        if entry:
-            return entry["ready_event"]
-        ready_ev = threading.Event()
-        _audio_cache[path] = {
-            "full": None, "loop": None, "tmp": None,
-            "ready_event": ready_ev, "lock": threading.Lock(),
-            "create_loop": create_loop
-        }
 
-    def _bg_load():
-        try:
-            with _audio_cache[path]["lock"]:
-                # Re-check
-                if _audio_cache[path]["full"]:
-                    _audio_cache[path]["ready_event"].set()
-                    return
-                # Lê header para inicializar mixer com parâmetros adequados
-                try:
-                    with wave.open(path, 'rb') as wf:
-                        nch = wf.getnchannels()
-                        sw = wf.getsampwidth()
-                        fr = wf.getframerate()
-                        _ensure_mixer_initialized(framerate=fr, sampwidth=sw, nchannels=nch)
-                except Exception as e:
-                    print(f"Failed to read wave during preload: {e}")
+    entry, created = _cache_entry(path, create_loop)
+    if created:
+        _get_preload_executor().submit(_load_cached, path)
+    return entry["ready_event"]
 
-                # Carrega full sound
-                try:
-                    full = pygame.mixer.Sound(path)
-                    _audio_cache[path]["full"] = full
-                except Exception as e:
-                    print(f"Failed to preload full sound: {e}")
-                    _audio_cache[path]["full"] = None
 
-                # Se a chamada solicitou criar loop, tenta criar o tmp/loop; caso contrário, ignora
-                try:
-                    if create_loop:
-                        with wave.open(path, 'rb') as wf:
-                            framerate = wf.getframerate()
-                            nframes = wf.getnframes()
-                            start_frame = int(4 * framerate)
-                            if start_frame < nframes:
-                                wf.setpos(start_frame)
-                                loop_frames = wf.readframes(nframes - start_frame)
-                                if loop_frames:
-                                    tmp = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-                                    tmp_name = tmp.name
-                                    tmp.close()
-                                    with wave.open(tmp_name, 'wb') as outw:
-                                        outw.setnchannels(wf.getnchannels())
-                                        outw.setsampwidth(wf.getsampwidth())
-                                        outw.setframerate(wf.getframerate())
-                                        outw.writeframes(loop_frames)
-                                    _audio_cache[path]["tmp"] = tmp_name
-                                    try:
-                                        loop = pygame.mixer.Sound(tmp_name)
-                                        _audio_cache[path]["loop"] = loop
-                                    except Exception as e:
-                                        print(f"Failed to preload loop sound: {e}")
-                                        _audio_cache[path]["loop"] = _audio_cache[path]["full"]
-                                else:
-                                    _audio_cache[path]["loop"] = _audio_cache[path]["full"]
-                            else:
-                                _audio_cache[path]["loop"] = _audio_cache[path]["full"]
-                    else:
-                        _audio_cache[path]["loop"] = _audio_cache[path]["full"]
-                except Exception as e:
-                    print(f"Failed to create preload loop sound: {e}")
-                    _audio_cache[path]["loop"] = _audio_cache[path]["full"]
-        finally:
+class PreloadProgress:
+    """
+    Andamento de preload_manifest. on_progress(prontos, total, sound_id) é chamado (na thread do
+    preload) a cada som pronto; wait() é a barreira para esperar todos antes de começar a partida.
+    elapsed é o tempo (s) até todos ficarem prontos e cache_hits quantos vieram do cache de PCM.
+    """
+
+    def __init__(self, total, on_progress=None):
+        self.total = total
+        self.done = 0
+        self.failed = []
+        self.cache_hits = 0
+        self.on_progress = on_progress
+        self.started = time.perf_counter()
+        self.elapsed = 0.0 if total == 0 else None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        if total == 0:
+            self._ready.set()
+
+    def _advance(self, sound_id, ok, from_disk_cache=False):
+        with self._lock:
+            self.done += 1
+            if not ok:
+                self.failed.append(sound_id)
+            if from_disk_cache:
+                self.cache_hits += 1
+            done = self.done
+            if done >= self.total:
+                self.elapsed = time.perf_counter() - self.started
+        if self.on_progress:
             try:
-                _audio_cache[path]["ready_event"].set()
-            except Exception:
-                pass
+                self.on_progress(done, self.total, sound_id)
+            except Exception as e:
+                print(f"Audio preload progress callback error: {e}")
+        if done >= self.total:
+            print(f"Audio ready in {self.elapsed * 1000:.0f} ms "
+                  f"({self.cache_hits}/{self.total} from the PCM cache, {len(self.failed)} failed)")
+            self._ready.set()
+
+    @property
+    def ready(self):
+        return self._ready.is_set()
+
+    def fraction(self):
+        return self.done / self.total if self.total else 1.0
+
+    def wait(self, timeout=None):
+        """Espera todos os sons ficarem prontos. Retorna False se o timeout venceu antes."""
+        return self._ready.wait(timeout)
+
+
+def _preload_entry(entry, progress):
+    ok = False
+    from_disk_cache = False
+    try:
+        path = _resolve_path(entry.path)
+        if entry.loop_start_ms is not None:
+            set_loop_points(path, entry.loop_start_ms, entry.loop_end_ms)
+        if not os.path.exists(path):
+            print(f"Warning: Audio file not found: {path}")
+            return
+        _cache_entry(path, entry.loop)
+        _load_cached(path)
+        cache_entry = _audio_cache[path]
+        ok = cache_entry["full"] is not None
+        from_disk_cache = cache_entry["from_disk_cache"]
+    except Exception as e:
+        print(f"Failed to preload sound '{entry.id}': {e}")
+    finally:
+        progress._advance(entry.id, ok, from_disk_cache)
 
-    t = threading.Thread(target=_bg_load, daemon=True)
-    t.start()
-    return _audio_cache[path]["ready_event"]
+
+def preload_manifest(manifest=SOUND_MANIFEST, on_progress=None):
+    """
+    Pré-carrega todos os sons do manifesto (menos as músicas de streaming) no pool de threads
+    do preload, no máximo PRELOAD_WORKERS por vez. Retorna um PreloadProgress.
+    """
+    entries = [entry for entry in manifest.values() if not entry.stream]
+    progress = PreloadProgress(len(entries), on_progress)
+    # Inicializa o mixer antes, para as threads do pool não disputarem a inicialização
+    _ensure_mixer_initialized()
+    executor = _get_preload_executor()
+    for entry in entries:
+        executor.submit(_preload_entry, entry, progress)
+    return progress
 
 
 def get_preloaded_sounds(path):
-    """Retorna (full_sound, loop_sound, tmp_path) se já estiverem carregados, senão (None, None, None)."""
+    """Retorna (full_sound, loop_sound) se já estiverem carregados, senão (None, None)."""
     path = _resolve_path(path)
     with _audio_cache_lock:
         entry = _audio_cache.get(path)
         if not entry:
-            return (None, None, None)
-        return (entry.get("full"), entry.get("loop"), entry.get("tmp"))
+            return (None, None)
+        return (entry.get("full"), entry.get("loop"))
+
+
+# Número de vozes (canais do mixer) e máximo de instâncias do mesmo som tocando ao mesmo tempo
+VOICE_COUNT = 16
+MAX_INSTANCES_PER_SOUND = 3
+
+
+def _load_for_player(player):
+    """Decodifica o som de um handle que tentou tocar antes do preload (roda no pool do preload)."""
+    try:
+        _load_cached(player.path)
+    finally:
+        _send(_CMD_LOADED, player)
 
 
 class SoundPlayer:
     """
-    Gerencia reprodução de um som:
+    Handle de um som tocado pelo serviço de áudio:
       - Toca a versão "full" uma vez (se existir)
       - Em seguida toca a versão de "loop" repetidamente (se existir)
     O loop é reproduzido até chamar .stop()
+
+    start/stop/set_volume só colocam um comando na fila do serviço de áudio (ver _AudioService);
+    carregar o som e mexer nos canais do pygame acontece na thread do serviço.
+    category define a prioridade do som na disputa por vozes (ver CATEGORY_PRIORITIES).
     """
 
-    def __init__(self, path, use_loop=True, volume=None):
+    def __init__(self, path, use_loop=True, volume=None, category=CATEGORY_UI):
         path = _resolve_path(path)
         self.path = path
         self._use_loop = bool(use_loop)
         self._volume = volume
+        self.category = category
+        self._priority = CATEGORY_PRIORITIES.get(category, 0)
         self._full = None
         self._loop = None
-        self._loop_tmp = None
-        self._own_tmp = False
-        self._stop_event = threading.Event()
-        self._audio_lock = threading.Lock()
-        self._audio_channel = None
-        self._thread = None
-
+        self._loaded = False
+        # Estado escrito só pela thread do serviço (leituras de outras threads são só consultas)
+        self._channel = None
+        self._voice = None
+        self._started = 0
+        self._pending = False
+        # True do momento em que o serviço toca o som até ele parar ou terminar; as outras threads
+        # consultam este atributo em vez de chamar Channel.get_busy() fora da thread do serviço
+        self._playing = False
+
+    def _load(self):
+        """
+        Pega os sons do cache (roda na thread do serviço). Se o som ainda não foi decodificado,
+        agenda a decodificação no pool do preload e retorna False; quando ela termina, o pool manda
+        _CMD_LOADED e o serviço toca o handle. Assim a thread do serviço nunca espera um arquivo.
+        """
+        if self._loaded:
+            return True
         # Verifica se o arquivo existe
-        if not os.path.exists(path):
-            print(f"Warning: Audio file not found during SoundPlayer init: {path}")
-            return
+        if not os.path.exists(self.path):
+            print(f"Warning: Audio file not found during SoundPlayer init: {self.path}")
+            self._loaded = True
+            return True
+
+        entry, _ = _cache_entry(self.path, self._use_loop)
+        if not entry["ready_event"].is_set():
+            _get_preload_executor().submit(_load_for_player, self)
+            return False
 
-        full, loop, tmp = get_preloaded_sounds(path)
-        self._full = full
+        self._loaded = True
+        self._full = entry["full"]
         # honor use_loop: if user doesn't want loop, ignore preloaded loop
-        self._loop = loop if self._use_loop else None
-        self._loop_tmp = tmp if self._use_loop else None
+        self._loop = entry["loop"] if self._use_loop else None
+        return True
 
-    def _ensure_loaded_sync(self):
-        """Se não estão pré-carregados, carrega de forma síncrona (menor prioridade)."""
-        # Ensure full always loaded when requested
-        if self._full is None:
-            try:
-                try:
-                    with wave.open(self.path, 'rb') as wf:
-                        nch = wf.getnchannels()
-                        sw = wf.getsampwidth()
-                        fr = wf.getframerate()
-                        _ensure_mixer_initialized(framerate=fr, sampwidth=sw, nchannels=nch)
-                except Exception:
-                    _ensure_mixer_initialized()
-                try:
-                    self._full = pygame.mixer.Sound(self.path)
-                except Exception as e:
-                    print(f"Failed to load full sound on-demand: {e}")
-                    self._full = None
-            except Exception:
-                pass
-
-        # If loop not desired, skip loop creation entirely
-        if not self._use_loop:
-            self._loop = None
+    def start(self):
+        if self.is_playing():
             return
+        self._pending = True
+        _send(_CMD_PLAY, self)
 
-        # Create loop if missing
-        if self._loop is None:
-            try:
-                with wave.open(self.path, 'rb') as wf:
-                    framerate = wf.getframerate()
-                    nframes = wf.getnframes()
-                    start_frame = int(4 * framerate)
-                    if start_frame < nframes:
-                        wf.setpos(start_frame)
-                        loop_frames = wf.readframes(nframes - start_frame)
-                        if loop_frames:
-                            tmp = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-                            tmp_name = tmp.name
-                            tmp.close()
-                            with wave.open(tmp_name, 'wb') as outw:
-                                outw.setnchannels(wf.getnchannels())
-                                outw.setsampwidth(wf.getsampwidth())
-                                outw.setframerate(wf.getframerate())
-                                outw.writeframes(loop_frames)
-                            self._loop_tmp = tmp_name
-                            self._own_tmp = True
-                            try:
-                                self._loop = pygame.mixer.Sound(self._loop_tmp)
-                            except Exception as e:
-                                print(f"Failed to load loop sound on-demand: {e}")
-                                self._loop = self._full
-                        else:
-                            self._loop = self._full
-                    else:
-                        self._loop = self._full
-            except Exception as e:
-                print(f"Failed to create loop sound on-demand: {e}")
-                self._loop = self._full
+    def stop(self):
+        _send(_CMD_STOP, self)
 
-    def _is_playing_channel(self, ch):
-        try:
-            return ch is not None and getattr(ch, "get_busy", lambda: False)()
-        except Exception:
-            return False
+    def set_volume(self, volume):
+        self._volume = volume
+        _send(_CMD_SET_VOLUME, self, volume)
 
-    def _run(self):
-        self._stop_event.clear()
-        try:
-            # Ensure resources loaded
-            self._ensure_loaded_sync()
+    def is_playing(self):
+        return self._pending or self._playing
 
-            # play full once
-            if self._full:
+
+# --- Serviço de áudio ---
+# Uma única thread de longa duração é dona de todos os canais do pygame. As outras threads só
+# colocam comandos (operação, handle, argumento) na fila, que não bloqueia quem envia.
+_CMD_PLAY = "play"
+_CMD_LOADED = "loaded"
+_CMD_STOP = "stop"
+_CMD_SET_VOLUME = "set_volume"
+_CMD_STOP_ALL = "stop_all"
+_CMD_CONFIGURE = "configure"
+
+# Intervalo para conferir quais vozes terminaram e se a parte "full" de um som com loop acabou
+# (só enquanto houver alguma voz tocando)
+_VOICE_POLL_INTERVAL = 0.02
+
+
+class _AudioService:
+    """
+    Thread do áudio, com um pool fixo de vozes (um canal do mixer cada). Quando não há voz livre,
+    o som novo rouba a voz de menor prioridade (a mais antiga, no empate) desde que ela não seja
+    mais prioritária que ele; se todas forem, o som novo é descartado. Um som que já tem
+    max_instances instâncias tocando rouba a voz da sua instância mais antiga.
+    """
+
+    def __init__(self):
+        self.commands = queue.SimpleQueue()
+        self.voice_count = VOICE_COUNT
+        self.max_instances = MAX_INSTANCES_PER_SOUND
+        self._channels = []
+        self._voices = []  # Handle tocando em cada voz (None = livre)
+        self._intros = []  # Handles tocando a parte "full" antes de passar para o loop
+        self._loading = set()  # Handles esperando o pool do preload decodificar o som
+        self._sequence = 0
+        self.stolen = 0
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="audio-service", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            timeout = _VOICE_POLL_INTERVAL if any(playing is not None for playing in self._voices) else None
+            try:
+                op, player, arg = self.commands.get(timeout=timeout)
+            except queue.Empty:
+                pass
+            else:
                 try:
-                    ch = self._full.play()
-                    if ch and self._volume is not None:
-                        try:
-                            ch.set_volume(self._volume)
-                        except Exception:
-                            pass
-                    with self._audio_lock:
-                        self._audio_channel = ch
-                    while not self._stop_event.is_set() and self._is_playing_channel(ch):
-                        time.sleep(0.1)
+                    self._handle(op, player, arg)
                 except Exception as e:
-                    print(f"Audio play error (full): {e}")
-                finally:
-                    try:
-                        with self._audio_lock:
-                            if self._audio_channel is ch:
-                                self._audio_channel = None
-                    except Exception:
-                        pass
+                    print(f"Audio service error ({op}): {e}")
+            if self._intros:
+                self._advance_intros()
+            self._release_finished()
+
+    def _handle(self, op, player, arg):
+        if op == _CMD_PLAY:
+            self._play(player)
+        elif op == _CMD_LOADED:
+            # Toca só se ninguém parou o handle enquanto o som era decodificado
+            if player in self._loading:
+                self._loading.discard(player)
+                self._play(player)
+        elif op == _CMD_STOP:
+            self._stop(player)
+        elif op == _CMD_SET_VOLUME:
+            if player._channel is not None:
+                player._channel.set_volume(arg)
+        elif op == _CMD_STOP_ALL:
+            for playing in self._voices:
+                if playing is not None:
+                    self._stop(playing)
+            for waiting in list(self._loading):
+                self._stop(waiting)
+        elif op == _CMD_CONFIGURE:
+            self.voice_count, self.max_instances = arg
+            if self._channels:
+                self._ensure_channels()
+
+    def _ensure_channels(self):
+        """Ajusta os canais do mixer ao número de vozes (o mixer já precisa estar inicializado)."""
+        if len(self._channels) == self.voice_count:
+            return
+        for playing in self._voices[self.voice_count:]:
+            if playing is not None:
+                self._stop(playing)
+        pygame.mixer.set_num_channels(self.voice_count)
+        self._channels = [pygame.mixer.Channel(i) for i in range(self.voice_count)]
+        self._voices = (self._voices + [None] * self.voice_count)[:self.voice_count]
+
+    def _release_finished(self):
+        """Libera as vozes cujos sons terminaram (e marca os handles como parados)."""
+        voices = self._voices
+        for index, playing in enumerate(voices):
+            if playing is not None and playing not in self._intros and not self._channels[index].get_busy():
+                playing._playing = False
+                playing._channel = None
+                playing._voice = None
+                voices[index] = None
+
+    def _allocate(self, player):
+        """Escolhe a voz para o handle, roubando outra se preciso. Retorna o índice ou None."""
+        voices = self._voices
+        self._release_finished()
+
+        same_sound = [index for index, playing in enumerate(voices)
+                      if playing is not None and playing.path == player.path]
+        if len(same_sound) >= self.max_instances:
+            return self._steal(min(same_sound, key=lambda index: voices[index]._started))
+
+        for index, playing in enumerate(voices):
+            if playing is None:
+                return index
+
+        candidates = [index for index, playing in enumerate(voices) if playing._priority <= player._priority]
+        if not candidates:
+            return None
+        return self._steal(min(candidates, key=lambda index: (voices[index]._priority, voices[index]._started)))
+
+    def _steal(self, index):
+        self.stolen += 1
+        self._stop(self._voices[index])
+        return index
+
+    def _play(self, player):
+        if not player._load():
+            # Som ainda decodificando no pool do preload: toca quando chegar _CMD_LOADED
+            self._loading.add(player)
+            return
+        try:
+            if not player._full and not player._loop:
+                return
+            self._ensure_channels()
+            index = self._allocate(player)
+            if index is None:
+                self.dropped += 1
+                return
+            channel = self._channels[index]
+            self._sequence += 1
+            player._started = self._sequence
+            player._voice = index
+            player._channel = channel
+            self._voices[index] = player
+            if player._full:
+                self._start_channel(player, player._full, 0)
+                if player._loop:
+                    self._intros.append(player)
+            else:
+                self._start_channel(player, player._loop, -1)
+        finally:
+            player._pending = False
+
+    def _start_channel(self, player, sound, loops):
+        channel = player._channel
+        channel.play(sound, loops=loops)
+        player._playing = True
+        # Channel.play não zera o volume do canal: sem volume próprio o som toca no volume cheio,
+        # e não no do último som que usou esta voz
+        try:
+            channel.set_volume(1.0 if player._volume is None else player._volume)
+        except Exception:
+            pass
 
-            # play loop
-            if self._loop:
+    def _advance_intros(self):
+        """Passa para o loop (na mesma voz) os sons cuja parte "full" terminou."""
+        still_playing = []
+        for player in self._intros:
+            if player._channel is not None and player._channel.get_busy():
+                still_playing.append(player)
+            elif player._channel is not None:
                 try:
-                    ch = self._loop.play(loops=-1)
-                    with self._audio_lock:
-                        self._audio_channel = ch
-                    while not self._stop_event.is_set():
-                        time.sleep(0.1)
-                    try:
-                        if ch.get_busy():
-                            ch.stop()
-                    except Exception:
-                        pass
+                    self._start_channel(player, player._loop, -1)
                 except Exception as e:
                     print(f"Audio play error (loop): {e}")
-                finally:
-                    try:
-                        with self._audio_lock:
-                            if self._audio_channel is ch:
-                                self._audio_channel = None
-                    except Exception:
-                        pass
-        finally:
-            # cleanup only for own tmp
-            try:
-                if self._own_tmp and self._loop_tmp and os.path.isfile(self._loop_tmp):
-                    try:
-                        os.unlink(self._loop_tmp)
-                    except Exception:
-                        pass
-                    self._loop_tmp = None
-            except Exception:
-                pass
-            try:
-                with self._audio_lock:
-                    self._audio_channel = None
-            except Exception:
-                pass
-            # remove from active players
-            with _players_lock:
-                _active_players.discard(self)
+        self._intros = still_playing
 
-    def start(self):
-        if self._thread and self._thread.is_alive():
-            return
-        # Register
-        with _players_lock:
-            _active_players.add(self)
-        self._stop_event.clear()
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+    def _stop(self, player):
+        if player in self._intros:
+            self._intros.remove(player)
+        if player in self._loading:
+            self._loading.discard(player)
+            player._pending = False
+        index = player._voice
+        if index is not None and index < len(self._voices) and self._voices[index] is player:
+            self._voices[index] = None
+        player._voice = None
+        player._playing = False
+        channel = player._channel
+        player._channel = None
+        if channel is not None and channel.get_busy():
+            channel.stop()
 
-    def stop(self):
-        # Signal stop
-        try:
-            self._stop_event.set()
-        except Exception:
-            pass
+    def stats(self):
+        in_use = sum(1 for playing in list(self._voices) if playing is not None and playing._playing)
+        return {"voices": self.voice_count, "in_use": in_use, "stolen": self.stolen, "dropped": self.dropped}
 
-        play_to_stop = None
-        try:
-            with self._audio_lock:
-                play_to_stop = self._audio_channel
-                self._audio_channel = None
-        except Exception:
-            play_to_stop = None
 
-        try:
-            if play_to_stop and self._is_playing_channel(play_to_stop):
-                try:
-                    play_to_stop.stop()
-                except Exception:
-                    pass
-        except Exception:
-            pass
+_service = None
+_service_lock = threading.Lock()
+
+
+def _get_service():
+    """Serviço de áudio, criado na primeira vez que é usado."""
+    global _service
+    service = _service
+    if service is None:
+        with _service_lock:
+            if _service is None:
+                _service = _AudioService()
+            service = _service
+    return service
+
+
+def _send(op, player=None, arg=None):
+    """Coloca um comando na fila do serviço de áudio."""
+    _get_service().commands.put((op, player, arg))
 
-    def is_playing(self):
-        try:
-            with self._audio_lock:
-                ch = self._audio_channel
-            return self._is_playing_channel(ch)
-        except Exception:
-            return False
+
+def configure_voices(voice_count=VOICE_COUNT, max_instances=MAX_INSTANCES_PER_SOUND):
+    """Define o número de vozes do pool e o máximo de instâncias simultâneas de um mesmo som."""
+    _send(_CMD_CONFIGURE, None, (voice_count, max_instances))
+
+
+def voice_stats():
+    """Vozes do pool, quantas estão tocando e quantos sons roubaram voz ou foram descartados."""
+    return _get_service().stats()
 
 
 # Background music helpers using pygame.mixer.music (streaming, low memory)
@@ -452,20 +752,29 @@ def is_background_music_playing():
 
 def stop_all():
     """Para todos os players ativos."""
-    with _players_lock:
-        players = list(_active_players)
-    for p in players:
+    _send(_CMD_STOP_ALL)
+
+def play_loop(path, volume=None, category=CATEGORY_SIREN):
+    """Toca um som com a versão de loop (ex: sirene) até chamar .stop() no player retornado.
+    Retorna o SoundPlayer ou None em falha.
+    """
+    try:
+        player = SoundPlayer(path, use_loop=True, volume=volume, category=category)
+        player.start()
+        return player
+    except Exception as e:
         try:
-            p.stop()
+            print(f"play_loop error: {e}")
         except Exception:
             pass
+        return None
 
-def play_one_shot(path, volume=None):
+def play_one_shot(path, volume=None, category=CATEGORY_UI):
     """Toca um som uma vez (não em loop). Retorna o SoundPlayer ou None em falha.
     Aceita caminho relativo.
     """
     try:
-        player = SoundPlayer(path, use_loop=False, volume=volume)  # SoundPlayer já resolve o caminho
+        player = SoundPlayer(path, use_loop=False, volume=volume, category=category)  # SoundPlayer já resolve o caminho
         player.start()
         return player
     except Exception as e:
@@ -473,4 +782,21 @@ def play_one_shot(path, volume=None):
             print(f"play_one_shot error: {e}")
         except Exception:
             pass
-        return None
\ No newline at end of file
+        return None
+
+def play_sound(sound_id, volume=None, loop=None):
+    """
+    Toca o som do manifesto com o id dado, com a categoria e o volume da entrada (volume
+    sobrescreve o do manifesto). loop=None segue a entrada; True/False força loop ou one-shot.
+    Retorna o SoundPlayer ou None em falha.
+    """
+    try:
+        entry = get_sound(sound_id)
+    except KeyError:
+        print(f"play_sound error: unknown sound id '{sound_id}'")
+        return None
+    if volume is None:
+        volume = entry.volume
+    if entry.loop if loop is None else loop:
+        return play_loop(entry.path, volume=volume, category=entry.category)
+    return play_one_shot(entry.path, volume=volume, category=entry.category)
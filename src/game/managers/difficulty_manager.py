@@ -1,7 +1,43 @@
 # Gerenciador de progressão de dificuldade do jogo
+import json
+import os
+
+import numpy as np
+
+# Resolução das tabelas de dificuldade: segundos de progressão por entrada
+DIFFICULTY_TABLE_STEP = 0.1
+
+# Curvas de dificuldade: cada uma vira uma tabela com o valor do atributo a cada DIFFICULTY_TABLE_STEP
+DIFFICULTY_CURVES = (
+    "scroll_speed_multiplier",
+    "spawn_rate_multiplier",
+    "enemy_speed_multiplier",
+    "hole_spawn_probability",
+    "oil_stain_spawn_probability",
+    "invulnerability_spawn_probability",
+    "beer_spawn_probability",
+    "slowmotion_spawn_probability",
+)
+
 
 class DifficultyManager:
-    def __init__(self):
+    """
+    A dificuldade é uma função pura de (tempo decorrido, pontuação): a progressão é
+    tempo + pontuação * score_time_weight, e cada curva é lida de uma tabela pré-calculada nesse
+    ponto. O resultado não depende de quantas vezes update foi chamado, então a simulação pode
+    pular direto para qualquer momento da partida.
+
+    As curvas padrão crescem linearmente a partir do valor inicial até o limite (ver _linear_curves).
+    Um arquivo JSON opcional (curves_path) pode substituí-las, com o formato:
+
+        {"table_step": 0.1, "score_time_weight": 0.0,
+         "curves": {"enemy_speed_multiplier": {"start": 1.0, "rate": 0.004, "limit": 2.5},
+                    "hole_spawn_probability": {"points": [[0, 0.35], [600, 0.45], [1200, 0.5]]}}}
+
+    Curvas por pontos são interpoladas linearmente e ficam no último valor depois do último ponto.
+    """
+
+    def __init__(self, curves_path=None):
         # Valores base (iniciais)
         self.base_scroll_speed = 0.18
         self.base_spawn_rate = 300  # Reduzido de 1000 para 300 para spawn mais frequente no início
@@ -30,6 +66,7 @@ class DifficultyManager:
         self.oil_stain_spawn_increase_rate = 0.00006  # Reduzido para progressão mais lenta
         self.invulnerability_spawn_increase_rate = 0.0001  # Aumento gradual da chance de power-ups
         self.slowmotion_spawn_increase_rate = 0.00008  # Aumento gradual da chance de slow motion
+        self.beer_spawn_increase_rate = 0.0  # A chance de cerveja não muda com o tempo
 
         # Limites máximos para evitar valores extremos
         self.max_scroll_speed_multiplier = 2.0
@@ -41,68 +78,153 @@ class DifficultyManager:
         self.max_beer_spawn_probability = 0.8  # Máximo de 80% de chance, igual à invulnerabilidade
         self.max_slowmotion_spawn_probability = 0.5  # Máximo de 50% de chance para slow motion
 
+        # Quantos segundos de progressão cada ponto vale (0 = a dificuldade só depende do tempo)
+        self.score_time_weight = 0.0
+
         # Controles para ajustes manuais
         self.manual_control_enabled = False
-        self.last_update_time = 0
-        
+
         # Contadores para spawn forçado
         self.invulnerability_spawn_counter = 0
         self.slowmotion_spawn_counter = 0
 
-    def update(self, current_time, score):
+        # Tabelas das curvas: lista de (atributo, valores)
+        self.table_step = DIFFICULTY_TABLE_STEP
+        self._curve_specs = self._linear_curves()
+        if curves_path:
+            self.load_curves(curves_path)
+        self._tables = []
+        self.build_tables()
+
+    def _linear_curves(self):
+        """Curvas padrão: (valor inicial, taxa por segundo, limite) de cada atributo."""
+        return {
+            "scroll_speed_multiplier": (1.0, self.scroll_speed_increase_rate, self.max_scroll_speed_multiplier),
+            "spawn_rate_multiplier": (1.0, -self.spawn_rate_decrease_rate, self.min_spawn_rate_multiplier),
+            "enemy_speed_multiplier": (1.0, self.enemy_speed_increase_rate, self.max_enemy_speed_multiplier),
+            "hole_spawn_probability": (self.base_hole_spawn_probability, self.hole_spawn_increase_rate,
+                                       self.max_hole_spawn_probability),
+            "oil_stain_spawn_probability": (self.base_oil_stain_spawn_probability, self.oil_stain_spawn_increase_rate,
+                                            self.max_oil_stain_spawn_probability),
+            "invulnerability_spawn_probability": (self.base_invulnerability_spawn_probability,
+                                                  self.invulnerability_spawn_increase_rate,
+                                                  self.max_invulnerability_spawn_probability),
+            "beer_spawn_probability": (self.base_beer_spawn_probability, self.beer_spawn_increase_rate,
+                                       self.max_beer_spawn_probability),
+            "slowmotion_spawn_probability": (self.base_slowmotion_spawn_probability,
+                                             self.slowmotion_spawn_increase_rate,
+                                             self.max_slowmotion_spawn_probability),
+        }
+
+    def load_curves(self, curves_path):
+        """Lê curvas de um arquivo JSON (relativo à raiz do projeto); sem o arquivo ficam as padrão."""
+        if not os.path.isabs(curves_path):
+            current_dir = os.path.dirname(os.path.abspath(__file__))
+            project_root = os.path.normpath(os.path.join(current_dir, "..", "..", ".."))
+            curves_path = os.path.join(project_root, curves_path)
+        if not os.path.exists(curves_path):
+            return
+        try:
+            with open(curves_path, 'r') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"Erro ao carregar curvas de dificuldade de {curves_path}: {e}")
+            return
+
+        try:
+            table_step, score_time_weight, curve_specs = self._parse_curves(data)
+        except (ValueError, TypeError) as e:
+            # Arquivo inválido: mantém as curvas padrão em vez de quebrar o jogo na inicialização
+            print(f"Erro ao carregar curvas de dificuldade de {curves_path}: {e}")
+            return
+        self.table_step = table_step
+        self.score_time_weight = score_time_weight
+        self._curve_specs = curve_specs
+
+    def _parse_curves(self, data):
         """
-        Atualiza os multiplicadores baseados no tempo e pontuação
-        current_time: tempo decorrido em segundos
-        score: pontuação atual do jogador
+        Valida o conteúdo do JSON de curvas e retorna (table_step, score_time_weight, curvas).
+        Levanta ValueError / TypeError se algum valor for inválido.
         """
-        if current_time == 0:
-            self.last_update_time = current_time
-            return
+        def number(value, what):
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or not np.isfinite(value):
+                raise ValueError(f"{what} deve ser um número, não {value!r}")
+            return float(value)
 
-        # Calcula o delta time
-        delta_time = current_time - self.last_update_time
-        self.last_update_time = current_time
+        if not isinstance(data, dict):
+            raise ValueError("o arquivo deve conter um objeto JSON")
+        table_step = number(data.get("table_step", self.table_step), "table_step")
+        if table_step <= 0:
+            raise ValueError(f"table_step deve ser maior que zero, não {table_step}")
+        score_time_weight = number(data.get("score_time_weight", self.score_time_weight), "score_time_weight")
 
-        if not self.manual_control_enabled:
-            # Atualização automática baseada no tempo
-            self.scroll_speed_multiplier = min(
-                self.scroll_speed_multiplier + (self.scroll_speed_increase_rate * delta_time),
-                self.max_scroll_speed_multiplier
-            )
+        curves = data.get("curves", {})
+        if not isinstance(curves, dict):
+            raise ValueError("curves deve ser um objeto")
+        curve_specs = dict(self._curve_specs)
+        for name, curve in curves.items():
+            if name not in DIFFICULTY_CURVES:
+                print(f"Curva de dificuldade desconhecida ignorada: {name}")
+                continue
+            if not isinstance(curve, dict):
+                raise ValueError(f"a curva {name} deve ser um objeto")
+            if "points" in curve:
+                points = curve["points"]
+                if not isinstance(points, list) or not points:
+                    raise ValueError(f"a curva {name} precisa de pelo menos um ponto [t, valor]")
+                parsed = []
+                for point in points:
+                    if not isinstance(point, (list, tuple)) or len(point) != 2:
+                        raise ValueError(f"ponto inválido na curva {name}: {point!r} (esperado [t, valor])")
+                    parsed.append((number(point[0], f"t de {name}"), number(point[1], f"valor de {name}")))
+                if any(later[0] < earlier[0] for earlier, later in zip(parsed, parsed[1:])):
+                    raise ValueError(f"os pontos da curva {name} devem estar em ordem crescente de t")
+                curve_specs[name] = parsed
+            else:
+                start, rate, limit = curve_specs[name] if isinstance(curve_specs[name], tuple) \
+                    else self._linear_curves()[name]
+                curve_specs[name] = (number(curve.get("start", start), f"start de {name}"),
+                                     number(curve.get("rate", rate), f"rate de {name}"),
+                                     number(curve.get("limit", limit), f"limit de {name}"))
+        return table_step, score_time_weight, curve_specs
 
-            self.spawn_rate_multiplier = max(
-                self.spawn_rate_multiplier - (self.spawn_rate_decrease_rate * delta_time),
-                self.min_spawn_rate_multiplier
-            )
+    def build_tables(self):
+        """
+        Pré-calcula cada curva em uma tabela com um valor a cada table_step segundos de progressão,
+        até o ponto em que a curva para de mudar; dali em diante vale a última entrada.
+        """
+        self._tables = []
+        for name in DIFFICULTY_CURVES:
+            spec = self._curve_specs[name]
+            if isinstance(spec, tuple):
+                start, rate, limit = spec
+                duration = abs(limit - start) / abs(rate) if rate else 0.0
+                times = np.arange(int(np.ceil(duration / self.table_step)) + 1) * self.table_step
+                values = start + rate * times
+                if rate > 0:
+                    values = np.minimum(values, limit)
+                elif rate < 0:
+                    values = np.maximum(values, limit)
+            else:
+                point_times, point_values = zip(*spec)
+                times = np.arange(int(np.ceil(point_times[-1] / self.table_step)) + 1) * self.table_step
+                values = np.interp(times, point_times, point_values)
+            self._tables.append((name, values.tolist()))
+        self._apply(0)
 
-            self.enemy_speed_multiplier = min(
-                self.enemy_speed_multiplier + (self.enemy_speed_increase_rate * delta_time),
-                self.max_enemy_speed_multiplier
-            )
-            
-            # Atualiza a probabilidade de spawn de buracos
-            self.hole_spawn_probability = min(
-                self.hole_spawn_probability + (self.hole_spawn_increase_rate * delta_time),
-                self.max_hole_spawn_probability
-            )
-            
-            # Atualiza a probabilidade de spawn de manchas de óleo
-            self.oil_stain_spawn_probability = min(
-                self.oil_stain_spawn_probability + (self.oil_stain_spawn_increase_rate * delta_time),
-                self.max_oil_stain_spawn_probability
-            )
-            
-            # Atualiza a probabilidade de spawn de power-ups de invulnerabilidade
-            self.invulnerability_spawn_probability = min(
-                self.invulnerability_spawn_probability + (self.invulnerability_spawn_increase_rate * delta_time),
-                self.max_invulnerability_spawn_probability
-            )
-            
-            # Atualiza a probabilidade de spawn de power-ups de slow motion
-            self.slowmotion_spawn_probability = min(
-                self.slowmotion_spawn_probability + (self.slowmotion_spawn_increase_rate * delta_time),
-                self.max_slowmotion_spawn_probability
-            )
+    def _apply(self, index):
+        for name, table in self._tables:
+            setattr(self, name, table[index] if index < len(table) else table[-1])
+
+    def update(self, current_time, score):
+        """
+        Posiciona os multiplicadores no ponto da curva dado pelo tempo e pela pontuação
+        current_time: tempo decorrido em segundos
+        score: pontuação atual do jogador
+        """
+        if not self.manual_control_enabled:
+            progress = current_time + score * self.score_time_weight
+            self._apply(int(progress / self.table_step) if progress > 0 else 0)
 
     def get_current_scroll_speed(self):
         """Retorna a velocidade de rolagem atual"""
@@ -190,17 +312,9 @@ class DifficultyManager:
 
     def reset(self):
         """Reseta todos os multiplicadores para os valores iniciais"""
-        self.scroll_speed_multiplier = 1.0
-        self.spawn_rate_multiplier = 1.0
-        self.enemy_speed_multiplier = 1.0
-        self.hole_spawn_probability = self.base_hole_spawn_probability
-        self.oil_stain_spawn_probability = self.base_oil_stain_spawn_probability
-        self.invulnerability_spawn_probability = self.base_invulnerability_spawn_probability
-        self.beer_spawn_probability = self.base_beer_spawn_probability
-        self.slowmotion_spawn_probability = self.base_slowmotion_spawn_probability
+        self._apply(0)
         self.invulnerability_spawn_counter = 0
         self.slowmotion_spawn_counter = 0
-        self.last_update_time = 0
 
     def toggle_manual_control(self):
         """Alterna entre controle automático e manual"""
@@ -0,0 +1,58 @@
+import glfw
+import pygame
+
+from src.game.simulation import InputState
+
+JOYSTICK_DEADZONE = 0.3  # Zona morta para o analógico
+JOYSTICK_HORN_BUTTON = 2  # Botão para buzina (geralmente o botão 2 é o 'X' no PS2)
+
+
+class GlfwInput:
+    """Lê teclado (GLFW) e joystick (pygame) e converte em um InputState para a simulação."""
+
+    def __init__(self, window, joystick=None):
+        self.window = window
+        self.joystick = joystick
+
+    def poll(self):
+        steer, throttle, horn = 0.0, 0, False
+
+        # --- Controle do Joystick ---
+        joystick = self.joystick
+        if joystick:
+            pygame.event.pump()  # Processa eventos internos do pygame
+
+            # Eixo X (esquerda/direita) do analógico esquerdo
+            axis_x = joystick.get_axis(0)
+            if abs(axis_x) > JOYSTICK_DEADZONE:
+                steer = axis_x
+
+            # Eixo Y (cima/baixo) do analógico esquerdo; pygame considera -1 para cima
+            axis_y = joystick.get_axis(1)
+            if abs(axis_y) > JOYSTICK_DEADZONE:
+                throttle = 1 if axis_y < 0 else -1
+
+            # D-Pad (Hat)
+            if joystick.get_numhats() > 0:
+                hat_x, hat_y = joystick.get_hat(0)
+                if hat_x != 0:
+                    steer = hat_x
+                if hat_y != 0:
+                    throttle = 1 if hat_y > 0 else -1
+
+            horn = bool(joystick.get_button(JOYSTICK_HORN_BUTTON))
+
+        # --- Controle do Teclado (Fallback) ---
+        # Se o joystick não moveu o caminhão, verifica o teclado
+        window = self.window
+        if steer == 0.0:
+            if glfw.get_key(window, glfw.KEY_LEFT) == glfw.PRESS: steer -= 1.0
+            if glfw.get_key(window, glfw.KEY_RIGHT) == glfw.PRESS: steer += 1.0
+
+        if throttle == 0:
+            if glfw.get_key(window, glfw.KEY_UP) == glfw.PRESS:
+                throttle = 1
+            elif glfw.get_key(window, glfw.KEY_DOWN) == glfw.PRESS:
+                throttle = -1
+
+        return InputState(steer, throttle, horn)
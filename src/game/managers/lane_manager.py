@@ -1,27 +1,137 @@
 import random
 
-def get_safe_lane_for_powerup(powerups, lane_count, screen_height, safety_dist):
+import numpy as np
+
+
+# Folga (px) ao comparar uma posição com o máximo guardado relativo ao deslocamento do tipo
+_SHIFT_TOLERANCE = 1e-6
+
+
+class LaneOccupancy:
+    """
+    Índice de ocupação das faixas: para cada tipo de entidade e faixa guarda o y mais alto, o topo
+    mais alto (y + altura) e quantas entidades há. As consultas de faixa segura leem só esse índice,
+    em O(faixas), em vez de varrer todas as entidades a cada spawn.
+
+    O EntityStore mantém o índice incrementalmente:
+    - add / remove quando uma entidade entra ou sai (O(1));
+    - shift quando todas as entidades de um tipo descem juntas com a pista: os valores de cada tipo
+      ficam relativos a um deslocamento próprio, então rolar o tipo inteiro é somar a esse
+      deslocamento (O(1));
+    - invalidate quando as entidades de um tipo andam cada uma de um jeito (inimigos) ou quando a
+      mais alta de uma faixa sai. Só as faixas desse tipo são recalculadas, e só na próxima
+      consulta a ele, com as linhas (faixa, y, altura) que source(tipo) devolve.
+    """
+
+    def __init__(self, kind_count, lane_count, source=None):
+        self.kind_count = kind_count
+        self.lane_count = lane_count
+        self.source = source
+        self.clear()
+
+    def clear(self):
+        size = self.kind_count * self.lane_count
+        self._max_y = [-np.inf] * size
+        self._max_top = [-np.inf] * size
+        self._counts = [0] * size
+        self._offset = [0.0] * self.kind_count
+        self._dirty = set()
+
+    def add(self, kind, lane, y, height):
+        if kind in self._dirty or not 0 <= lane < self.lane_count:
+            return
+        cell = kind * self.lane_count + lane
+        offset = self._offset[kind]
+        self._counts[cell] += 1
+        if y - offset > self._max_y[cell]:
+            self._max_y[cell] = y - offset
+        if y + height - offset > self._max_top[cell]:
+            self._max_top[cell] = y + height - offset
+
+    def remove(self, kind, lane, y, height):
+        if kind in self._dirty or not 0 <= lane < self.lane_count:
+            return
+        cell = kind * self.lane_count + lane
+        offset = self._offset[kind]
+        self._counts[cell] -= 1
+        if self._counts[cell] <= 0:
+            self._counts[cell] = 0
+            self._max_y[cell] = self._max_top[cell] = -np.inf
+        # Se era a mais alta da faixa, o novo máximo só sai recalculando o tipo (com folga para o
+        # arredondamento acumulado pelos deslocamentos)
+        elif (y - offset >= self._max_y[cell] - _SHIFT_TOLERANCE or
+              y + height - offset >= self._max_top[cell] - _SHIFT_TOLERANCE):
+            self._dirty.add(kind)
+
+    def shift(self, kind, dy):
+        """Todas as entidades ativas do tipo andaram dy."""
+        self._offset[kind] += dy
+
+    def invalidate(self, kind):
+        self._dirty.add(kind)
+
+    def _refresh(self, kind):
+        self._dirty.discard(kind)
+        lanes, y, height = self.source(kind)
+        valid = (lanes >= 0) & (lanes < self.lane_count)
+        lanes = lanes[valid]
+        max_y = np.full(self.lane_count, -np.inf)
+        max_top = np.full(self.lane_count, -np.inf)
+        np.maximum.at(max_y, lanes, y[valid])
+        np.maximum.at(max_top, lanes, y[valid] + height[valid])
+        start = kind * self.lane_count
+        end = start + self.lane_count
+        self._max_y[start:end] = max_y.tolist()
+        self._max_top[start:end] = max_top.tolist()
+        self._counts[start:end] = np.bincount(lanes, minlength=self.lane_count).tolist()
+        self._offset[kind] = 0.0
+
+    def max_y(self, kind, lane):
+        """Maior y das entidades do tipo na faixa (-inf se não houver nenhuma)."""
+        if kind in self._dirty:
+            self._refresh(kind)
+        return self._max_y[kind * self.lane_count + lane] + self._offset[kind]
+
+    def max_top(self, kind, lane):
+        """Maior y + altura das entidades do tipo na faixa (-inf se não houver nenhuma)."""
+        if kind in self._dirty:
+            self._refresh(kind)
+        return self._max_top[kind * self.lane_count + lane] + self._offset[kind]
+
+    def count(self, kind, lane):
+        if kind in self._dirty:
+            self._refresh(kind)
+        return self._counts[kind * self.lane_count + lane]
+
+    def lanes_below(self, kind, lanes, limit):
+        """Faixas (dentre as dadas) em que nenhuma entidade do tipo chegou a y >= limit."""
+        if kind in self._dirty:
+            self._refresh(kind)
+        max_y = self._max_y
+        start = kind * self.lane_count
+        shift = self._offset[kind]
+        return [lane for lane in lanes if max_y[start + lane] + shift < limit]
+
+
+def get_safe_lane_for_powerup(occupancy, kind, lane_count, screen_height, safety_dist, rng=random):
     all_lanes = range(0, lane_count * 2)
     # Verifica se há faixas seguras (sem outros power-ups muito próximos)
-    safe_lanes = [lane for lane in all_lanes if
-                  max((p.y for p in powerups if p.lane_index == lane), default=0) < screen_height - safety_dist]
+    safe_lanes = occupancy.lanes_below(kind, all_lanes, screen_height - safety_dist)
 
     # Se não houver faixas seguras, usa todas as faixas
     if not safe_lanes:
         safe_lanes = all_lanes
 
-    return random.choice(safe_lanes)
+    return rng.choice(safe_lanes)
 
 
-def get_safe_lanes_for_obstacles(oil_stains, lane_count_per_direction, screen_height, safety_distance):
+def get_safe_lanes_for_obstacles(occupancy, kind, lane_count_per_direction, screen_height, safety_distance):
     all_lanes = range(0, lane_count_per_direction * 2)
     # Relaxamos a restrição de segurança para permitir mais manchas
-    safe_lanes = [lane for lane in all_lanes if
-                  max((o.y for o in oil_stains if o.lane_index == lane),
-                      default=0) < screen_height - safety_distance / 2]
+    safe_lanes = occupancy.lanes_below(kind, all_lanes, screen_height - safety_distance / 2)
 
     # Se não houver faixas seguras, usa todas as faixas
     if not safe_lanes:
         safe_lanes = all_lanes
 
-    return safe_lanes, all_lanes
\ No newline at end of file
+    return safe_lanes, all_lanes
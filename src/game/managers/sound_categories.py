@@ -0,0 +1,15 @@
+# Categorias de som (sem depender do pygame, para a simulação headless poder usá-las)
+# Prioridade de cada categoria na disputa por vozes: um som só rouba a voz de outro com prioridade
+# menor ou igual (a sirene nunca é cortada por uma batida)
+CATEGORY_SIREN = "siren"
+CATEGORY_CRASH = "crash"
+CATEGORY_PICKUP = "pickup"
+CATEGORY_HORN = "horn"
+CATEGORY_UI = "ui"
+CATEGORY_PRIORITIES = {
+    CATEGORY_SIREN: 4,
+    CATEGORY_CRASH: 3,
+    CATEGORY_PICKUP: 2,
+    CATEGORY_HORN: 1,
+    CATEGORY_UI: 0,
+}
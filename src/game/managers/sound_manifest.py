@@ -0,0 +1,50 @@
+from src.game.managers.sound_categories import CATEGORY_CRASH, CATEGORY_HORN, CATEGORY_PICKUP, CATEGORY_SIREN, \
+    CATEGORY_UI
+
+# Ids dos sons; o jogo toca sons pelo id (audio_manager.play_sound) e não pelo caminho do arquivo
+SOUND_SIREN = "siren"
+SOUND_CRASH = "crash"
+SOUND_GAME_OVER = "game_over"
+SOUND_BEER = "beer"
+SOUND_INVULNERABILITY = "invulnerability"
+SOUND_SLOWMOTION = "slowmotion"
+SOUND_HORN = "horn"
+MUSIC_BACKGROUND = "background_music"
+
+
+class SoundEntry:
+    """
+    Um som do jogo: arquivo, categoria (prioridade na disputa por vozes) e volume padrão.
+    loop: se True o som toca a versão "full" e depois o trecho [loop_start_ms, loop_end_ms) em loop.
+    stream: músicas tocadas por streaming (pygame.mixer.music); não são decodificadas no preload.
+    """
+    __slots__ = ("id", "path", "category", "volume", "loop", "loop_start_ms", "loop_end_ms", "stream")
+
+    def __init__(self, id, path, category=CATEGORY_UI, volume=None, loop=False, loop_start_ms=None,
+                 loop_end_ms=None, stream=False):
+        self.id = id
+        self.path = path
+        self.category = category
+        self.volume = volume
+        self.loop = loop
+        self.loop_start_ms = loop_start_ms
+        self.loop_end_ms = loop_end_ms
+        self.stream = stream
+
+
+SOUND_MANIFEST = {entry.id: entry for entry in (
+    SoundEntry(SOUND_SIREN, "assets/sound/police_sound.wav", CATEGORY_SIREN, volume=0.7, loop=True,
+               loop_start_ms=4000),
+    SoundEntry(SOUND_CRASH, "assets/sound/crash.wav", CATEGORY_CRASH, volume=0.7),
+    SoundEntry(SOUND_GAME_OVER, "assets/sound/game_over.wav", CATEGORY_UI),
+    SoundEntry(SOUND_BEER, "assets/sound/beer.wav", CATEGORY_PICKUP),
+    SoundEntry(SOUND_INVULNERABILITY, "assets/sound/invulnerability.wav", CATEGORY_PICKUP),
+    SoundEntry(SOUND_SLOWMOTION, "assets/sound/invulnerability.wav", CATEGORY_PICKUP, volume=0.8),
+    SoundEntry(SOUND_HORN, "assets/sound/horn.mp3", CATEGORY_HORN, volume=0.7),
+    SoundEntry(MUSIC_BACKGROUND, "assets/sound/background_music_1.mp3", stream=True),
+)}
+
+
+def get_sound(sound_id):
+    """Entrada do manifesto com o id dado (KeyError se não existir)."""
+    return SOUND_MANIFEST[sound_id]
@@ -2,8 +2,6 @@ import glfw
 from OpenGL.GL import *
 from OpenGL.GLU import *
 
-from src.game.entities.road import draw_rect
-
 
 def setup_menu_viewport_and_convert_mouse(content_vp, base_total_width, base_height, fb_height, offset_x, offset_y,
                                           scale, window):
@@ -25,8 +23,8 @@ def setup_menu_viewport_and_convert_mouse(content_vp, base_total_width, base_hei
     return mouse_x, mouse_y
 
 
-def setup_panel_viewport(panel_vp, base_panel_width, base_height, panel_width, screen_height, color_panel, scroll_speed):
-    """Configura a viewport do painel lateral e desenha o fundo"""
+def setup_panel_viewport(panel_vp, base_panel_width, base_height, scroll_speed):
+    """Configura a viewport do painel lateral (o fundo e o conteúdo são desenhados pelo HudPanel)"""
     glViewport(panel_vp[0], panel_vp[1], panel_vp[2], panel_vp[3])
     glMatrixMode(GL_PROJECTION)
     glLoadIdentity()
@@ -34,10 +32,6 @@ def setup_panel_viewport(panel_vp, base_panel_width, base_height, panel_width, s
     glMatrixMode(GL_MODELVIEW)
     glLoadIdentity()
 
-    # Painel lateral - fundo
-    draw_rect(0, 0, panel_width, screen_height, color_panel)
-    time_elapsed = glfw.get_time()
-
     # Calcula a velocidade considerando o efeito do buraco com transição suave
     base_speed = abs(scroll_speed * 400)
-    return time_elapsed, base_speed
\ No newline at end of file
+    return base_speed
\ No newline at end of file
@@ -0,0 +1,45 @@
+class ObjectPool:
+    """
+    Pool de objetos de uma classe: acquire devolve uma instância reciclada (reinicializada com
+    reinit(...), que recebe os mesmos argumentos do construtor) ou cria uma nova se não houver
+    nenhuma livre; release devolve o objeto para ser reaproveitado. Evita criar e descartar
+    objetos a cada spawn durante partidas longas.
+
+    As estatísticas (hits, misses e o pico de objetos em uso) servem para dimensionar os pools.
+    """
+
+    def __init__(self, cls, max_free=256):
+        self.cls = cls
+        self.max_free = max_free
+        self._free = []
+        self.hits = 0
+        self.misses = 0
+        self.in_use = 0
+        self.high_water = 0
+
+    def acquire(self, *args, **kwargs):
+        if self._free:
+            obj = self._free.pop()
+            obj.reinit(*args, **kwargs)
+            self.hits += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.misses += 1
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+
+    def release(self, obj):
+        self.in_use -= 1
+        if len(self._free) < self.max_free:
+            self._free.append(obj)
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "high_water": self.high_water,
+            "in_use": self.in_use,
+            "free": len(self._free),
+        }
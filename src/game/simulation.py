@@ -0,0 +1,641 @@
+import random
+
+from src.game.entities.beer_collectible import BeerCollectible
+from src.game.entities.enemy import Enemy, EnemyDown
+from src.game.entities.hole import Hole
+from src.game.entities.invulnerability import InvulnerabilityPowerUp
+from src.game.entities.oil_stain import OilStain
+from src.game.entities.police import PoliceCar
+from src.game.entities.road import SCREEN_HEIGHT, PLAYER_SPEED, LANE_COUNT_PER_DIRECTION
+from src.game.entities.slowmotion import SlowMotionEffect, SlowMotionPowerUp
+from src.game.entities.truck import Truck
+from src.game.entity_pipeline import EntityKind, EntityPipeline
+from src.game.entity_store import EntityStore, ENEMY_KINDS, KIND_ENEMY_UP, KIND_ENEMY_DOWN, KIND_HOLE, \
+    KIND_OIL_STAIN, KIND_BEER, KIND_INVULNERABILITY, KIND_SLOWMOTION
+from src.game.game_clock import GameClock
+from src.game.managers.difficulty_manager import DifficultyManager
+from src.game.managers.lane_manager import get_safe_lanes_for_obstacles, get_safe_lane_for_powerup
+from src.game.managers.sound_manifest import SOUND_BEER, SOUND_CRASH, SOUND_GAME_OVER, SOUND_HORN, \
+    SOUND_INVULNERABILITY, SOUND_SIREN, SOUND_SLOWMOTION
+from src.game.object_pool import ObjectPool
+from src.game.status_effects import StatusEffects
+from src.ui.score_indicator import ScoreIndicator
+
+# --- Passo da Simulação ---
+# A simulação roda em ticks de tamanho fixo, independente do FPS da renderização.
+# As velocidades e timers do jogo foram ajustados "por frame" com o jogo rodando a ~500 FPS;
+# cada tick avança o equivalente a tick_scale desses frames de referência.
+SIMULATION_HZ = 120
+REFERENCE_FRAME_RATE = 500
+
+SAFETY_DISTANCE = 180
+CRASH_SCROLL_MULTIPLIER = 2.0  # Multiplicador de velocidade durante respawn (2x mais rápido)
+
+# --- Intervalos de Spawn ---
+# Em unidades do relógio de spawn, que a cada tick anda crash * slow motion * tick_scale / taxa de spawn
+ENEMY_UP_SPAWN_INTERVAL = 1 / 0.1
+ENEMY_DOWN_SPAWN_INTERVAL = 1 / 0.15
+HOLE_SPAWN_INTERVAL = 1 / 0.3
+OIL_STAIN_SPAWN_INTERVAL = 1 / 0.3
+BEER_SPAWN_INTERVAL = 1.5 / 0.4  # Mais lenta que buracos e óleo
+INVULNERABILITY_SPAWN_INTERVAL = 2.0 / 0.2  # Muito mais lenta que os outros elementos
+SLOWMOTION_SPAWN_INTERVAL = 2.5 / 0.2  # Ainda mais lenta que invulnerabilidade
+
+# --- Constantes da Polícia ---
+POLICE_SPAWN_SCORE_THRESHOLD = 0
+POLICE_COOLDOWN_SECONDS = 10  # Tempo mínimo entre dois spawns de polícia (segundos)
+
+ENEMY_COLORS = ["black", "green", "red", "yellow"]
+
+
+class InputState:
+    """
+    Comandos do jogador para um tick.
+    steer: -1.0 (esquerda) a 1.0 (direita); throttle: 1 acelera, -1 freia, 0 neutro; horn: buzina.
+    """
+    __slots__ = ("steer", "throttle", "horn")
+
+    def __init__(self, steer=0.0, throttle=0, horn=False):
+        self.steer = steer
+        self.throttle = throttle
+        self.horn = horn
+
+
+class NullInput:
+    """Fonte de entrada sem jogador (caminhão parado), para rodar a simulação sem janela."""
+
+    def poll(self):
+        return InputState()
+
+
+class NullAudio:
+    """Backend de áudio silencioso com a mesma interface usada do audio_manager."""
+
+    def play_sound(self, sound_id, volume=None, loop=None):
+        return None
+
+    def stop_background_music(self, fade_ms=500):
+        pass
+
+
+class GameSimulation:
+    """
+    Toda a lógica de jogo (spawn, movimento, colisões, pontuação, dificuldade, crash/respawn/game over)
+    sem depender de GLFW, OpenGL ou pygame. A janela do jogo é só uma casca em volta dela.
+
+    clock: GameClock da partida; cada tick o avança em dt, então o tempo de jogo é virtual (para na
+           pausa e permite rodar mais rápido que o tempo real). Se None cria um.
+    rng: gerador aleatório (random.Random) para spawns reproduzíveis.
+    input_source: objeto com poll() -> InputState, consultado a cada tick.
+    audio: backend de áudio (o módulo audio_manager ou NullAudio).
+    sprites: dicionário nome -> sprite (ver main.py); pode ser vazio quando nada é desenhado.
+    """
+
+    def __init__(self, sprites=None, clock=None, rng=None, input_source=None, audio=None,
+                 difficulty_manager=None, hz=SIMULATION_HZ, police_sound_id=SOUND_SIREN):
+        self.sprites = sprites or {}
+        self.rng = rng or random.Random()
+        self.input_source = input_source or NullInput()
+        self.audio = audio or NullAudio()
+        self.difficulty_manager = difficulty_manager or DifficultyManager()
+        self.police_sound_id = police_sound_id
+
+        self.hz = hz
+        self.dt = 1.0 / hz
+        self.tick_scale = REFERENCE_FRAME_RATE / hz
+
+        self.clock = clock or GameClock()
+        self.tick_count = 0
+
+        self.enemy_up_sprite_pairs = [(self.sprites.get(f"up_{color}"), self.sprites.get(f"up_{color}_dead"))
+                                      for color in ENEMY_COLORS]
+        self.enemy_down_sprite_pairs = [(self.sprites.get(f"down_{color}"), self.sprites.get(f"down_{color}_dead"))
+                                        for color in ENEMY_COLORS]
+        self.police_sprites = {
+            'normal_1': self.sprites.get("police_1"),
+            'normal_2': self.sprites.get("police_2"),
+            'dead': self.sprites.get("police_dead")
+        }
+
+        self.truck = Truck(self.sprites.get("truck"), self.sprites.get("truck_dead"),
+                           self.sprites.get("truck_armored"), self.sprites.get("truck_hole"),
+                           self.sprites.get("truck_oil"), self.sprites.get("truck_hole_and_oil"),
+                           clock=self.clock)
+        # Efeitos globais (hoje só o slow motion); o caminhão tem os seus em truck.effects
+        self.effects = StatusEffects()
+        self.slowmotion_effect = SlowMotionEffect(self.effects, self.clock)
+
+        # Inimigos, obstáculos, itens e indicadores de pontos são reciclados em vez de recriados
+        self.pools = {
+            KIND_ENEMY_UP: ObjectPool(Enemy),
+            KIND_ENEMY_DOWN: ObjectPool(EnemyDown),
+            KIND_HOLE: ObjectPool(Hole),
+            KIND_OIL_STAIN: ObjectPool(OilStain),
+            KIND_BEER: ObjectPool(BeerCollectible),
+            KIND_INVULNERABILITY: ObjectPool(InvulnerabilityPowerUp),
+            KIND_SLOWMOTION: ObjectPool(SlowMotionPowerUp),
+        }
+        self.score_indicator_pool = ObjectPool(ScoreIndicator)
+
+        # Inimigos, obstáculos e itens ficam em arrays NumPy (ver entity_store.py)
+        self.store = EntityStore(on_remove=self._release_entity)
+        self.score_indicators = []
+        self._tick_time = 0.0
+        self.police_car = None
+
+        # Cada tipo declara seu spawn, movimento e resposta à colisão; o pipeline roda cada etapa
+        # sobre todos os tipos (spawns de todos vencem em um único relógio de spawn)
+        self.pipeline = EntityPipeline(self.store)
+        self.pipeline.register(EntityKind(KIND_ENEMY_UP, "enemy_up", ENEMY_UP_SPAWN_INTERVAL, self._spawn_enemy_up,
+                                          update=self._move_enemies, collide=self._collide_enemy))
+        self.pipeline.register(EntityKind(KIND_ENEMY_DOWN, "enemy_down", ENEMY_DOWN_SPAWN_INTERVAL,
+                                          self._spawn_enemy_down, update=self._move_enemies,
+                                          collide=self._collide_enemy))
+        self.pipeline.register(EntityKind(KIND_HOLE, "hole", HOLE_SPAWN_INTERVAL, self._spawn_hole,
+                                          update=self._scroll_items, collide=self._collide_hole))
+        self.pipeline.register(EntityKind(KIND_OIL_STAIN, "oil_stain", OIL_STAIN_SPAWN_INTERVAL, self._spawn_oil_stain,
+                                          update=self._scroll_items, collide=self._collide_oil_stain))
+        self.pipeline.register(EntityKind(KIND_BEER, "beer", BEER_SPAWN_INTERVAL, self._spawn_beer,
+                                          update=self._scroll_items, collide=self._collide_beer))
+        self.pipeline.register(EntityKind(KIND_INVULNERABILITY, "invulnerability", INVULNERABILITY_SPAWN_INTERVAL,
+                                          self._spawn_invulnerability_powerup, update=self._scroll_items,
+                                          collide=self._collide_invulnerability_powerup))
+        self.pipeline.register(EntityKind(KIND_SLOWMOTION, "slowmotion", SLOWMOTION_SPAWN_INTERVAL,
+                                          self._spawn_slowmotion_powerup, update=self._scroll_items,
+                                          collide=self._collide_slowmotion_powerup))
+        self.reset()
+
+    def reset(self):
+        """Volta ao estado inicial de uma partida."""
+        if self.police_car:
+            self.police_car.stop_audio()
+        self.police_car = None
+        self.last_police_spawn_time = -9999.0
+
+        self.scroll_pos = 0.0
+        self.prev_scroll_pos = 0.0
+        self.scroll_speed = -PLAYER_SPEED
+        self.truck.reset()
+        self.store.clear()
+        self.effects.clear()
+        for indicator in self.score_indicators:
+            self.score_indicator_pool.release(indicator)
+        self.score_indicators.clear()
+
+        self.pipeline.reset()
+        self.beer_bonus_points = 0
+        self.difficulty_manager.reset()
+
+        self.game_over = False
+        self.tick_count = 0
+        self.clock.reset()
+
+    @property
+    def score(self):
+        return abs(self.scroll_pos * 0.1) + self.beer_bonus_points
+
+    # Listas de entidades por tipo (somente leitura; para adicionar use self.store.add)
+    @property
+    def enemies_up(self):
+        return self.store.view(KIND_ENEMY_UP)
+
+    @property
+    def enemies_down(self):
+        return self.store.view(KIND_ENEMY_DOWN)
+
+    @property
+    def all_enemies(self):
+        return self.store.view(*ENEMY_KINDS)
+
+    @property
+    def holes(self):
+        return self.store.view(KIND_HOLE)
+
+    @property
+    def oil_stains(self):
+        return self.store.view(KIND_OIL_STAIN)
+
+    @property
+    def beer_collectibles(self):
+        return self.store.view(KIND_BEER)
+
+    @property
+    def invulnerability_powerups(self):
+        return self.store.view(KIND_INVULNERABILITY)
+
+    @property
+    def slowmotion_powerups(self):
+        return self.store.view(KIND_SLOWMOTION)
+
+    def _spawn(self, kind, *args, **kwargs):
+        """Pega uma entidade do pool do tipo (reinicializada com os argumentos dados) e a coloca no store."""
+        return self.store.add(self.pools[kind].acquire(*args, **kwargs), kind)
+
+    def _release_entity(self, entity, kind):
+        self.pools[kind].release(entity)
+
+    def pool_stats(self):
+        """Estatísticas de cada pool (hits, misses, pico de uso...), por nome da classe."""
+        stats = {pool.cls.__name__: pool.stats() for pool in self.pools.values()}
+        stats[ScoreIndicator.__name__] = self.score_indicator_pool.stats()
+        return stats
+
+    def _play(self, sound_id, description="som"):
+        try:
+            self.audio.play_sound(sound_id)
+        except Exception as e:
+            print(f"Erro ao tocar {description}: {e}")
+
+    def step(self):
+        """Avança a simulação em um tick. Não faz nada depois do game over."""
+        if self.game_over:
+            return
+
+        self.clock.tick(self.dt)
+        self.tick_count += 1
+        ts = self.tick_scale
+        truck = self.truck
+
+        # Guarda as posições do tick anterior para o desenho interpolado
+        self.prev_scroll_pos = self.scroll_pos
+        truck.save_previous_position()
+        self.store.save_previous_positions()
+        if self.police_car:
+            self.police_car.save_previous_position()
+
+        # Atualizar dificuldade baseada no tempo e pontuação
+        time_elapsed = self.clock()
+        score = self.score
+        self.difficulty_manager.update(time_elapsed, score)
+
+        # Obter valores dinâmicos de dificuldade
+        current_scroll_speed = self.difficulty_manager.get_current_scroll_speed()
+        current_spawn_rate = self.difficulty_manager.get_current_spawn_rate()
+        enemy_speed_multiplier = self.difficulty_manager.get_current_enemy_speed_multiplier()
+
+        # Encerra os efeitos globais que venceram (ex: slow motion)
+        self.effects.expire(time_elapsed)
+
+        if not truck.crashed:
+            # Atualiza o estado do caminhão (verifica invulnerabilidade)
+            truck.update()
+
+        # Escala do tempo do mundo (slow motion), lida do relógio ANTES de processar as colisões
+        slowmotion_multiplier = self.clock.time_scale
+
+        # Aplica o multiplicador de slow motion aos valores de dificuldade
+        # Mas mantém velocidades separadas para player e mundo
+        world_scroll_speed = current_scroll_speed * slowmotion_multiplier
+        current_spawn_rate /= slowmotion_multiplier  # Spawns mais lentos durante slow motion
+        enemy_speed_multiplier *= slowmotion_multiplier
+
+        # Velocidade do mundo (sinal negativo), afetada pelo slow motion (para sincronizar com os inimigos)
+        self.scroll_speed = -world_scroll_speed
+        road_scroll_speed = -world_scroll_speed
+        # Velocidade normal do player (não afetada pelo slow motion)
+        player_scroll_speed = -current_scroll_speed
+
+        if not truck.crashed:
+            self._move_player()
+        else:
+            self._update_crashed_player(player_scroll_speed)
+
+        # Multiplicador de tempo dos objetos: acelerado enquanto o caminhão está crashado
+        crash_multiplier = CRASH_SCROLL_MULTIPLIER if truck.crashed else 1.0
+
+        # Acelera a rolagem do cenário quando o caminhão está crashado
+        self.scroll_pos += road_scroll_speed * crash_multiplier * ts
+
+        self._update_police(score, time_elapsed)
+
+        self._tick_time = time_elapsed
+        pipeline = self.pipeline
+
+        # --- Spawning ---
+        # O relógio de spawn anda mais rápido com a dificuldade e o crash e mais devagar no slow motion
+        pipeline.spawn(crash_multiplier * ts / current_spawn_rate, enemy_speed_multiplier)
+
+        # --- Update ---
+        # Inimigos andam pelas faixas; obstáculos e itens descem junto com a pista
+        pipeline.update()
+
+        # --- Collision ---
+        # O store filtra o que encosta no sprite do caminhão antes do teste exato de cada tipo
+        pipeline.collide(truck.x, truck.y, truck.width, truck.height)
+
+        # --- Verifica se o player crashou durante o slow motion e desativa o efeito ---
+        if truck.crashed and self.slowmotion_effect.is_active():
+            self.slowmotion_effect.deactivate()
+            print("Slow motion desativado devido ao crash do player")
+
+            # Recalcula as velocidades com o slow motion desativado
+            new_slowmotion_multiplier = self.clock.time_scale  # Será 1.0 agora
+            world_scroll_speed = current_scroll_speed * new_slowmotion_multiplier
+            self.scroll_speed = -world_scroll_speed
+
+        self._update_score_indicators()
+
+        with pipeline.timed("collide"):
+            self._propagate_crashes()
+
+        # --- Despawn ---
+        # Remove tudo o que saiu da tela ou foi usado / coletado
+        pipeline.despawn()
+
+    def _move_player(self):
+        """Aplica a entrada do jogador ao caminhão."""
+        truck = self.truck
+        player_input = self.input_source.poll()
+
+        if player_input.horn:
+            self._play(SOUND_HORN, description="buzina")
+
+        dx = player_input.steer * 0.1
+        if player_input.throttle > 0:
+            dy = 0.1
+        elif player_input.throttle < 0:
+            # Freio: acompanha a rolagem da pista
+            dy = self.scroll_speed / truck.speed_y
+        else:
+            dy = 0.0
+
+        truck.move(dx * self.tick_scale, dy * self.tick_scale)
+
+    def _update_crashed_player(self, player_scroll_speed):
+        """Lógica de crash / respawn / game over."""
+        truck = self.truck
+        # Empurra o caminhão com o scroll quando está crashado
+        # Usa a velocidade normal do player, não afetada pelo slow motion
+        truck.y += player_scroll_speed * CRASH_SCROLL_MULTIPLIER * self.tick_scale
+
+        # Só continua para a próxima etapa (respawn ou game over) quando o caminhão saiu da tela E
+        # todos os inimigos marcados como crashados também já tiverem saído.
+        if truck.y + truck.height >= 0:
+            return
+
+        # considera apenas inimigos crashados que ainda estão visíveis na tela
+        remaining_crashed_visible = [e for e in self.all_enemies if e.crashed and e.y + e.height >= 0]
+        if remaining_crashed_visible:
+            return
+
+        # Desativa slow motion antes do respawn / game over
+        if self.slowmotion_effect.is_active():
+            self.slowmotion_effect.deactivate()
+
+        if truck.lives > 0:
+            truck.respawn()
+            return
+
+        # Se não tem mais vidas, é Game Over
+        self.game_over = True
+        # Para a música de fundo e toca o som de game over (não bloqueante)
+        try:
+            self.audio.stop_background_music()
+        except Exception:
+            pass
+        self._play(SOUND_GAME_OVER, description="som de game over")
+
+    def _update_police(self, score, time_elapsed):
+        # --- Police Spawning ---
+        if self.police_car is None and score > POLICE_SPAWN_SCORE_THRESHOLD:
+            # Respeita cooldown entre spawns de polícia
+            if time_elapsed - self.last_police_spawn_time >= POLICE_COOLDOWN_SECONDS:
+                # A chance aumenta com a pontuação
+                spawn_chance = self.rng.uniform(0, 1) * (score / 500000.0)
+                # A chance é por frame de referência; um tick equivale a tick_scale frames
+                if self.rng.random() < spawn_chance * self.tick_scale:
+                    print(f"Police spawn chance: {spawn_chance:.4f}")
+                    print(f"Police car spawned at score {score:.0f}!")
+                    try:
+                        self.police_car = PoliceCar(self.police_sprites, self.police_sound_id, audio=self.audio,
+                                                    rng=self.rng)
+                        # Registra o tempo do spawn para aplicar cooldown
+                        self.last_police_spawn_time = time_elapsed
+                    except Exception as e:
+                        print(f"Failed to spawn PoliceCar: {e}")
+
+        # --- Police Update ---
+        police_car = self.police_car
+        if not police_car:
+            return
+
+        # Só acelera o carro da polícia se o jogador estiver crashado, mesmo que a polícia esteja crashada
+        police_scroll = self.scroll_speed * (CRASH_SCROLL_MULTIPLIER if self.truck.crashed else 1.0)
+        police_result = police_car.update(self.truck, self._enemies_near, police_scroll, time_scale=self.tick_scale)
+
+        # Se a polícia retornou informações de pontuação (jogador blindado destruiu a polícia)
+        if police_result and police_result.get("points_awarded"):
+            points_gained = police_result["points"]
+            self.beer_bonus_points += points_gained
+            self._add_score_indicator(police_result["x"] + 25, police_result["y"], points_gained)  # Centro da polícia
+
+        # Se a polícia sair da tela por cima ou por baixo, remove-a
+        if police_car.y > SCREEN_HEIGHT or police_car.y + police_car.height < 0:
+            try:
+                police_car.stop_audio()
+            except Exception:
+                pass
+            # Guarda momento de remoção para iniciar cooldown
+            self.last_police_spawn_time = time_elapsed
+            self.police_car = None
+
+    def _enemies_near(self, x, y, width, height):
+        """Inimigos cujo sprite encosta no retângulo dado, em ordem de slot (consulta da polícia)."""
+        return self.store.overlapping(ENEMY_KINDS, x, y, width, height)
+
+    def _add_score_indicator(self, x, y, points):
+        self.score_indicators.append(self.score_indicator_pool.acquire(x, y, points, clock=self.clock))
+
+    def _pick_obstacle_lane(self, other_kind):
+        """Escolhe uma faixa segura para buraco/óleo, evitando sobrepor o outro tipo de obstáculo."""
+        occupancy = self.store.lane_occupancy()
+        safe_lanes, all_lanes = get_safe_lanes_for_obstacles(occupancy, KIND_OIL_STAIN, LANE_COUNT_PER_DIRECTION,
+                                                             SCREEN_HEIGHT, SAFETY_DISTANCE)
+        # O novo obstáculo nasce em y = SCREEN_HEIGHT, centralizado na faixa; como os obstáculos são mais
+        # estreitos que a faixa e só descem, ele só encostaria em um obstáculo da mesma faixa cujo topo
+        # ainda esteja acima dessa linha
+        collision_free_lanes = [lane for lane in safe_lanes if occupancy.max_top(other_kind, lane) <= SCREEN_HEIGHT]
+
+        # Se encontrou lanes sem colisão, usa-as, senão usa as lanes seguras originais
+        return self.rng.choice(collision_free_lanes or list(safe_lanes))
+
+    def _move_enemies(self, kinds):
+        # Movimento de todos os inimigos de uma vez (acelerado quando o player está crashado)
+        if self.truck.crashed:
+            self.store.update_enemies(CRASH_SCROLL_MULTIPLIER * self.tick_scale, kinds)
+            crash_multiplier = CRASH_SCROLL_MULTIPLIER
+        else:
+            self.store.update_enemies(self.clock.time_scale * self.tick_scale, kinds)
+            crash_multiplier = 1.0
+        # inimigos crashados continuam sendo empurrados pelo scroll (acelerado se o player estiver crashado)
+        self.store.scroll_crashed(self.scroll_speed * crash_multiplier * self.tick_scale, kinds)
+
+    def _scroll_items(self, kinds):
+        crash_multiplier = CRASH_SCROLL_MULTIPLIER if self.truck.crashed else 1.0
+        self.store.scroll(self.scroll_speed * crash_multiplier * self.tick_scale, kinds)
+
+    def _collide_enemy(self, enemy):
+        truck = self.truck
+        if not enemy.crashed and truck.check_collision(enemy):
+            # Só processa colisão se o jogador não estiver invulnerável (exceto quando blindado)
+            if not truck.invulnerable or truck.armored:
+                # O inimigo fica crashed quando há colisão válida
+                enemy.crashed = True
+                self._play(SOUND_CRASH, description="som de colisão")
+
+                # Se o jogador está blindado (invulnerável com power-up), ganha pontos por destruir inimigos
+                if truck.armored:
+                    points_gained = 100  # Mesmo valor que a cerveja
+                    self.beer_bonus_points += points_gained
+                    self._add_score_indicator(enemy.x + enemy.width // 2, enemy.y, points_gained)
+                else:
+                    # O caminhão só toma dano se não estiver blindado
+                    truck.take_damage()
+
+    def _spawn_enemy_up(self, enemy_speed_multiplier):
+        up_lanes = range(LANE_COUNT_PER_DIRECTION, LANE_COUNT_PER_DIRECTION * 2)
+        possible_lanes = self.store.lane_occupancy().lanes_below(KIND_ENEMY_UP, up_lanes,
+                                                                SCREEN_HEIGHT - SAFETY_DISTANCE)
+        if possible_lanes:
+            chosen_lane = self.rng.choice(possible_lanes)
+            normal_sprite, dead_sprite = self.rng.choice(self.enemy_up_sprite_pairs)
+            self._spawn(KIND_ENEMY_UP, normal_sprite, dead_sprite, lane_index=chosen_lane,
+                        speed_multiplier=enemy_speed_multiplier, rng=self.rng)
+
+    def _spawn_enemy_down(self, enemy_speed_multiplier):
+        down_lanes = range(0, LANE_COUNT_PER_DIRECTION)
+        possible_lanes = self.store.lane_occupancy().lanes_below(KIND_ENEMY_DOWN, down_lanes,
+                                                                SCREEN_HEIGHT - SAFETY_DISTANCE)
+        if possible_lanes:
+            chosen_lane = self.rng.choice(possible_lanes)
+            normal_sprite, dead_sprite = self.rng.choice(self.enemy_down_sprite_pairs)
+            self._spawn(KIND_ENEMY_DOWN, normal_sprite, dead_sprite, lane_index=chosen_lane,
+                        speed_multiplier=enemy_speed_multiplier, rng=self.rng)
+
+    def _obstacle_sprite(self, kind):
+        return self.sprites.get("hole" if kind == KIND_HOLE else "oil")
+
+    def _spawn_obstacle(self, kind, lane, enemy_speed_multiplier):
+        self._spawn(kind, self._obstacle_sprite(kind), lane_index=lane, speed_multiplier=enemy_speed_multiplier)
+
+    def _spawn_hole(self, enemy_speed_multiplier):
+        # Agora usamos apenas a probabilidade para determinar o spawn
+        if self.rng.random() < self.difficulty_manager.get_current_hole_spawn_probability():
+            chosen_lane = self._pick_obstacle_lane(KIND_OIL_STAIN)
+            self._spawn_obstacle(KIND_HOLE, chosen_lane, enemy_speed_multiplier)
+
+    def _collide_hole(self, hole):
+        truck = self.truck
+        if hole.active and truck.check_hole_collision(hole):
+            # Buraco desaparece após uso
+            hole.active = False
+            # Aplica efeito de diminuição de velocidade somente se não estiver invulnerável
+            if not truck.invulnerable:
+                truck.slow_down()
+
+    def _spawn_oil_stain(self, enemy_speed_multiplier):
+        if self.rng.random() < self.difficulty_manager.get_current_oil_stain_spawn_probability():
+            chosen_lane = self._pick_obstacle_lane(KIND_HOLE)
+            self._spawn_obstacle(KIND_OIL_STAIN, chosen_lane, enemy_speed_multiplier)
+
+    def _collide_oil_stain(self, oil_stain):
+        truck = self.truck
+        if oil_stain.active and truck.check_oil_stain_collision(oil_stain):
+            # Mancha desaparece após uso
+            oil_stain.active = False
+            # Aplica efeito de inversão de controles somente se não estiver invulnerável
+            if not truck.invulnerable:
+                truck.invert_controls()
+
+    def _spawn_beer(self, enemy_speed_multiplier):
+        if self.rng.random() < self.difficulty_manager.get_current_beer_spawn_probability():
+            # Pode aparecer em qualquer faixa
+            chosen_lane = get_safe_lane_for_powerup(self.store.lane_occupancy(), KIND_INVULNERABILITY,
+                                                    LANE_COUNT_PER_DIRECTION, SCREEN_HEIGHT, SAFETY_DISTANCE,
+                                                    rng=self.rng)
+            self._spawn(KIND_BEER, self.sprites.get("beer"), lane_index=chosen_lane,
+                        speed_multiplier=enemy_speed_multiplier)
+
+    def _collide_beer(self, beer):
+        if beer.active and beer.check_collision(self.truck):
+            # Cerveja é coletada e jogador ganha pontos
+            points_gained = beer.collect()
+            if points_gained > 0:
+                self._play(SOUND_BEER, description="som de coleta")
+                self._add_score_indicator(beer.x + beer.width // 2, beer.y, points_gained)
+                self.beer_bonus_points += points_gained
+
+    def _update_score_indicators(self):
+        for indicator in self.score_indicators:
+            # Acelera a animação dos indicadores de pontuação durante o crash
+            if self.truck.crashed:
+                original_velocity = indicator.velocity_y
+                indicator.velocity_y *= CRASH_SCROLL_MULTIPLIER
+                indicator.update()
+                indicator.velocity_y = original_velocity
+            else:
+                indicator.update()
+        if not all(indicator.active for indicator in self.score_indicators):
+            for indicator in self.score_indicators:
+                if not indicator.active:
+                    self.score_indicator_pool.release(indicator)
+            self.score_indicators = [i for i in self.score_indicators if i.active]
+
+    def _spawn_invulnerability_powerup(self, enemy_speed_multiplier):
+        difficulty_manager = self.difficulty_manager
+        # Verificação de probabilidade (com probabilidade garantida a cada X tentativas)
+        difficulty_manager.invulnerability_spawn_counter = getattr(difficulty_manager,
+                                                                   'invulnerability_spawn_counter', 0) + 1
+
+        # Força o spawn a cada 5 tentativas, independente da probabilidade
+        force_spawn = difficulty_manager.invulnerability_spawn_counter >= 5
+        if force_spawn:
+            difficulty_manager.invulnerability_spawn_counter = 0
+
+        if force_spawn or self.rng.random() < difficulty_manager.get_current_invulnerability_spawn_probability():
+            chosen_lane = get_safe_lane_for_powerup(self.store.lane_occupancy(), KIND_INVULNERABILITY,
+                                                    LANE_COUNT_PER_DIRECTION, SCREEN_HEIGHT, SAFETY_DISTANCE,
+                                                    rng=self.rng)
+            self._spawn(KIND_INVULNERABILITY, self.sprites.get("invulnerability"), lane_index=chosen_lane,
+                        speed_multiplier=enemy_speed_multiplier)
+
+    def _collide_invulnerability_powerup(self, powerup):
+        if powerup.active and self.truck.check_invulnerability_powerup_collision(powerup):
+            # Power-up desaparece após uso
+            powerup.active = False
+            self._play(SOUND_INVULNERABILITY, description="som de invulnerabilidade")
+            # Ativa o efeito de invulnerabilidade e transforma em carro blindado
+            self.truck.activate_invulnerability_powerup()
+
+    def _spawn_slowmotion_powerup(self, enemy_speed_multiplier):
+        difficulty_manager = self.difficulty_manager
+        # Verificação de probabilidade (com probabilidade garantida a cada X tentativas)
+        difficulty_manager.slowmotion_spawn_counter = getattr(difficulty_manager,
+                                                              'slowmotion_spawn_counter', 0) + 1
+
+        # Força o spawn a cada 3 tentativas, independente da probabilidade
+        force_spawn = difficulty_manager.slowmotion_spawn_counter >= 3
+        if force_spawn:
+            print(f"Force spawning slow motion power-up (attempt {difficulty_manager.slowmotion_spawn_counter})")
+            difficulty_manager.slowmotion_spawn_counter = 0
+
+        if force_spawn or self.rng.random() < difficulty_manager.get_current_slowmotion_spawn_probability():
+            # Pode aparecer em qualquer faixa (sem outros power-ups de slow motion muito próximos)
+            chosen_lane = get_safe_lane_for_powerup(self.store.lane_occupancy(), KIND_SLOWMOTION,
+                                                    LANE_COUNT_PER_DIRECTION, SCREEN_HEIGHT, SAFETY_DISTANCE,
+                                                    rng=self.rng)
+            self._spawn(KIND_SLOWMOTION, self.sprites.get("slowmotion"), lane_index=chosen_lane,
+                        speed_multiplier=enemy_speed_multiplier)
+            print(f"Slow motion power-up spawned at lane {chosen_lane}!")
+
+    def _collide_slowmotion_powerup(self, powerup):
+        # Só pode coletar se não há slow motion ativo
+        if powerup.active and not self.slowmotion_effect.is_active():
+            if self.truck.check_slowmotion_powerup_collision(powerup):
+                powerup.active = False
+                self.slowmotion_effect.activate(self._tick_time)
+                self._play(SOUND_SLOWMOTION, description="som de slow motion")
+
+    def _propagate_crashes(self):
+        """Propagação de colisão: carros crashados (inimigos e polícia) podem derrubar outros carros."""
+        self.store.propagate_crashes(ENEMY_KINDS, extra_car=self.police_car)
@@ -0,0 +1,65 @@
+import heapq
+
+
+class Spawner:
+    """Um tipo de spawn: roda callback a cada interval unidades do relógio do SpawnScheduler."""
+    __slots__ = ("name", "interval", "callback", "next_due", "order")
+
+    def __init__(self, name, interval, callback, order):
+        self.name = name
+        self.interval = interval
+        self.callback = callback
+        self.next_due = interval
+        self.order = order
+
+
+class SpawnScheduler:
+    """
+    Fila de prioridade (heap) de spawners ordenada pelo próximo vencimento. A cada tick o relógio
+    avança uma vez e só os spawners vencidos rodam; os demais nem são consultados.
+
+    O relógio não é o tempo de parede: a simulação o avança já com os fatores que aceleram ou
+    atrasam os spawns (taxa de spawn da dificuldade, slow motion, crash), então os intervalos dos
+    spawners são constantes e nenhum vencimento precisa ser recalculado quando a dificuldade muda.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self._spawners = []
+        self._heap = []
+
+    def register(self, name, interval, callback):
+        """Registra um spawner; ele vence pela primeira vez depois de interval."""
+        spawner = Spawner(name, interval, callback, len(self._spawners))
+        spawner.next_due = self.now + interval
+        self._spawners.append(spawner)
+        heapq.heappush(self._heap, (spawner.next_due, spawner.order, spawner))
+        return spawner
+
+    def reset(self):
+        """Zera o relógio e reagenda todos os spawners a partir do início."""
+        self.now = 0.0
+        self._heap = []
+        for spawner in self._spawners:
+            spawner.next_due = spawner.interval
+            self._heap.append((spawner.next_due, spawner.order, spawner))
+        heapq.heapify(self._heap)
+
+    def advance(self, amount):
+        self.now += amount
+
+    def run_due(self, *args):
+        """
+        Roda (na ordem dos vencimentos) os spawners vencidos, passando args para cada callback,
+        e os reagenda para interval depois de agora. Retorna quantos rodaram.
+        """
+        heap = self._heap
+        now = self.now
+        ran = 0
+        while heap and heap[0][0] <= now:
+            _, order, spawner = heapq.heappop(heap)
+            spawner.callback(*args)
+            spawner.next_due = now + spawner.interval
+            heapq.heappush(heap, (spawner.next_due, order, spawner))
+            ran += 1
+        return ran
@@ -0,0 +1,81 @@
+import heapq
+
+# Eventos enviados aos ouvintes: listener(evento, nome_do_efeito)
+EFFECT_STARTED = "started"
+EFFECT_ENDED = "ended"
+
+# Regras para quando um efeito já ativo é aplicado de novo
+REFRESH = "refresh"  # Recomeça a duração a partir de agora
+IGNORE = "ignore"  # Mantém o efeito como está
+STACK = "stack"  # Soma a nova duração ao tempo que falta
+
+
+class StatusEffects:
+    """
+    Efeitos temporários (invulnerabilidade, buraco, óleo, slow motion...) identificados por nome.
+    O fim de cada efeito fica em um min-heap, então expire(now) só olha o topo do heap e não faz
+    nada enquanto nenhum efeito vence; ninguém precisa conferir os próprios timers a cada tick.
+
+    Os ouvintes recebem EFFECT_STARTED quando um efeito começa (e não quando é renovado) e
+    EFFECT_ENDED quando ele vence ou é interrompido, para trocar texturas, tocar sons etc.
+    Os tempos são passados por quem chama (normalmente o GameClock).
+    """
+
+    def __init__(self):
+        self._ends = {}
+        # (fim, nome); entradas de efeitos renovados ou interrompidos ficam obsoletas e são
+        # descartadas quando chegam ao topo
+        self._heap = []
+        self._listeners = []
+
+    def subscribe(self, listener):
+        self._listeners.append(listener)
+
+    def _emit(self, event, name):
+        for listener in self._listeners:
+            listener(event, name)
+
+    def is_active(self, name):
+        return name in self._ends
+
+    def start(self, name, duration, now, rule=REFRESH):
+        """Aplica o efeito por duration segundos. Retorna False se a regra manteve o efeito como estava."""
+        end = self._ends.get(name)
+        if end is None or rule == REFRESH:
+            new_end = now + duration
+        elif rule == STACK:
+            new_end = end + duration
+        else:
+            return False
+
+        self._ends[name] = new_end
+        heapq.heappush(self._heap, (new_end, name))
+        if end is None:
+            self._emit(EFFECT_STARTED, name)
+        return True
+
+    def stop(self, name):
+        """Interrompe o efeito antes da hora (não faz nada se ele não estiver ativo)."""
+        if self._ends.pop(name, None) is not None:
+            self._emit(EFFECT_ENDED, name)
+
+    def expire(self, now):
+        """Encerra os efeitos que venceram até now."""
+        heap = self._heap
+        ends = self._ends
+        while heap and heap[0][0] <= now:
+            end, name = heapq.heappop(heap)
+            if ends.get(name) == end:
+                del ends[name]
+                self._emit(EFFECT_ENDED, name)
+
+    def remaining(self, name, now):
+        """Segundos que faltam para o efeito acabar (0 se não estiver ativo)."""
+        end = self._ends.get(name)
+        return max(0.0, end - now) if end is not None else 0.0
+
+    def clear(self):
+        """Encerra todos os efeitos ativos."""
+        for name in list(self._ends):
+            self.stop(name)
+        self._heap.clear()
@@ -0,0 +1,82 @@
+from OpenGL.GL import *
+
+
+class RenderTarget:
+    """
+    Framebuffer object (FBO) com uma textura de cor, para desenhar algo uma vez
+    e reaproveitar o resultado como textura nos frames seguintes.
+    """
+
+    def __init__(self):
+        self.fbo = None
+        self.texture_id = None
+        self.width = 0
+        self.height = 0
+
+    def ensure_size(self, width, height):
+        """
+        Cria (ou recria) o FBO com o tamanho pedido.
+        Retorna False se o driver não suportar FBOs ou o framebuffer ficar incompleto.
+        """
+        width = max(1, int(width))
+        height = max(1, int(height))
+        if self.fbo is not None and (width, height) == (self.width, self.height):
+            return True
+
+        self.delete()
+        try:
+            self.texture_id = glGenTextures(1)
+            glBindTexture(GL_TEXTURE_2D, self.texture_id)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, None)
+            glBindTexture(GL_TEXTURE_2D, 0)
+
+            self.fbo = glGenFramebuffers(1)
+            glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
+            glFramebufferTexture2D(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_TEXTURE_2D, self.texture_id, 0)
+            status = glCheckFramebufferStatus(GL_FRAMEBUFFER)
+            glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        except Exception as e:
+            print(f"Aviso: Framebuffer indisponível, desenho direto será usado: {e}")
+            self.delete()
+            return False
+
+        if status != GL_FRAMEBUFFER_COMPLETE:
+            print(f"Aviso: Framebuffer incompleto (status {status}), desenho direto será usado")
+            self.delete()
+            return False
+
+        self.width = width
+        self.height = height
+        return True
+
+    def begin(self):
+        """Passa a desenhar no FBO (a viewport cobre a textura inteira)."""
+        glPushAttrib(GL_VIEWPORT_BIT | GL_COLOR_BUFFER_BIT)
+        glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
+        glViewport(0, 0, self.width, self.height)
+
+    def end(self):
+        """Volta a desenhar na janela e restaura a viewport, cor de limpeza e máscara de cor anteriores."""
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        glPopAttrib()
+
+    def delete(self):
+        """Libera o FBO e a textura."""
+        if self.fbo is not None:
+            try:
+                glDeleteFramebuffers(1, [self.fbo])
+            except Exception:
+                pass
+        if self.texture_id is not None:
+            try:
+                glDeleteTextures([self.texture_id])
+            except Exception:
+                pass
+        self.fbo = None
+        self.texture_id = None
+        self.width = 0
+        self.height = 0
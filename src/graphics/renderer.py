@@ -1,13 +1,20 @@
 from OpenGL.GL import *
 from OpenGL.GLU import *
-from OpenGL.raw.GLUT import glutBitmapCharacter
-from OpenGL.GLUT import GLUT_BITMAP_HELVETICA_18
 
-from src.game.entities.road import draw_road
+from src.graphics.road_mesh import RoadMesh
+from src.graphics.sprite_batch import SpriteBatch
+
+_road_mesh = RoadMesh()
+_sprite_batch = SpriteBatch()
 
 
 def draw_game_elements(game_vp, base_game_width, base_height, e_scroll_pos, e_holes, e_oil_stains, e_beer_collectibles,
-                       e_score_indicators, e_invulnerability_powerups, e_player_truck, e_enemies_up, e_enemies_down, e_police_car, e_slowmotion_powerups):
+                       e_score_indicators, e_invulnerability_powerups, e_player_truck, e_enemies_up, e_enemies_down, e_police_car, e_slowmotion_powerups, alpha=1.0):
+    """
+    Desenha a pista e todos os elementos do jogo.
+    alpha: fração do próximo tick da simulação já decorrida; os objetos são desenhados
+    interpolados entre a posição do tick anterior e a atual (e_scroll_pos já vem interpolado).
+    """
     # Configuração da viewport e projeção
     glViewport(game_vp[0], game_vp[1], game_vp[2], game_vp[3])
     glMatrixMode(GL_PROJECTION)
@@ -16,58 +23,45 @@ def draw_game_elements(game_vp, base_game_width, base_height, e_scroll_pos, e_ho
     glMatrixMode(GL_MODELVIEW)
     glLoadIdentity()
 
-    draw_road(e_scroll_pos)
+    _road_mesh.draw(e_scroll_pos)
+
+    # Todos os sprites do frame são coletados em um único batch e enviados à GPU de uma vez
+    _sprite_batch.begin()
 
     # Desenha os buracos e manchas primeiro (para ficarem "abaixo" dos carros)
     for hole in e_holes:
-        hole.draw()
+        hole.draw(alpha)
 
     # Desenha as manchas de óleo
     for oil_stain in e_oil_stains:
-        oil_stain.draw()
+        oil_stain.draw(alpha)
 
     # Desenha as cervejas colecionáveis
     for beer in e_beer_collectibles:
-        beer.draw()
-
-    # Desenha os indicadores de pontos
-    for indicator in e_score_indicators:
-        indicator.draw()
+        beer.draw(alpha)
 
     # Desenha os power-ups de invulnerabilidade
     for powerup in e_invulnerability_powerups:
-        powerup.draw()
+        powerup.draw(alpha)
 
     # Desenha os power-ups de slow motion
     for powerup in e_slowmotion_powerups:
-        powerup.draw()
+        powerup.draw(alpha)
 
-    e_player_truck.draw()
+    e_player_truck.draw(alpha)
     for enemy in e_enemies_up:
-        enemy.draw()
+        enemy.draw(alpha)
     for enemy in e_enemies_down:
-        enemy.draw()
+        enemy.draw(alpha)
 
     # Desenha o carro da polícia se ele existir
     if e_police_car:
-        e_police_car.draw()
+        e_police_car.draw(alpha)
 
+    _sprite_batch.end()
 
-def draw_panel_stats(scroll_pos, beer_bonus_points, time_elapsed, displayed_speed, screen_height):
-    """Desenha as informações de estatísticas no painel lateral do jogo"""
-    score = abs(scroll_pos * 0.1) + beer_bonus_points
-
-    draw_text(f"Time: {int(time_elapsed)}", 12, screen_height - 28)
-    draw_text(f"Speed: {displayed_speed:.0f} km/h", 12, screen_height - 52)
-    draw_text(f"Score: {int(score)}", 12, screen_height - 76)
-    draw_text("Lives:", 12, screen_height - 100)
-    lives_x = 80
-
-    return score, lives_x
+    # Os indicadores de pontos usam primitivas próprias (linhas), então são desenhados
+    # depois do batch, por cima dos sprites
+    for indicator in e_score_indicators:
+        indicator.draw()
 
-def draw_text(text, x, y):
-    glDisable(GL_TEXTURE_2D)
-    glColor3f(1.0, 1.0, 1.0)
-    glRasterPos2f(x, y)
-    for character in text:
-        glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(character))
@@ -0,0 +1,82 @@
+import ctypes
+
+import numpy as np
+from OpenGL.GL import *
+
+import src.game.entities.road as road
+
+# Layout intercalado de cada vértice: x, y, r, g, b
+FLOATS_PER_VERTEX = 5
+VERTEX_STRIDE = FLOATS_PER_VERTEX * 4  # bytes (float32)
+
+
+class RoadMesh:
+    """
+    Geometria da estrada montada uma única vez em um VBO estático.
+    A cada frame só muda o deslocamento dos tracejados, aplicado com um glTranslatef,
+    então o custo do desenho é constante independente do número de faixas.
+    A malha é reconstruída apenas se as dimensões lógicas da pista mudarem.
+    """
+
+    def __init__(self):
+        self._vbo = None
+        self._layout_key = None
+        self._static_vertex_count = 0
+        self._dash_vertex_count = 0
+
+    def draw(self, scroll_offset):
+        """Desenha a estrada com os tracejados deslocados conforme a rolagem."""
+        self._ensure_built()
+
+        glBindBuffer(GL_ARRAY_BUFFER, self._vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(2, GL_FLOAT, VERTEX_STRIDE, ctypes.c_void_p(0))
+        glColorPointer(3, GL_FLOAT, VERTEX_STRIDE, ctypes.c_void_p(2 * 4))
+
+        # Grama, asfalto e linhas contínuas
+        glDrawArrays(GL_QUADS, 0, self._static_vertex_count)
+
+        # Tracejados: mesmo bloco de vértices, apenas transladado
+        glPushMatrix()
+        glTranslatef(0.0, road.get_dash_offset(scroll_offset), 0.0)
+        glDrawArrays(GL_QUADS, self._static_vertex_count, self._dash_vertex_count)
+        glPopMatrix()
+
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        # Reseta a cor para não afetar outros elementos (o color array deixa a cor atual indefinida)
+        glColor3f(1.0, 1.0, 1.0)
+
+    def _ensure_built(self):
+        """(Re)constrói o VBO se ainda não existir ou se as dimensões da pista mudaram."""
+        layout_key = (road.GAME_WIDTH, road.SCREEN_HEIGHT, road.ROAD_WIDTH, road.TOTAL_LANES)
+        if self._vbo is not None and layout_key == self._layout_key:
+            return
+
+        static_rects, dash_rects = road.get_road_layout()
+        vertices = np.array([vertex for rect in static_rects + dash_rects for vertex in _rect_vertices(*rect)],
+                            dtype=np.float32)
+
+        if self._vbo is None:
+            self._vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self._vbo)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        self._static_vertex_count = len(static_rects) * 4
+        self._dash_vertex_count = len(dash_rects) * 4
+        self._layout_key = layout_key
+
+
+def _rect_vertices(x, y, width, height, color):
+    """Os quatro vértices (x, y, r, g, b) de um retângulo de cor sólida."""
+    r, g, b = color
+    return (
+        (x, y, r, g, b),
+        (x + width, y, r, g, b),
+        (x + width, y + height, r, g, b),
+        (x, y + height, r, g, b),
+    )
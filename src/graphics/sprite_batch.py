@@ -0,0 +1,172 @@
+import ctypes
+
+import numpy as np
+from OpenGL.GL import *
+
+# Layout intercalado de cada vértice: x, y, u, v, r, g, b, a
+FLOATS_PER_VERTEX = 8
+VERTICES_PER_QUAD = 4
+VERTEX_STRIDE = FLOATS_PER_VERTEX * 4  # bytes (float32)
+
+# Coordenadas de textura (u0, v0, u1, v1) para a textura inteira.
+# v0 corresponde à base do sprite e v1 ao topo, pois a imagem é carregada de cima para baixo.
+FULL_TEXTURE_UV = (0.0, 1.0, 1.0, 0.0)
+WHITE = (1.0, 1.0, 1.0, 1.0)
+
+_active_batch = None
+
+
+class TextureRegion:
+    """
+    Sprite desenhável: o id da textura OpenGL e o retângulo UV (u0, v0, u1, v1) dentro dela.
+    Pode representar uma textura inteira ou uma região de um atlas (ver texture_atlas.py).
+    """
+    __slots__ = ("texture_id", "uv", "width", "height")
+
+    def __init__(self, texture_id, uv=FULL_TEXTURE_UV, width=0, height=0):
+        self.texture_id = texture_id
+        self.uv = uv
+        self.width = width  # Tamanho em pixels da região (informativo)
+        self.height = height
+
+
+class SpriteBatch:
+    """
+    Acumula os quads de todos os sprites de um frame em um único array numpy intercalado,
+    envia tudo para um VBO de uma vez e desenha com um glDrawArrays por sequência de textura.
+    A ordem de submissão é preservada (sprites consecutivos com a mesma textura são agrupados),
+    então a sobreposição entre elementos continua igual à do desenho imediato.
+    """
+
+    def __init__(self, initial_capacity=256):
+        self._vertices = np.zeros((initial_capacity * VERTICES_PER_QUAD, FLOATS_PER_VERTEX), dtype=np.float32)
+        self._quad_count = 0
+        self._runs = []  # [texture_id, primeiro_vertice, quantidade_de_vertices]
+        self._vbo = None
+
+        # Estatísticas do último flush (úteis para depuração e benchmarks)
+        self.last_quad_count = 0
+        self.last_draw_calls = 0
+
+    def begin(self):
+        """Inicia a coleta de sprites; draw_sprite passa a enviar os quads para este batch."""
+        global _active_batch
+        self._quad_count = 0
+        self._runs = []
+        _active_batch = self
+
+    def end(self):
+        """Desenha tudo o que foi acumulado e volta ao modo de desenho imediato."""
+        global _active_batch
+        if _active_batch is self:
+            _active_batch = None
+        self.flush()
+
+    def add_quad(self, texture_id, x, y, width, height, uv=FULL_TEXTURE_UV, color=WHITE):
+        """Adiciona um quad texturizado ao batch."""
+        if (self._quad_count + 1) * VERTICES_PER_QUAD > len(self._vertices):
+            self._grow()
+
+        x1 = x + width
+        y1 = y + height
+        u0, v0, u1, v1 = uv
+        r, g, b, a = color
+        first = self._quad_count * VERTICES_PER_QUAD
+        self._vertices[first:first + VERTICES_PER_QUAD] = (
+            (x, y, u0, v0, r, g, b, a),
+            (x1, y, u1, v0, r, g, b, a),
+            (x1, y1, u1, v1, r, g, b, a),
+            (x, y1, u0, v1, r, g, b, a),
+        )
+        self._quad_count += 1
+
+        # Agrupa com a sequência anterior se a textura for a mesma
+        if self._runs and self._runs[-1][0] == texture_id:
+            self._runs[-1][2] += VERTICES_PER_QUAD
+        else:
+            self._runs.append([texture_id, first, VERTICES_PER_QUAD])
+
+    def flush(self):
+        """Envia os vértices acumulados para o VBO e desenha cada sequência de textura."""
+        self.last_quad_count = self._quad_count
+        self.last_draw_calls = len(self._runs)
+        if self._quad_count == 0:
+            return
+
+        vertex_count = self._quad_count * VERTICES_PER_QUAD
+        data = self._vertices[:vertex_count]
+
+        if self._vbo is None:
+            self._vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self._vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STREAM_DRAW)
+
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(2, GL_FLOAT, VERTEX_STRIDE, ctypes.c_void_p(0))
+        glTexCoordPointer(2, GL_FLOAT, VERTEX_STRIDE, ctypes.c_void_p(2 * 4))
+        glColorPointer(4, GL_FLOAT, VERTEX_STRIDE, ctypes.c_void_p(4 * 4))
+
+        glEnable(GL_TEXTURE_2D)
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+
+        for texture_id, first, count in self._runs:
+            glBindTexture(GL_TEXTURE_2D, texture_id)
+            glDrawArrays(GL_QUADS, first, count)
+
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        # Reseta a cor para não afetar outros elementos (o color array deixa a cor atual indefinida)
+        glColor4f(1.0, 1.0, 1.0, 1.0)
+        glDisable(GL_BLEND)
+        glDisable(GL_TEXTURE_2D)
+
+        self._quad_count = 0
+        self._runs = []
+
+    def _grow(self):
+        """Dobra a capacidade do array de vértices preservando o conteúdo."""
+        grown = np.zeros((len(self._vertices) * 2, FLOATS_PER_VERTEX), dtype=np.float32)
+        grown[:len(self._vertices)] = self._vertices
+        self._vertices = grown
+
+
+def get_active_batch():
+    """Retorna o batch em coleta no momento, ou None se o desenho for imediato."""
+    return _active_batch
+
+
+def draw_sprite(sprite, x, y, width, height, color=WHITE):
+    """
+    Desenha um TextureRegion. Se houver um SpriteBatch ativo o quad é apenas enfileirado;
+    caso contrário é desenhado imediatamente (menus, telas fora do loop de jogo).
+    """
+    if _active_batch is not None:
+        _active_batch.add_quad(sprite.texture_id, x, y, width, height, sprite.uv, color)
+        return
+
+    u0, v0, u1, v1 = sprite.uv
+
+    glEnable(GL_TEXTURE_2D)
+    glEnable(GL_BLEND)
+    glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+
+    glBindTexture(GL_TEXTURE_2D, sprite.texture_id)
+    glColor4f(*color)
+
+    glBegin(GL_QUADS)
+    glTexCoord2f(u0, v0); glVertex2f(x, y)
+    glTexCoord2f(u1, v0); glVertex2f(x + width, y)
+    glTexCoord2f(u1, v1); glVertex2f(x + width, y + height)
+    glTexCoord2f(u0, v1); glVertex2f(x, y + height)
+    glEnd()
+
+    # Reseta a cor para não afetar outros elementos
+    glColor4f(1.0, 1.0, 1.0, 1.0)
+    glDisable(GL_BLEND)
+    glDisable(GL_TEXTURE_2D)
@@ -0,0 +1,181 @@
+import ctypes
+import math
+
+import numpy as np
+from OpenGL.GL import *
+from PIL import Image, ImageDraw, ImageFont
+
+# --- Fontes ---
+# Cada fonte é (família, tamanho em pixels). Substituem as fontes bitmap do GLUT
+# (GLUT_BITMAP_HELVETICA_18, GLUT_BITMAP_TIMES_ROMAN_24, GLUT_BITMAP_HELVETICA_12).
+FONT_HELVETICA_18 = ("sans", 18)
+FONT_TIMES_ROMAN_24 = ("serif", 24)
+FONT_HELVETICA_12 = ("sans", 12)
+
+# Arquivos tentados em ordem para cada família; se nenhum existir usa a fonte embutida do Pillow
+FONT_FILES = {
+    "sans": ["arial.ttf", "Arial.ttf", "Helvetica.ttc", "DejaVuSans.ttf", "LiberationSans-Regular.ttf",
+             "FreeSans.ttf"],
+    "serif": ["times.ttf", "Times New Roman.ttf", "Times.ttc", "DejaVuSerif.ttf", "LiberationSerif-Regular.ttf",
+              "FreeSerif.ttf"],
+}
+
+# ASCII imprimível + Latin-1 (acentos do português, º, etc.)
+CHARSET = [chr(c) for c in range(32, 127)] + [chr(c) for c in range(160, 256)]
+FALLBACK_CHAR = "?"
+
+GLYPH_PADDING = 2  # Espaço transparente em volta de cada glifo no atlas
+ATLAS_WIDTH = 512
+MAX_CACHED_LAYOUTS = 512
+
+# Layout de cada vértice: x, y, u, v
+FLOATS_PER_VERTEX = 4
+VERTEX_STRIDE = FLOATS_PER_VERTEX * 4  # bytes (float32)
+
+_fonts = {}
+
+
+class GlyphFont:
+    """
+    Fonte rasterizada uma única vez em uma textura (atlas de glifos).
+    Guarda as métricas de cada caractere e um cache de layouts de strings, então cada
+    texto desenhado é um único glDrawArrays com os quads já prontos.
+    """
+
+    def __init__(self, family, size):
+        self.size = size
+        font = _load_font(family, size)
+        ascent, descent = font.getmetrics()
+        self.ascent = ascent
+        self.descent = descent
+        self.texture_id = None
+        self._glyphs = {}  # caractere -> (avanço, largura da célula, u0, v0, u1, v1)
+        self._layouts = {}  # texto -> (array de vértices, largura)
+        self._build_atlas(font)
+
+    def _build_atlas(self, font):
+        """Rasteriza todos os caracteres de CHARSET em uma imagem e a envia para a GPU."""
+        cell_height = self.ascent + self.descent + GLYPH_PADDING * 2
+        cells = []
+        x = y = 0
+        for character in CHARSET:
+            advance = font.getlength(character)
+            left, _, right, _ = font.getbbox(character)
+            cell_width = int(math.ceil(max(advance, right))) + GLYPH_PADDING * 2
+            if x + cell_width > ATLAS_WIDTH:
+                x = 0
+                y += cell_height
+            cells.append((character, advance, cell_width, x, y))
+            x += cell_width
+
+        atlas_height = 1 << (y + cell_height - 1).bit_length()  # Próxima potência de 2
+        image = Image.new("L", (ATLAS_WIDTH, atlas_height), 0)
+        draw = ImageDraw.Draw(image)
+        for character, advance, cell_width, cx, cy in cells:
+            draw.text((cx + GLYPH_PADDING, cy + GLYPH_PADDING), character, fill=255, font=font)
+            u0 = cx / ATLAS_WIDTH
+            u1 = (cx + cell_width) / ATLAS_WIDTH
+            v_top = cy / atlas_height
+            v_bottom = (cy + cell_height) / atlas_height
+            self._glyphs[character] = (advance, cell_width, u0, v_bottom, u1, v_top)
+
+        # Texto branco com a cobertura no canal alfa; a cor vem do glColor (GL_MODULATE)
+        rgba = np.zeros((atlas_height, ATLAS_WIDTH, 4), dtype=np.uint8)
+        rgba[..., :3] = 255
+        rgba[..., 3] = np.array(image, dtype=np.uint8)
+
+        self.texture_id = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, self.texture_id)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, ATLAS_WIDTH, atlas_height, 0, GL_RGBA, GL_UNSIGNED_BYTE, rgba)
+
+    def layout(self, text):
+        """Retorna (vértices, largura) do texto com a origem na linha de base. O resultado fica em cache."""
+        cached = self._layouts.get(text)
+        if cached is not None:
+            return cached
+
+        vertices = np.zeros((len(text) * 4, FLOATS_PER_VERTEX), dtype=np.float32)
+        pen_x = 0.0
+        bottom = -self.descent - GLYPH_PADDING
+        top = self.ascent + GLYPH_PADDING
+        for i, character in enumerate(text):
+            advance, cell_width, u0, v0, u1, v1 = self._glyphs.get(character) or self._glyphs[FALLBACK_CHAR]
+            x0 = pen_x - GLYPH_PADDING
+            x1 = x0 + cell_width
+            vertices[i * 4:i * 4 + 4] = (
+                (x0, bottom, u0, v0),
+                (x1, bottom, u1, v0),
+                (x1, top, u1, v1),
+                (x0, top, u0, v1),
+            )
+            pen_x += advance
+
+        # Cache simples: descarta tudo quando fica grande (textos com números mudam a cada frame)
+        if len(self._layouts) >= MAX_CACHED_LAYOUTS:
+            self._layouts.clear()
+        result = (vertices, pen_x)
+        self._layouts[text] = result
+        return result
+
+    def text_width(self, text):
+        """Largura do texto em pixels."""
+        return self.layout(text)[1]
+
+
+def _load_font(family, size):
+    """Carrega a primeira fonte TrueType disponível da família, ou a fonte embutida do Pillow."""
+    for filename in FONT_FILES.get(family, []):
+        try:
+            return ImageFont.truetype(filename, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size=size)
+
+
+def get_font(font):
+    """Retorna a GlyphFont de uma das constantes FONT_*, criando o atlas na primeira vez."""
+    glyph_font = _fonts.get(font)
+    if glyph_font is None:
+        glyph_font = GlyphFont(*font)
+        _fonts[font] = glyph_font
+    return glyph_font
+
+
+def text_width(text, font=FONT_HELVETICA_18):
+    """Largura do texto em pixels (equivalente ao antigo glutBitmapLength)."""
+    return get_font(font).text_width(text)
+
+
+def draw_text(text, x, y, font=FONT_HELVETICA_18, color=(1.0, 1.0, 1.0)):
+    """Desenha o texto com a linha de base em (x, y), usando a projeção atual."""
+    if not text:
+        return
+    glyph_font = get_font(font)
+    vertices, _ = glyph_font.layout(text)
+
+    glPushAttrib(GL_ENABLE_BIT | GL_COLOR_BUFFER_BIT | GL_CURRENT_BIT)
+    glEnable(GL_TEXTURE_2D)
+    glEnable(GL_BLEND)
+    glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+    glBindTexture(GL_TEXTURE_2D, glyph_font.texture_id)
+    glColor3f(color[0], color[1], color[2])
+
+    glMatrixMode(GL_MODELVIEW)
+    glPushMatrix()
+    glTranslatef(x, y, 0.0)
+
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+    glVertexPointer(2, GL_FLOAT, VERTEX_STRIDE, vertices)
+    # Os vértices ficam em cache, então o ponteiro para o meio do array continua válido durante o desenho
+    glTexCoordPointer(2, GL_FLOAT, VERTEX_STRIDE, ctypes.c_void_p(vertices.ctypes.data + 2 * 4))
+    glDrawArrays(GL_QUADS, 0, len(vertices))
+    glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+    glDisableClientState(GL_VERTEX_ARRAY)
+
+    glPopMatrix()
+    glPopAttrib()
@@ -0,0 +1,109 @@
+import numpy as np
+from OpenGL.GL import *
+from PIL import Image
+
+from src.graphics.sprite_batch import TextureRegion
+
+
+class TextureAtlas:
+    """
+    Empacota vários sprites em uma ou poucas texturas grandes (páginas) no início do jogo.
+    Cada sprite passa a ser um TextureRegion (textura da página + retângulo UV), o que permite
+    desenhar quase todos os elementos do frame sem trocar de textura.
+    """
+
+    def __init__(self, page_size=2048, padding=4, max_sprite_size=256):
+        self.page_size = page_size
+        self.padding = padding  # Espaço transparente entre sprites (evita vazamento no mipmap)
+        self.max_sprite_size = max_sprite_size  # Sprites maiores são reduzidos (mantendo a proporção)
+        self._images = {}  # nome -> PIL.Image
+        self.regions = {}  # nome -> TextureRegion (preenchido por build)
+        self.page_textures = []
+
+    def add(self, name, path):
+        """Carrega uma imagem para ser empacotada. Retorna False se o arquivo não existir."""
+        try:
+            img = Image.open(path).convert("RGBA")
+        except FileNotFoundError:
+            print(f"Erro: Arquivo de imagem não encontrado em '{path}'")
+            return False
+
+        # Os sprites são desenhados bem menores que alguns arquivos originais (ex: 500x500)
+        largest_side = max(img.width, img.height)
+        if largest_side > self.max_sprite_size:
+            scale = self.max_sprite_size / largest_side
+            img = img.resize((max(1, round(img.width * scale)), max(1, round(img.height * scale))),
+                             Image.LANCZOS)
+
+        self._images[name] = img
+        return True
+
+    def build(self):
+        """Empacota as imagens em páginas, envia para a GPU e retorna o dicionário nome -> TextureRegion."""
+        pages = self._pack()
+        for placements in pages:
+            page = Image.new("RGBA", (self.page_size, self.page_size), (0, 0, 0, 0))
+            for name, px, py in placements:
+                page.paste(self._images[name], (px, py))
+
+            texture_id = self._upload_page(page)
+            self.page_textures.append(texture_id)
+
+            for name, px, py in placements:
+                img = self._images[name]
+                u0 = px / self.page_size
+                u1 = (px + img.width) / self.page_size
+                v_top = py / self.page_size
+                v_bottom = (py + img.height) / self.page_size
+                self.regions[name] = TextureRegion(texture_id, (u0, v_bottom, u1, v_top), img.width, img.height)
+
+        print(f"Atlas de texturas: {len(self.regions)} sprites em {len(self.page_textures)} página(s)")
+        # As imagens já estão na GPU; libera a memória do lado da CPU
+        self._images.clear()
+        return self.regions
+
+    def _pack(self):
+        """
+        Empacotamento em prateleiras: ordena por altura e preenche linhas da esquerda para a direita.
+        Retorna uma lista de páginas, cada uma com a lista de (nome, x, y).
+        """
+        order = sorted(self._images, key=lambda n: self._images[n].height, reverse=True)
+        pages = [[]]
+        shelf_x = shelf_y = self.padding
+        shelf_height = 0
+        for name in order:
+            img = self._images[name]
+            w = img.width + self.padding
+            h = img.height + self.padding
+
+            # Não cabe na prateleira atual: abre uma nova abaixo
+            if shelf_x + w > self.page_size:
+                shelf_x = self.padding
+                shelf_y += shelf_height
+                shelf_height = 0
+
+            # Não cabe na página atual: abre uma nova página
+            if shelf_y + h > self.page_size:
+                pages.append([])
+                shelf_x = shelf_y = self.padding
+                shelf_height = 0
+
+            pages[-1].append((name, shelf_x, shelf_y))
+            shelf_x += w
+            shelf_height = max(shelf_height, h)
+
+        return [page for page in pages if page]
+
+    def _upload_page(self, page):
+        """Cria a textura OpenGL de uma página do atlas (mesmos filtros do load_texture)."""
+        img_data = np.array(page, dtype=np.uint8)
+
+        texture_id = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, texture_id)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, page.width, page.height, 0, GL_RGBA, GL_UNSIGNED_BYTE, img_data)
+        glGenerateMipmap(GL_TEXTURE_2D)
+        return texture_id
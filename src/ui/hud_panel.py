@@ -0,0 +1,140 @@
+import math
+
+from OpenGL.GL import *
+
+from src.game.entities.road import draw_rect
+from src.graphics.render_target import RenderTarget
+from src.graphics.sprite_batch import TextureRegion, draw_sprite
+from src.graphics.text_renderer import draw_text
+
+# A textura do FBO é desenhada de baixo para cima, diferente das imagens carregadas
+RENDER_TARGET_UV = (0.0, 0.0, 1.0, 1.0)
+
+
+class HudPanel:
+    """
+    Painel lateral desenhado em uma textura (FBO) e só redesenhado quando muda.
+    A cada frame o jogo descreve o painel com add_rect/add_text/add_heart; se a lista
+    de comandos for igual à do frame anterior, apenas a textura em cache é desenhada.
+    Se o FBO não estiver disponível, os comandos são desenhados diretamente.
+    """
+
+    def __init__(self):
+        self._target = RenderTarget()
+        self._commands = []
+        self._cached_commands = None
+        self._use_target = True
+
+        # Estatística (útil para depuração): quantas vezes o painel foi realmente redesenhado
+        self.redraw_count = 0
+
+    def add_rect(self, x, y, width, height, color):
+        self._commands.append(("rect", x, y, width, height, tuple(color)))
+
+    def add_text(self, text, x, y):
+        self._commands.append(("text", text, x, y))
+
+    def add_heart(self, x, y, size=8, color=(1.0, 0.3, 0.3), filled=True):
+        self._commands.append(("heart", x, y, size, tuple(color), filled))
+
+    def add_stats(self, scroll_pos, beer_bonus_points, time_elapsed, displayed_speed, screen_height):
+        """Adiciona as informações de estatísticas do jogo. Retorna a pontuação e o x das vidas."""
+        score = abs(scroll_pos * 0.1) + beer_bonus_points
+
+        self.add_text(f"Time: {int(time_elapsed)}", 12, screen_height - 28)
+        self.add_text(f"Speed: {displayed_speed:.0f} km/h", 12, screen_height - 52)
+        self.add_text(f"Score: {int(score)}", 12, screen_height - 76)
+        self.add_text("Lives:", 12, screen_height - 100)
+        lives_x = 80
+
+        return score, lives_x
+
+    def draw(self, panel_vp, base_panel_width, base_height):
+        """
+        Desenha o painel na viewport atual (já configurada por setup_panel_viewport)
+        e limpa a lista de comandos para o próximo frame.
+        """
+        commands = self._commands
+        self._commands = []
+
+        if self._use_target and (self._target.width, self._target.height) != (panel_vp[2], panel_vp[3]):
+            # FBO novo (primeiro frame ou janela redimensionada): o conteúdo precisa ser redesenhado
+            self._cached_commands = None
+            if not self._target.ensure_size(panel_vp[2], panel_vp[3]):
+                self._use_target = False
+        if not self._use_target:
+            _run_commands(commands)
+            return
+
+        # Só redesenha a textura quando algum valor exibido mudou
+        if commands != self._cached_commands:
+            self._target.begin()
+            glClearColor(0.0, 0.0, 0.0, 1.0)
+            glClear(GL_COLOR_BUFFER_BIT)
+            # Mantém o alfa da textura opaco (o texto usa blend e reduziria o alfa nas bordas)
+            glColorMask(GL_TRUE, GL_TRUE, GL_TRUE, GL_FALSE)
+            _run_commands(commands)
+            self._target.end()
+            self._cached_commands = commands
+            self.redraw_count += 1
+
+        panel_texture = TextureRegion(self._target.texture_id, RENDER_TARGET_UV)
+        draw_sprite(panel_texture, 0, 0, base_panel_width, base_height)
+
+    def invalidate(self):
+        """Força o redesenho do painel no próximo frame."""
+        self._cached_commands = None
+
+
+def _run_commands(commands):
+    """Executa os comandos de desenho do painel."""
+    for command in commands:
+        kind = command[0]
+        if kind == "rect":
+            draw_rect(*command[1:])
+        elif kind == "text":
+            draw_text(*command[1:])
+        elif kind == "heart":
+            draw_heart(*command[1:])
+    # Reseta a cor para branco
+    glColor3f(1.0, 1.0, 1.0)
+
+
+def draw_heart(x, y, size=8, color=(1.0, 0.3, 0.3), filled=True):
+    """Desenha um coração usando primitivas geométricas do OpenGL"""
+    glDisable(GL_TEXTURE_2D)
+    glColor3f(color[0], color[1], color[2])
+
+    if filled:
+        # Coração preenchido usando uma abordagem mais precisa
+        glBegin(GL_TRIANGLE_FAN)
+        glVertex2f(x, y)  # Centro
+
+        # Criar pontos do coração usando a equação paramétrica
+        for i in range(37):  # 36 pontos + volta ao início
+            t = i * 2 * math.pi / 36
+            # Equação paramétrica do coração
+            heart_x, heart_y = calculate_heart_point(t, x, y, size)
+            glVertex2f(heart_x, heart_y)
+
+        glEnd()
+    else:
+        # Coração vazado (apenas contorno)
+        glLineWidth(2.0)
+        glBegin(GL_LINE_LOOP)
+
+        # Criar pontos do contorno do coração
+        for i in range(36):
+            t = i * 2 * math.pi / 36
+            # Equação paramétrica do coração
+            heart_x, heart_y = calculate_heart_point(t, x, y, size)
+            glVertex2f(heart_x, heart_y)
+
+        glEnd()
+        glLineWidth(1.0)
+
+
+def calculate_heart_point(t, x, y, size):
+    heart_x = x + size * (16 * math.sin(t) ** 3) / 16
+    heart_y = y + size * (13 * math.cos(t) - 5 * math.cos(2 * t) - 2 * math.cos(3 * t) - math.cos(4 * t)) / 13
+    return heart_x, heart_y
@@ -1,8 +1,7 @@
-import ctypes
 from OpenGL.GL import *
 from OpenGL.GLU import *
-from OpenGL.GLUT import *
-from OpenGL.GLUT import GLUT_BITMAP_HELVETICA_18, GLUT_BITMAP_TIMES_ROMAN_24, GLUT_BITMAP_HELVETICA_12
+import src.graphics.text_renderer as text_renderer
+from src.graphics.text_renderer import FONT_HELVETICA_18, FONT_TIMES_ROMAN_24, FONT_HELVETICA_12
 from src.game.entities.road import SCREEN_WIDTH, SCREEN_HEIGHT, draw_rect
 import src.game.managers.high_score_manager as high_score_manager  # Importa o gerenciador de recordes
 
@@ -26,7 +25,7 @@ class MenuState:
         self.mouse_pressed = False
         self.clickable_areas = []
 
-def draw_text(text, x, y, font=GLUT_BITMAP_HELVETICA_18, color=COLOR_TEXT):
+def draw_text(text, x, y, font=FONT_HELVETICA_18, color=COLOR_TEXT):
     """Desenha um texto na tela com coordenadas estáveis."""
     glDisable(GL_TEXTURE_2D)
     glMatrixMode(GL_PROJECTION)
@@ -44,11 +43,7 @@ def draw_text(text, x, y, font=GLUT_BITMAP_HELVETICA_18, color=COLOR_TEXT):
     x = int(x)
     y = int(y)
 
-    glColor3f(color[0], color[1], color[2])
-    glRasterPos2i(x, y)  # Usa RasterPos2i em vez de RasterPos2f
-
-    for character in text:
-        glutBitmapCharacter(font, ord(character))
+    text_renderer.draw_text(text, x, y, font, color)
 
     glMatrixMode(GL_PROJECTION)
     glPopMatrix()
@@ -56,11 +51,9 @@ def draw_text(text, x, y, font=GLUT_BITMAP_HELVETICA_18, color=COLOR_TEXT):
     glPopMatrix()
     glEnable(GL_TEXTURE_2D)
 
-def draw_text_centered(text, center_x, y, font=GLUT_BITMAP_HELVETICA_18, color=COLOR_TEXT):
+def draw_text_centered(text, center_x, y, font=FONT_HELVETICA_18, color=COLOR_TEXT):
     """Desenha texto centralizado horizontalmente com posição estável."""
-    text_bytes = text.encode('utf-8')
-    text_ptr = (ctypes.c_ubyte * len(text_bytes))(*text_bytes)
-    text_width = glutBitmapLength(font, text_ptr)
+    text_width = text_renderer.text_width(text, font)
     # Arredonda todas as coordenadas para valores inteiros
     x = int(center_x - text_width / 2)
     y = int(y)
@@ -99,13 +92,13 @@ def draw_button(x, y, width, height, text, is_hovered=False, is_pressed=False):
     text_x = x + width / 2
     text_y = y + (height - 18) / 2
     text_color = (1, 1, 0) if is_hovered else (1, 1, 1) # Amarelo se hovered, senão branco
-    draw_text_centered(text, text_x, text_y, font=GLUT_BITMAP_HELVETICA_18, color=text_color)
+    draw_text_centered(text, text_x, text_y, font=FONT_HELVETICA_18, color=text_color)
 
 
 def draw_title():
     """Desenha o título do jogo."""
     title_y = SCREEN_HEIGHT - 120
-    draw_text_centered("BEER TRUCK", SCREEN_WIDTH / 2, title_y, font=GLUT_BITMAP_TIMES_ROMAN_24, color=COLOR_TITLE)
+    draw_text_centered("BEER TRUCK", SCREEN_WIDTH / 2, title_y, font=FONT_TIMES_ROMAN_24, color=COLOR_TITLE)
 
 def draw_menu_background():
     """Desenha o fundo do menu com um gradiente."""
@@ -134,14 +127,17 @@ def draw_menu_background():
     glEnable(GL_TEXTURE_2D)
 
 
-def draw_start_menu(menu_state, mouse_x, mouse_y, high_score_data=None):
-    """Desenha a tela inicial do menu e registra os botões."""
+def draw_start_menu(menu_state, mouse_x, mouse_y, high_score_data=None, audio_progress=None):
+    """
+    Desenha a tela inicial do menu e registra os botões.
+    audio_progress: PreloadProgress dos sons; enquanto não termina, mostra quantos já carregaram.
+    """
     draw_menu_background()
     draw_title()
     menu_state.clickable_areas.clear()  # <-- 1. Limpa áreas da tela anterior
 
     # Exibe o Top 3
-    draw_text_centered("TOP 3 RECORDES", SCREEN_WIDTH / 2, SCREEN_HEIGHT - 180, font=GLUT_BITMAP_TIMES_ROMAN_24,
+    draw_text_centered("TOP 3 RECORDES", SCREEN_WIDTH / 2, SCREEN_HEIGHT - 180, font=FONT_TIMES_ROMAN_24,
                        color=COLOR_HIGH_SCORE)
 
     if high_score_data and high_score_data["scores"]:
@@ -178,6 +174,10 @@ def draw_start_menu(menu_state, mouse_x, mouse_y, high_score_data=None):
 
         draw_button(button_x, button["y"], button_width, button_height, button["text"], is_hovered, is_pressed)
 
+    if audio_progress is not None and not audio_progress.ready:
+        draw_text_centered(f"Carregando sons... {audio_progress.done}/{audio_progress.total}", SCREEN_WIDTH / 2,
+                           button_base_y - 200)
+
 
 def draw_instructions_screen(menu_state, mouse_x, mouse_y):
     """Desenha a tela de instruções em duas colunas."""
@@ -185,7 +185,7 @@ def draw_instructions_screen(menu_state, mouse_x, mouse_y):
     menu_state.clickable_areas.clear()
 
     title_y = SCREEN_HEIGHT - 70
-    draw_text_centered("COMO JOGAR", SCREEN_WIDTH / 2, title_y, font=GLUT_BITMAP_TIMES_ROMAN_24, color=COLOR_TITLE)
+    draw_text_centered("COMO JOGAR", SCREEN_WIDTH / 2, title_y, font=FONT_TIMES_ROMAN_24, color=COLOR_TITLE)
 
     # --- Configurações para as Colunas ---
     column_margin = 50
@@ -195,7 +195,7 @@ def draw_instructions_screen(menu_state, mouse_x, mouse_y):
 
     start_y = SCREEN_HEIGHT - 120
     line_height = 20
-    instruction_font = GLUT_BITMAP_HELVETICA_12
+    instruction_font = FONT_HELVETICA_12
 
     # Instruções divididas em duas listas (para as colunas)
     # Coluna Esquerda
@@ -265,7 +265,7 @@ def draw_game_over_menu(score, menu_state, mouse_x, mouse_y, top_scores=None, is
     menu_state.clickable_areas.clear()  # Limpa áreas da tela anterior
 
     title_y = SCREEN_HEIGHT - 150
-    draw_text_centered("GAME OVER", SCREEN_WIDTH / 2, title_y, font=GLUT_BITMAP_TIMES_ROMAN_24, color=(1.0, 0.3, 0.3))
+    draw_text_centered("GAME OVER", SCREEN_WIDTH / 2, title_y, font=FONT_TIMES_ROMAN_24, color=(1.0, 0.3, 0.3))
 
     score_y = title_y - 60
     draw_text_centered(f"Sua pontuação: {int(score)}", SCREEN_WIDTH / 2, score_y)
@@ -282,7 +282,7 @@ def draw_game_over_menu(score, menu_state, mouse_x, mouse_y, top_scores=None, is
 
     if is_new_high_score:
         current_y -= 40
-        draw_text_centered("NOVO RECORDE!", SCREEN_WIDTH / 2, current_y, font=GLUT_BITMAP_TIMES_ROMAN_24,
+        draw_text_centered("NOVO RECORDE!", SCREEN_WIDTH / 2, current_y, font=FONT_TIMES_ROMAN_24,
                            color=COLOR_NEW_HIGH_SCORE)
         current_y -= 30
         if not player_name:
@@ -314,17 +314,17 @@ def draw_high_scores_screen(high_scores, menu_state, mouse_x, mouse_y):
     draw_menu_background()
 
     title_y = SCREEN_HEIGHT - 150
-    draw_text_centered("HIGH SCORES", SCREEN_WIDTH / 2, title_y, font=GLUT_BITMAP_TIMES_ROMAN_24, color=COLOR_TITLE)
+    draw_text_centered("HIGH SCORES", SCREEN_WIDTH / 2, title_y, font=FONT_TIMES_ROMAN_24, color=COLOR_TITLE)
 
     # Exibe os high scores
     for i, score in enumerate(high_scores):
         score_y = title_y - 50 - i * 30
-        draw_text_centered(f"{i + 1}. {score}", SCREEN_WIDTH / 2, score_y, font=GLUT_BITMAP_HELVETICA_18, color=COLOR_HIGH_SCORE)
+        draw_text_centered(f"{i + 1}. {score}", SCREEN_WIDTH / 2, score_y, font=FONT_HELVETICA_18, color=COLOR_HIGH_SCORE)
 
     # Destaque para nova pontuação mais alta
     if len(high_scores) > 0 and high_scores[-1] == max(high_scores):
         new_high_score_y = title_y - 50 - len(high_scores) * 30
-        draw_text_centered("Novo Recorde!", SCREEN_WIDTH / 2, new_high_score_y, font=GLUT_BITMAP_HELVETICA_18, color=COLOR_NEW_HIGH_SCORE)
+        draw_text_centered("Novo Recorde!", SCREEN_WIDTH / 2, new_high_score_y, font=FONT_HELVETICA_18, color=COLOR_NEW_HIGH_SCORE)
 
     # Botão de Voltar
     button_width = 200
@@ -347,7 +347,7 @@ def draw_name_input_screen(menu_state, mouse_x, mouse_y, input_text=""):
     draw_menu_background()
 
     title_y = SCREEN_HEIGHT - 150
-    draw_text_centered("SEU NOME", SCREEN_WIDTH / 2, title_y, font=GLUT_BITMAP_TIMES_ROMAN_24, color=COLOR_TITLE)
+    draw_text_centered("SEU NOME", SCREEN_WIDTH / 2, title_y, font=FONT_TIMES_ROMAN_24, color=COLOR_TITLE)
 
     # Caixa de entrada de texto
     input_box_x = (SCREEN_WIDTH - 400) / 2
@@ -355,7 +355,7 @@ def draw_name_input_screen(menu_state, mouse_x, mouse_y, input_text=""):
     draw_rect(input_box_x, input_box_y, 400, 50, COLOR_INPUT_BOX)
 
     # Texto do input
-    draw_text_centered(input_text, SCREEN_WIDTH / 2, input_box_y + 10, font=GLUT_BITMAP_HELVETICA_18, color=COLOR_INPUT_TEXT)
+    draw_text_centered(input_text, SCREEN_WIDTH / 2, input_box_y + 10, font=FONT_HELVETICA_18, color=COLOR_INPUT_TEXT)
 
     # Botões
     button_width = 200
@@ -405,7 +405,7 @@ def draw_pause_menu(menu_state, mouse_x, mouse_y):
 
     # --- Título ---
     title_y = SCREEN_HEIGHT - 200
-    draw_text_centered("PAUSADO", SCREEN_WIDTH / 2, title_y, font=GLUT_BITMAP_TIMES_ROMAN_24, color=COLOR_TITLE)
+    draw_text_centered("PAUSADO", SCREEN_WIDTH / 2, title_y, font=FONT_TIMES_ROMAN_24, color=COLOR_TITLE)
 
     # --- Botões ---
     button_width = 250
@@ -4,7 +4,7 @@ import time
 class ScoreIndicator:
     """Classe para mostrar feedback visual quando pontos são ganhos."""
     
-    def __init__(self, x, y, points, duration=2.0):
+    def __init__(self, x, y, points, duration=2.0, clock=time.time):
         """
         Inicializa um indicador de pontos.
         
@@ -12,11 +12,13 @@ class ScoreIndicator:
             x, y: Posição onde o indicador aparece
             points: Quantidade de pontos ganhos
             duration: Duração em segundos que o indicador fica visível
+            clock: Função que retorna o tempo atual em segundos
         """
+        self.clock = clock
         self.x = x
         self.y = y
         self.points = points
-        self.start_time = time.time()
+        self.start_time = self.clock()
         self.duration = duration
         self.active = True
         
@@ -24,12 +26,16 @@ class ScoreIndicator:
         self.velocity_y = -50  # Move para cima
         self.original_y = y
         
+    def reinit(self, *args, **kwargs):
+        """Reaproveita um indicador devolvido ao pool (ver ObjectPool) com os argumentos do construtor."""
+        self.__init__(*args, **kwargs)
+
     def update(self):
         """Atualiza o indicador de pontos."""
         if not self.active:
             return
             
-        current_time = time.time()
+        current_time = self.clock()
         elapsed_time = current_time - self.start_time
         
         if elapsed_time >= self.duration:
@@ -45,7 +51,7 @@ class ScoreIndicator:
             return
             
         # Calcula a transparência baseada no tempo restante
-        current_time = time.time()
+        current_time = self.clock()
         elapsed_time = current_time - self.start_time
         progress = elapsed_time / self.duration
         alpha = 1.0 - progress  # Desaparece gradualmente
@@ -90,6 +90,10 @@ def draw_collision_area(center_x, center_y, max_x_distance, max_y_distance, colo
     # Restaura estado
     glPopAttrib()
 
+def draw_collision_hitbox(hitbox, color=(0.0, 1.0, 1.0, 1.0), line_width=4):
+    """Desenha a hitbox cacheada de uma entidade (ver src/game/entities/hitbox.py), a mesma usada na colisão."""
+    draw_real_hitbox(hitbox.x, hitbox.y, hitbox.width, hitbox.height, color=color, line_width=line_width)
+
 def draw_real_hitbox(x, y, width, height, color=(0.0, 1.0, 1.0, 1.0), line_width=4):
     """
     Desenha a hitbox REAL que é usada para colisão (ciano brilhante para destacar).
@@ -0,0 +1,34 @@
+class FixedTimestep:
+    """
+    Acumulador para rodar a simulação em passos de tamanho fixo, independente do FPS.
+    A cada frame recebe o tempo real decorrido e informa quantos passos (ticks) devem ser simulados;
+    a sobra fica acumulada para o próximo frame.
+    """
+
+    def __init__(self, hz, max_ticks_per_frame=8):
+        self.hz = hz
+        self.dt = 1.0 / hz
+        # Limite de ticks por frame: evita a "espiral da morte" quando um frame demora muito
+        # (ex: janela arrastada ou carregamento); o tempo excedente é descartado.
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.accumulator = 0.0
+
+    def advance(self, frame_time):
+        """Soma o tempo do frame e retorna quantos ticks devem ser executados."""
+        self.accumulator += max(0.0, frame_time)
+        ticks = int(self.accumulator / self.dt)
+        if ticks > self.max_ticks_per_frame:
+            ticks = self.max_ticks_per_frame
+            self.accumulator = self.accumulator % self.dt
+        else:
+            self.accumulator -= ticks * self.dt
+        return ticks
+
+    @property
+    def alpha(self):
+        """Fração do próximo tick já decorrida (0 a 1), usada para interpolar o desenho."""
+        return self.accumulator / self.dt
+
+    def reset(self):
+        """Descarta o tempo acumulado (ex: ao pausar ou voltar ao menu)."""
+        self.accumulator = 0.0
@@ -0,0 +1,143 @@
+import math
+
+import numpy as np
+
+# Deslocamento das coordenadas de célula para que as negativas (objetos abaixo da tela) virem chaves positivas
+_CELL_OFFSET = 1 << 20
+_ROW_STRIDE = 1 << 21
+
+
+class SpatialHash:
+    """
+    Grade uniforme de células cell_size x cell_size para achar retângulos próximos sem testar
+    todos contra todos. Cada entrada é guardada na célula do seu canto inferior esquerdo; as
+    consultas alargam a busca pelo maior retângulo guardado, então o custo depende de quantos
+    objetos há perto da região consultada e não do total.
+
+    As entradas são ids inteiros (ex: slots do EntityStore) com x, y, largura e altura em arrays.
+    Internamente as chaves de célula ficam ordenadas, e cada coluna de células é uma faixa
+    contígua encontrada com busca binária. Com até brute_force_limit entradas a grade nem é
+    montada: testar todas de uma vez com NumPy sai mais barato que procurar as células.
+    """
+
+    def __init__(self, cell_size=100.0, brute_force_limit=32):
+        self.cell_size = float(cell_size)
+        self.brute_force_limit = brute_force_limit
+        self.ids = np.empty(0, dtype=np.intp)
+        self._keys = np.empty(0, dtype=np.int64)
+        self._order = np.empty(0, dtype=np.intp)
+        self._sorted_keys = np.empty(0, dtype=np.int64)
+        self._max_width = 0.0
+        self._max_height = 0.0
+        self.rebuilds = 0
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _cell(self, value):
+        return math.floor(value / self.cell_size) + _CELL_OFFSET
+
+    def rebuild(self, ids, x, y, width, height):
+        """
+        Atualiza a grade com as posições atuais. Só reordena as chaves se algum objeto mudou de
+        célula (ou se o conjunto de ids mudou); na maioria dos ticks os objetos andam poucos pixels
+        e a ordem anterior continua válida.
+        """
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+        if len(ids) <= self.brute_force_limit:
+            self.ids = ids
+            self._keys = self._keys[:0]
+            self._order = np.arange(len(ids))
+            return
+
+        cell_size = self.cell_size
+        keys = ((np.floor(x / cell_size).astype(np.int64) + _CELL_OFFSET) * _ROW_STRIDE +
+                np.floor(y / cell_size).astype(np.int64) + _CELL_OFFSET)
+        self._max_width = float(width.max())
+        self._max_height = float(height.max())
+
+        if len(keys) == len(self._keys) and (keys == self._keys).all() and (ids == self.ids).all():
+            return
+        self.ids = ids
+        self._keys = keys
+        self._order = np.argsort(keys, kind="stable")
+        self._sorted_keys = keys[self._order]
+        self.rebuilds += 1
+
+    def _candidates(self, x0, x1, y0, y1):
+        """Índices (nos arrays da grade) das entradas cujo canto está nas células que cobrem a região."""
+        if len(self.ids) <= self.brute_force_limit:
+            return self._order
+        first_column = self._cell(x0 - self._max_width)
+        last_column = self._cell(x1)
+        first_row = self._cell(y0 - self._max_height)
+        last_row = self._cell(y1) if y1 != np.inf else _ROW_STRIDE - 1
+
+        columns = np.arange(first_column, last_column + 1, dtype=np.int64) * _ROW_STRIDE
+        starts = np.searchsorted(self._sorted_keys, columns + first_row, side="left")
+        ends = np.searchsorted(self._sorted_keys, columns + last_row, side="right")
+        if len(columns) == 1:
+            return self._order[starts[0]:ends[0]]
+        return np.concatenate([self._order[start:end] for start, end in zip(starts, ends)])
+
+    def query(self, x, y, width, height):
+        """Ids (em ordem crescente) das entradas que se sobrepõem ao retângulo dado."""
+        found = self._candidates(x, x + width, y, y + height)
+        ex = self.x[found]
+        ey = self.y[found]
+        hit = (ex < x + width) & (ex + self.width[found] > x) & (ey < y + height) & (ey + self.height[found] > y)
+        return np.sort(self.ids[found[hit]])
+
+    def overlapping_pairs(self):
+        """
+        Todos os pares de entradas que se sobrepõem, como dois arrays de ids (a, b) com a < b.
+        Cada entrada só é comparada com as das células vizinhas (o alcance em células vem do
+        maior retângulo guardado), tudo em operações vetorizadas.
+        """
+        n = len(self.ids)
+        x, y, width, height = self.x, self.y, self.width, self.height
+        if n <= self.brute_force_limit:
+            overlap = ((x[:, None] < x[None, :] + width[None, :]) & (x[:, None] + width[:, None] > x[None, :]) &
+                       (y[:, None] < y[None, :] + height[None, :]) & (y[:, None] + height[:, None] > y[None, :]))
+            first, second = np.nonzero(np.triu(overlap, 1))
+            return self.ids[first], self.ids[second]
+
+        reach_x = math.ceil(self._max_width / self.cell_size)
+        reach_y = math.ceil(self._max_height / self.cell_size)
+        sorted_keys = self._sorted_keys
+        firsts = []
+        seconds = []
+        # Só metade da vizinhança (células à direita, e acima na mesma coluna): cada par aparece uma vez
+        for dx in range(0, reach_x + 1):
+            for dy in range(-reach_y if dx else 0, reach_y + 1):
+                target = sorted_keys + (dx * _ROW_STRIDE + dy)
+                starts = np.searchsorted(sorted_keys, target, side="left")
+                counts = np.searchsorted(sorted_keys, target, side="right") - starts
+                total = int(counts.sum())
+                if not total:
+                    continue
+                source = np.repeat(np.arange(n), counts)
+                # Posição de cada candidato: início da sua faixa + deslocamento dentro dela
+                offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+                other = starts[source] + offsets
+                if dx == 0 and dy == 0:
+                    keep = source < other
+                    source = source[keep]
+                    other = other[keep]
+                firsts.append(self._order[source])
+                seconds.append(self._order[other])
+
+        if not firsts:
+            empty = self.ids[:0]
+            return empty, empty
+        first = np.concatenate(firsts)
+        second = np.concatenate(seconds)
+        hit = ((x[first] < x[second] + width[second]) & (x[first] + width[first] > x[second]) &
+               (y[first] < y[second] + height[second]) & (y[first] + height[first] > y[second]))
+        first = self.ids[first[hit]]
+        second = self.ids[second[hit]]
+        return np.minimum(first, second), np.maximum(first, second)